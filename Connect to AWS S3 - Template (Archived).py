@@ -9,7 +9,7 @@
 
         Step 3: Connect to the AWS S3 Bucket
 
-        Step 4: Extract and Load the data from the file within the AWS S3 Bucket
+        Step 4: Extract and Load the data from the file(s) within the AWS S3 Bucket
 
         Step 5: Select the Columns to Keep from the df Pandas DataFrame and load the data into the df_subset Pandas DataFrame
 
@@ -36,12 +36,19 @@
 ##############################################################################################################
 
 
+# Used to extract every file within the AWS S3 Bucket folder at the same time, using a pool of threads
+    # as_completed returns each file as soon as it has been extracted, rather than in the order the files were submitted
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 # Used when working with and manipulating dates and times
 from datetime import datetime, timedelta
 
 # Enables the ability to connect to multiple AWS services, such as S3 Bucket
 import boto3
 
+# Used to set the number of open connections to the AWS S3 Bucket, so that each thread has its own connection
+from botocore.config import Config
+
 # Enables the ability to utilize DataFrames, which are 2 dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
     # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
         # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
@@ -102,8 +109,22 @@ s3_file_month = (today - timedelta(days = 3)).strftime("%d")
 # The day part of the file name within the AWS S3 Bucket
 s3_file_day = (today - timedelta(days = 3)).strftime("%m")
 
+# The folder within the AWS S3 Bucket that contains the file(s) that you would like to extract
+s3_folder_name = "<Folder_Name>"
+
 # The file within the AWS S3 Bucket that you would like to extract
-s3_file_name = f"<Folder_Name>/{file_name}.{s3_file_extension}"
+s3_file_name = f"{s3_folder_name}/{file_name}.{s3_file_extension}"
+
+# Extract every file within the s3_folder_name folder whose name begins with file_name and ends with s3_file_extension, rather than only the s3_file_name file
+    # Set to True to extract every matching file within the folder, and load each file into the Snowflake data warehouse as soon as it has been extracted
+        # Used for data sources that split each day of data into many files (shards) within a single folder
+            # Set file_name to "" to extract every file within the folder that ends with s3_file_extension
+s3_load_folder = False
+
+# The number of files within the s3_folder_name folder that are extracted from the AWS S3 Bucket at the same time
+    # Each file is extracted and loaded into a Pandas DataFrame by its own thread
+        # Set to 1 to extract the files one at a time
+s3_max_workers = 16
 
 
 ##############################################################################################################
@@ -119,8 +140,14 @@ s3 = boto3.resource(
     ,region_name = aws_region_name
     ,aws_access_key_id = s3_access_id
     ,aws_secret_access_key = s3_secret_access_key
+    # Keep 1 open connection per thread, rather than the default of 10 open connections
+    ,config = Config(max_pool_connections = s3_max_workers)
 )
 
+# The AWS S3 client that sits underneath the AWS S3 resource
+    # The AWS S3 client can be shared between threads, while the AWS S3 resource can not
+s3_client = s3.meta.client
+
 """
 # Display all of the files within the AWS S3 Bucket
     # Comment Out once the files have been verified
@@ -135,27 +162,142 @@ for s3_bucket_file in s3.Bucket(s3_bucket).objects.all():
 
 
 ##############################################################################################################
-# Step 4: Extract and Load the data from the file within the AWS S3 Bucket
+# Step 4: Extract and Load the data from the file(s) within the AWS S3 Bucket
 ##############################################################################################################
 
 
-# Extract the data from the file within the AWS S3 Bucket
-s3_file = s3.Bucket(s3_bucket).Object(s3_file_name).get()
+# Extract and load the data from a single file within the AWS S3 Bucket into a Pandas DataFrame
+    # Each thread within the pool of threads below runs this function for 1 file at a time
+def extract_s3_file(s3_file_name):
 
-# Load the data from s3_file into the df Pandas DataFrame
-df = pd.read_csv(s3_file['Body'], index_col = 0)
+    return pd.read_csv(s3_client.get_object(Bucket = s3_bucket, Key = s3_file_name)['Body'], index_col = 0)
 
-# Verify if there is any data within the df Pandas DataFrame
-    # Comment out once the data has been verified
-if not df.empty:
 
-    print("The df Pandas DataFrame contains data:")
-    print()
-    print(df)
+# Extract every file within the s3_folder_name folder, if s3_load_folder IS set to True
+if s3_load_folder:
+
+    # The name and size of each file within the s3_folder_name folder that you would like to extract
+    s3_folder_files = {}
+
+    # Loop through each page of up to 1000 files within the s3_folder_name folder
+    for s3_list_page in s3_client.get_paginator("list_objects_v2").paginate(Bucket = s3_bucket, Prefix = f"{s3_folder_name}/"):
+
+        for s3_bucket_file in s3_list_page.get("Contents", []):
+
+            # Keep only the files that begin with file_name and end with s3_file_extension
+            s3_folder_file_name = s3_bucket_file["Key"][len(s3_folder_name) + 1:]
+
+            if s3_folder_file_name.startswith(file_name) and s3_folder_file_name.endswith(f".{s3_file_extension}"):
+
+                s3_folder_files[s3_bucket_file["Key"]] = s3_bucket_file["Size"]
+
+    # The files within the s3_folder_name folder that failed to be extracted, along with the error
+    s3_failed_files = {}
+
+    # The number of rows loaded into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table from the files within the s3_folder_name folder
+    s3_folder_rows = 0
+
+    # The first file to be loaded overwrites the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, and every file after it is appended to the table
+    s3_transient_overwrite = True
+
+    # The connection to the Snowflake data warehouse closes automatically after the with block is exited
+        # Therefore, no need for the dw_conn.close() command
+    with snowflake.connector.connect(
+        # The username should be tied to a service account, rather than and specific individual
+        user = "<Snowflake_User_Name>"
+        # The password should be tied to a service account, rather than and specific individual
+        ,password = "<Snowflake_User_Password>"
+        # The account consists of 3 parts separated by a decimal (".")
+            # Part 1: Snowflake account identifier
+            # Part 2: Snowflake cloud region
+            # Part 3: Snowflake cloud provider
+        ,account = "<Snowflake_Account_Identifier>.<Snowflake_Cloud_Region>.<Snowflake_Cloud_Provider>"
+        # The Snowflake warehouse that will be used to write the data into Snowflake
+        ,warehouse = "<Snowflake_Warehouse_Name>"
+        # The Snowflake database where the data will be written into
+        ,database = "DB_KKF_MAIN"
+    ) as dw_conn:
+
+        # Extract the files at the same time, using a pool of threads
+            # The pool of threads closes automatically after the with block is exited, once every file has been extracted
+        with ThreadPoolExecutor(max_workers = s3_max_workers) as s3_executor:
+
+            # Submit 1 task per file to the pool of threads, from the largest file to the smallest file
+                # The largest files take the longest to extract, so starting them first prevents a large file from being the last file still being extracted after the other threads have finished
+            s3_file_futures = {
+                s3_executor.submit(extract_s3_file, s3_file_name): s3_file_name
+                for s3_file_name in sorted(s3_folder_files, key = s3_folder_files.get, reverse = True)
+            }
+
+            # Load each Pandas DataFrame into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table as soon as its file has been extracted, and display the number of rows within the file
+                # Only the files still being extracted are held in memory, rather than every file within the folder
+                    # A file that fails to be extracted is added to s3_failed_files, so that the rest of the files are still extracted
+            for s3_file_future in as_completed(s3_file_futures):
 
+                s3_file_name = s3_file_futures[s3_file_future]
+
+                try:
+
+                    df_file = s3_file_future.result()
+
+                except Exception as s3_file_error:
+
+                    s3_failed_files[s3_file_name] = s3_file_error
+
+                    continue
+
+                write_pandas(
+                    conn = dw_conn
+                    ,df = df_file
+                    ,table_name = "<TRANSIENT_TABLE_NAME>"
+                    ,schema = "TRANSIENT"
+                    # When set to False, no new table is created in Snowflake from the df_file Pandas DataFrame
+                    ,auto_create_table = False
+                    # When set to False, no quotes are added to each column value
+                    ,quote_identifiers = False
+                    # Set to True for the first file only, which replaces the data already within the Snowflake table
+                        # Every file after the first file is appended to the end of the Snowflake table
+                    ,overwrite = s3_transient_overwrite
+                )
+
+                s3_transient_overwrite = False
+
+                s3_folder_rows += len(df_file)
+
+                print(f"{s3_file_name}: {len(df_file)} rows")
+
+    # Display every file that failed to be extracted, then stop the data pipeline before Step 6 loads the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table into the PERSISTED table
+        # This way a folder is never loaded past the TRANSIENT table with some of its files missing
+    if s3_failed_files:
+
+        for s3_file_name, s3_file_error in s3_failed_files.items():
+
+            print(f"Failed to extract the {s3_file_name} file: {s3_file_error}")
+
+        raise RuntimeError(f"{len(s3_failed_files)} of the {len(s3_folder_files)} file(s) within the {s3_folder_name} folder failed to be extracted")
+
+    print(f"Loaded {s3_folder_rows} rows from {len(s3_folder_files)} file(s) within the {s3_folder_name} folder into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table")
+
+# Extract only the s3_file_name file, if s3_load_folder is set to False
 else:
 
-    print("The df Pandas DataFrame is empty")
+    # Extract the data from the file within the AWS S3 Bucket
+    s3_file = s3.Bucket(s3_bucket).Object(s3_file_name).get()
+
+    # Load the data from s3_file into the df Pandas DataFrame
+    df = pd.read_csv(s3_file['Body'], index_col = 0)
+
+    # Verify if there is any data within the df Pandas DataFrame
+        # Comment out once the data has been verified
+    if not df.empty:
+
+        print("The df Pandas DataFrame contains data:")
+        print()
+        print(df)
+
+    else:
+
+        print("The df Pandas DataFrame is empty")
 
 
 ##############################################################################################################
@@ -228,6 +370,7 @@ with snowflake.connector.connect(
 
     ####################################################################################################
     # Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse table
+        # Skip this step if s3_load_folder is set to True, as every file was already loaded into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table in Step 4
     ####################################################################################################
 
     """
@@ -0,0 +1,574 @@
+"""
+    The "<DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook" pulls KKC operator review data from <DATA_SOURCE_NAME> and loads it into Snowflake, where it is then cleaned up to make it ready for reporting purposes.
+
+    Rather than listing the AWS S3 Bucket on a schedule, the AWS S3 Bucket sends an ObjectCreated notification to an AWS SQS queue each time a file is added to the AWS S3 Bucket.
+    The data pipeline waits on the AWS SQS queue and loads each new file within minutes of it arriving, collecting small files into micro-batches.
+
+    Data Pipeline Process:
+
+        Step 1: Install Required Python Packages
+
+        Step 2: Install Required Python Libraries
+
+        Step 3: Setup the credentials to connect to the AWS S3 Bucket and the AWS SQS queue
+
+        Step 4: Connect to the AWS S3 Bucket and the AWS SQS queue
+
+        Step 5: Collect the files within the AWS S3 Bucket from the ObjectCreated notifications within the AWS SQS queue
+
+        Step 6: Extract the data from the files within the AWS S3 Bucket
+
+        Step 7: Load each micro-batch of files into the Snowflake data warehouse
+            1. Setup the credentials to connect to the Snowflake data warehouse
+            2. Connect to the Snowflake data warehouse
+            3. Collect a micro-batch of files from the AWS SQS queue
+            4. Extract the data from the micro-batch of files into the df Pandas DataFrame
+            5. Load the data from the df Pandas DataFrame into the Snowflake data warehouse table
+            6. Delete the ObjectCreated notifications of the micro-batch from the AWS SQS queue
+"""
+
+
+##############################################################################################################
+# Step 1: Install Required Python Packages
+    # Install all of the require Python packages in order to perform the necessary actions within the Python notebook
+        # This section is only used for tools that require you to install all of the necessary packages before each time the code is executed, such as Databricks
+##############################################################################################################
+
+
+# Install the boto3 Python package
+    # Used to connect to AWS services, like S3 Bucket and SQS
+%pip install boto3
+
+# Install the pandas Python package
+    # Used to store data in Series and DataFrames
+%pip install pandas
+
+# Install the zstandard Python package
+    # Used to decompress zstd compressed files within the AWS S3 Bucket
+%pip install zstandard
+
+# Install the snowflake-connector-python[pandas] Python package
+    # Used to connect to Snowflake and utilize Pandas DataFrames
+%pip install snowflake-connector-python[pandas]
+
+# Restart the kernel to use updated packages
+    # Databricks specific command that is required to use any newly install Python packages listed above
+%restart_python
+
+
+##############################################################################################################
+# Step 2: Install Required Python Libraries
+    # Install all of the require Python libraries in order to perform the necessary actions within the Python notebook
+##############################################################################################################
+
+
+# Used to extract each file within a micro-batch at the same time, using a pool of threads
+from concurrent.futures import ThreadPoolExecutor
+
+# Used to read the ObjectCreated notifications within the AWS SQS queue, which are JSON documents
+import json
+
+# Used to measure how long the current micro-batch has been collecting files
+import time
+
+# Used to decode the file names within the ObjectCreated notifications, which are URL encoded
+from urllib.parse import unquote_plus
+
+# Enables the ability to connect to multiple AWS services, such as S3 Bucket and SQS
+import boto3
+
+# Enables the ability to utilize DataFrames, which are 2 dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+import pandas as pd
+
+# Enables the ability to connect to the Snowflake Data Warehouse
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+import snowflake.connector
+
+# Enables the ability to write data into Snowflake from Pandas DataFrames
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+from snowflake.connector.pandas_tools import write_pandas
+
+
+##############################################################################################################
+# Step 3: Setup the credentials to connect to the AWS S3 Bucket and the AWS SQS queue
+##############################################################################################################
+
+
+# The access ID assigned to the account connecting to the AWS service
+s3_access_id = "<AWS_S3_Access_ID>"
+
+# The access key assigned to the account connecting to the AWS service
+s3_secret_access_key = "<AWS_S3_Access_Key>"
+
+# The AWS region that the AWS S3 Bucket and the AWS SQS queue are set to
+aws_region_name = "<AWS_Region>"
+
+# The AWS S3 Bucket that you would like to connect to
+s3_bucket = "<AWS_S3_Bucket>"
+
+# The folder within the AWS S3 Bucket that contains the files that you would like to extract
+    # ObjectCreated notifications for files outside of this folder are ignored
+s3_folder_name = "<Folder_Name>"
+
+# The extension of the files within the AWS S3 Bucket
+    # ObjectCreated notifications for files with a different extension are ignored
+s3_file_extension = "<File_Extension>"
+
+# The URL of the AWS SQS queue that receives the ObjectCreated notifications from the AWS S3 Bucket
+    # The AWS S3 Bucket must be setup to send its ObjectCreated notifications to this AWS SQS queue, see the setup below Step 4
+        # The AWS SQS queue should have a redrive policy with a dead-letter queue, so that a file that fails to load repeatedly is set aside rather than retried forever
+sqs_queue_url = "https://sqs.<AWS_Region>.amazonaws.com/<AWS_Account_ID>/<AWS_SQS_Queue_Name>"
+
+# The number of seconds that each receive request waits for a notification to arrive within the AWS SQS queue (long polling)
+    # Long polling returns as soon as a notification arrives, rather than repeatedly requesting an empty AWS SQS queue
+        # 20 seconds is the longest wait that AWS SQS allows
+sqs_wait_time_seconds = 20
+
+# The number of seconds that a received notification is hidden from other receive requests
+    # If the micro-batch has not been loaded and the notification has not been deleted by then, the notification becomes visible again and is retried
+        # Set to longer than the time it takes to extract and load the largest micro-batch
+sqs_visibility_timeout = 900
+
+# The number of receive requests in a row that can return no notifications before the data pipeline stops
+    # Allows the data pipeline to be executed as a scheduled job that stops once the AWS SQS queue is empty
+        # Set to None to keep waiting for notifications until the data pipeline is stopped manually
+sqs_max_empty_receives = 3
+
+# The most files that are collected into a single micro-batch
+    # Loading many small files with a single write_pandas call is much faster than a write_pandas call per file
+s3_batch_max_files = 100
+
+# The most bytes of files that are collected into a single micro-batch, before the micro-batch is loaded
+s3_batch_max_bytes = 256 * 1024 * 1024
+
+# The most seconds that a micro-batch collects files for, before the micro-batch is loaded
+    # This is the longest that a file waits within the AWS SQS queue before it is loaded into the Snowflake data warehouse, while files continue to arrive
+s3_batch_max_wait_seconds = 60
+
+# The number of files within a micro-batch that are extracted from the AWS S3 Bucket at the same time
+s3_max_workers = 16
+
+# The column of the Snowflake table that stores the name of the file within the AWS S3 Bucket that each row was extracted from
+    # The Snowflake table must contain this column
+        # The rows of a file are deleted before the file is loaded, so a notification that is delivered more than once, or a file that is replaced, does not duplicate its rows
+s3_file_name_column = "S3_FILE_NAME"
+
+# The options used to read each file within the AWS S3 Bucket into a Pandas DataFrame
+    # Update to match the columns of the files, such as {"usecols": ['<Column_1>', '<Column_2>'], "dtype": "string"}
+s3_read_csv_options = {"index_col": 0}
+
+# The compression codec for each compressed file extension within the AWS S3 Bucket
+    # Compressed files are decompressed as they are read, so the file is never fully decompressed in memory or on disk
+s3_compression_extensions = {
+    ".gz": "gzip"
+    ,".gzip": "gzip"
+    ,".bz2": "bz2"
+    ,".zst": "zstd"
+    ,".zstd": "zstd"
+}
+
+
+##############################################################################################################
+# Step 4: Connect to the AWS S3 Bucket and the AWS SQS queue
+##############################################################################################################
+
+
+# Connect to the AWS S3 Bucket
+    # The connection to the AWS S3 Bucket closes automatically and does not use the close() command
+s3_client = boto3.client(
+    service_name = "s3"
+    ,region_name = aws_region_name
+    ,aws_access_key_id = s3_access_id
+    ,aws_secret_access_key = s3_secret_access_key
+)
+
+# Connect to the AWS SQS queue
+    # The connection to the AWS SQS queue closes automatically and does not use the close() command
+sqs_client = boto3.client(
+    service_name = "sqs"
+    ,region_name = aws_region_name
+    ,aws_access_key_id = s3_access_id
+    ,aws_secret_access_key = s3_secret_access_key
+)
+
+"""
+# Setup the AWS S3 Bucket to send an ObjectCreated notification to the AWS SQS queue each time a file is added to the s3_folder_name folder
+    # Only needs to be executed once, by an account that is allowed to update the AWS S3 Bucket
+        # The AWS SQS queue policy must allow the AWS S3 Bucket to send messages (sqs:SendMessage) to the AWS SQS queue
+            # Comment out once the AWS S3 Bucket notifications have been setup
+s3_client.put_bucket_notification_configuration(
+    Bucket = s3_bucket
+    ,NotificationConfiguration = {
+        "QueueConfigurations": [
+            {
+                "QueueArn": sqs_client.get_queue_attributes(QueueUrl = sqs_queue_url, AttributeNames = ["QueueArn"])["Attributes"]["QueueArn"]
+                ,"Events": ["s3:ObjectCreated:*"]
+                ,"Filter": {"Key": {"FilterRules": [{"Name": "prefix", "Value": f"{s3_folder_name}/"}, {"Name": "suffix", "Value": f".{s3_file_extension}"}]}}
+            }
+        ]
+    }
+)
+"""
+
+
+##############################################################################################################
+# Step 5: Collect the files within the AWS S3 Bucket from the ObjectCreated notifications within the AWS SQS queue
+##############################################################################################################
+
+
+# Collect the files within the AWS S3 Bucket from the ObjectCreated notifications returned by a single receive request
+    # Returns the receipt handle of each notification, which is used to delete the notification once its files have been loaded,
+    # along with the name and size of each file within the notification
+        # Notifications without any files that you would like to extract, such as the s3:TestEvent sent when the notifications are setup, return no files
+            # These notifications are still deleted along with the rest of the micro-batch
+                # A notification is only deleted if none of its files failed to be extracted
+def receive_s3_files():
+
+    sqs_response = sqs_client.receive_message(
+        QueueUrl = sqs_queue_url
+        # AWS SQS returns at most 10 notifications per receive request
+        ,MaxNumberOfMessages = 10
+        ,WaitTimeSeconds = sqs_wait_time_seconds
+        ,VisibilityTimeout = sqs_visibility_timeout
+    )
+
+    sqs_notifications = []
+
+    for sqs_message in sqs_response.get("Messages", []):
+
+        s3_notification_files = []
+
+        for s3_event in json.loads(sqs_message["Body"]).get("Records", []):
+
+            # The file names within the ObjectCreated notifications are URL encoded, such as a space being encoded as a +
+            s3_file_name = unquote_plus(s3_event["s3"]["object"]["key"])
+
+            # Keep only the ObjectCreated notifications for the files that you would like to extract
+            if (
+                s3_event.get("eventName", "").startswith("ObjectCreated:")
+                and s3_event["s3"]["bucket"]["name"] == s3_bucket
+                and s3_file_name.startswith(f"{s3_folder_name}/")
+                and s3_file_name.endswith(f".{s3_file_extension}")
+            ):
+
+                s3_notification_files.append({"name": s3_file_name, "size": s3_event["s3"]["object"].get("size", 0)})
+
+        sqs_notifications.append({"receipt_handle": sqs_message["ReceiptHandle"], "files": s3_notification_files})
+
+    return sqs_notifications
+
+
+# Delete the notifications of a micro-batch from the AWS SQS queue, once its files have been loaded into the Snowflake data warehouse
+    # AWS SQS deletes at most 10 notifications per delete request
+        # A notification that is not deleted becomes visible again after sqs_visibility_timeout and its files are loaded again
+def delete_sqs_notifications(sqs_receipt_handles):
+
+    for i in range(0, len(sqs_receipt_handles), 10):
+
+        sqs_response = sqs_client.delete_message_batch(
+            QueueUrl = sqs_queue_url
+            ,Entries = [{"Id": str(j), "ReceiptHandle": sqs_receipt_handle} for j, sqs_receipt_handle in enumerate(sqs_receipt_handles[i:i + 10])]
+        )
+
+        # Display the notifications that failed to be deleted, as their files will be loaded again
+            # Loading a file again replaces its rows, rather than duplicating them
+        for sqs_failed_delete in sqs_response.get("Failed", []):
+
+            print(f"Failed to delete a notification from the AWS SQS queue: {sqs_failed_delete['Message']}")
+
+
+##############################################################################################################
+# Step 6: Extract the data from the files within the AWS S3 Bucket
+##############################################################################################################
+
+
+# Extract the data from a single file within the AWS S3 Bucket into a Pandas DataFrame
+    # Each thread within the pool of threads in Step 7 runs this function for 1 file at a time
+        # The name of the file is added to every row, within the s3_file_name_column column
+            # Returns None if the file has been deleted from the AWS S3 Bucket since the notification was sent
+def extract_s3_file(s3_file_name):
+
+    # The compression codec of the file within the AWS S3 Bucket, identified by the file extension
+    s3_file_compression = next((s3_compression_codec for s3_compression_extension, s3_compression_codec in s3_compression_extensions.items() if s3_file_name.lower().endswith(s3_compression_extension)), None)
+
+    try:
+
+        s3_file_body = s3_client.get_object(Bucket = s3_bucket, Key = s3_file_name)['Body']
+
+    except s3_client.exceptions.NoSuchKey:
+
+        print(f"The {s3_file_name} file no longer exists within the AWS S3 Bucket and will be skipped")
+
+        return None
+
+    df_file = pd.read_csv(s3_file_body, compression = s3_file_compression, **s3_read_csv_options)
+
+    df_file[s3_file_name_column] = s3_file_name
+
+    return df_file
+
+
+# Delete the rows of the files within the micro-batch from the Snowflake table, before the files are loaded
+    # A file is loaded again when its notification is delivered more than once, or when its notification was not deleted after the file was loaded
+        # Deleting the rows of the file first means the file replaces its rows, rather than duplicating them
+def delete_s3_file_rows(cur, s3_file_names):
+
+    # The file names are passed as bind variables, as a file name can contain quotes
+    cur.execute(f"""
+        DELETE FROM <Snowflake_Schema_Name>.<Snowflake_Table_Name>
+        WHERE {s3_file_name_column} IN ({", ".join(["%s"] * len(s3_file_names))})
+        ;"""
+        ,s3_file_names
+    )
+
+
+####################################################################################################
+# Step 7: Load each micro-batch of files into the Snowflake data warehouse
+    # Setup the credentials to connect to the Snowflake data warehouse
+    # Connect to the Snowflake data warehouse
+    # Collect a micro-batch of files from the AWS SQS queue
+    # Extract the data from the micro-batch of files into the df Pandas DataFrame
+    # Load the data from the df Pandas DataFrame into the Snowflake data warehouse table
+    # Delete the ObjectCreated notifications of the loaded files from the AWS SQS queue
+####################################################################################################
+
+
+# The number of receive requests in a row that have returned no notifications
+sqs_empty_receives = 0
+
+# The connection to the Snowflake data warehouse and the pool of threads close automatically after the with block is exited
+    # The same connection to the Snowflake data warehouse is used for every micro-batch, rather than connecting once per file
+with snowflake.connector.connect(
+    # The username should be tied to a service account, rather than and specific individual
+    user = "<Snowflake_User_Name>"
+    # The password should be tied to a service account, rather than and specific individual
+    ,password = "<Snowflake_User_Password>"
+    # The account consists of 3 parts separated by a decimal (".")
+        # Part 1: Snowflake account identifier
+        # Part 2: Snowflake cloud region
+        # Part 3: Snowflake cloud provider
+    ,account = "<Snowflake_Account_Identifier>.<Snowflake_Cloud_Region>.<Snowflake_Cloud_Provider>"
+    # The Snowflake warehouse that will be used to write the data into Snowflake
+    ,warehouse = "<Snowflake_Warehouse_Name>"
+    # The Snowflake database where the data will be written into
+    ,database = "<Snowflake_Database_Name>"
+) as dw_conn, ThreadPoolExecutor(max_workers = s3_max_workers) as s3_executor:
+
+    # Keep collecting and loading micro-batches until the AWS SQS queue has been empty for sqs_max_empty_receives receive requests in a row
+    while sqs_max_empty_receives is None or sqs_empty_receives < sqs_max_empty_receives:
+
+
+        ####################################################################################################
+        # Collect a micro-batch of files from the AWS SQS queue
+            # The micro-batch is loaded once it reaches s3_batch_max_files files or s3_batch_max_bytes bytes,
+            # once it has been collecting files for s3_batch_max_wait_seconds seconds, or once the AWS SQS queue is empty
+        ####################################################################################################
+
+
+        # The receipt handle and files of each notification within the micro-batch
+        sqs_batch_notifications = []
+
+        # The name of each file within the micro-batch
+            # A dictionary is used so that a file with more than 1 notification, as AWS SQS can deliver a notification more than once, is only extracted once
+        s3_batch_files = {}
+
+        s3_batch_bytes = 0
+
+        s3_batch_start = time.monotonic()
+
+        while len(s3_batch_files) < s3_batch_max_files and s3_batch_bytes < s3_batch_max_bytes and time.monotonic() - s3_batch_start < s3_batch_max_wait_seconds:
+
+            sqs_notifications = receive_s3_files()
+
+            # Stop collecting the micro-batch once the AWS SQS queue is empty
+            if not sqs_notifications:
+
+                sqs_empty_receives += 1
+
+                break
+
+            sqs_empty_receives = 0
+
+            for sqs_notification in sqs_notifications:
+
+                sqs_batch_notifications.append(sqs_notification)
+
+                for s3_file in sqs_notification["files"]:
+
+                    if s3_file["name"] not in s3_batch_files:
+
+                        s3_batch_files[s3_file["name"]] = s3_file["size"]
+
+                        s3_batch_bytes += s3_file["size"]
+
+        # Skip to the next micro-batch if no notifications were received
+        if not sqs_batch_notifications:
+
+            continue
+
+
+        ####################################################################################################
+        # Extract the data from the micro-batch of files into the df Pandas DataFrame
+        ####################################################################################################
+
+
+        # Extract every file within the micro-batch at the same time, keeping the files in the order that their notifications were received
+        s3_batch_futures = {s3_file_name: s3_executor.submit(extract_s3_file, s3_file_name) for s3_file_name in s3_batch_files}
+
+        df_batch = []
+
+        # The files that were extracted, including the files that only contain a header
+            # Used to delete the rows already loaded from these files, so a file that is replaced by a file without any rows still has its old rows deleted
+        s3_extracted_files = []
+
+        # The files that failed to be extracted, along with the error
+            # A file that fails to be extracted does not stop the rest of the micro-batch from being loaded
+                # Its notification is not deleted, so the file is retried once the notification becomes visible again, or is moved to the dead-letter queue
+        s3_failed_files = {}
+
+        for s3_file_name, s3_batch_future in s3_batch_futures.items():
+
+            try:
+
+                df_file = s3_batch_future.result()
+
+            except Exception as s3_file_error:
+
+                print(f"Failed to extract the {s3_file_name} file and its notification will be retried: {s3_file_error}")
+
+                s3_failed_files[s3_file_name] = s3_file_error
+
+                continue
+
+            # Files that no longer exist within the AWS S3 Bucket are skipped
+            if df_file is not None:
+
+                s3_extracted_files.append(s3_file_name)
+
+                df_batch.append(df_file)
+
+
+        ####################################################################################################
+        # Load the data from the df Pandas DataFrame into the Snowflake data warehouse table
+            # The data is appended to the Snowflake table, once any rows already loaded from the same files have been deleted
+                # If loading the data fails after the rows have been deleted, the notifications are not deleted, so the files are loaded again
+        ####################################################################################################
+
+
+        # Skip the load if every file within the micro-batch failed to be extracted or no longer exists
+            # The DELETE statement is never run with an empty list of files
+        if s3_extracted_files:
+
+            with dw_conn.cursor() as cur:
+
+                delete_s3_file_rows(cur, s3_extracted_files)
+
+            df = pd.concat(df_batch)
+
+            # Only load the data if at least 1 of the files contains rows
+            if not df.empty:
+
+                write_pandas(
+                    conn = dw_conn
+                    ,df = df
+                    ,table_name = "<Snowflake_Table_Name>"
+                    ,schema = "<Snowflake_Schema_Name>"
+                    # When set to False, no new table is created in Snowflake from the df Pandas DataFrame
+                    ,auto_create_table = False
+                    # When set to False, no quotes are added to each column value
+                    ,quote_identifiers = False
+                    # When set to False, the data from the df Pandas DataFrame is appended to the end of the existing Snowflake table
+                    ,overwrite = False
+                )
+
+            print(f"Loaded {len(df)} rows from {len(df_batch)} file(s) within the AWS S3 Bucket")
+
+
+        ####################################################################################################
+        # Delete the ObjectCreated notifications of the loaded files from the AWS SQS queue
+            # The notifications are only deleted once the micro-batch has been loaded into the Snowflake data warehouse
+                # This way a failed micro-batch is retried once its notifications become visible again
+                    # The notifications of the files that failed to be extracted are left within the AWS SQS queue, so only those files are retried
+        ####################################################################################################
+
+
+        delete_sqs_notifications([
+            sqs_notification["receipt_handle"]
+            for sqs_notification in sqs_batch_notifications
+            if not any(s3_file["name"] in s3_failed_files for s3_file in sqs_notification["files"])
+        ])
+
+
+"""
+# Verify the ObjectCreated notifications, using a mocked AWS S3 Bucket and a mocked AWS SQS queue
+    # Requires the moto Python package, which can be installed using %pip install moto[s3,sqs]
+        # Run in place of Step 7, after executing Steps 1 through 6
+            # Comment out once the ObjectCreated notifications have been verified
+from moto import mock_aws
+
+with mock_aws():
+
+    s3_client = boto3.client("s3", region_name = "us-east-1")
+
+    sqs_client = boto3.client("sqs", region_name = "us-east-1")
+
+    s3_bucket = "s3-event-test"
+
+    s3_folder_name = "data"
+
+    s3_file_extension = "csv"
+
+    s3_read_csv_options = {}
+
+    s3_client.create_bucket(Bucket = s3_bucket)
+
+    sqs_queue_url = sqs_client.create_queue(QueueName = "s3-event-test")["QueueUrl"]
+
+    # Send an ObjectCreated notification to the mocked AWS SQS queue each time a file is added to the mocked AWS S3 Bucket
+    s3_client.put_bucket_notification_configuration(
+        Bucket = s3_bucket
+        ,NotificationConfiguration = {
+            "QueueConfigurations": [
+                {
+                    "QueueArn": sqs_client.get_queue_attributes(QueueUrl = sqs_queue_url, AttributeNames = ["QueueArn"])["Attributes"]["QueueArn"]
+                    ,"Events": ["s3:ObjectCreated:*"]
+                }
+            ]
+        }
+    )
+
+    # Add 2 files that should be extracted, 1 with a space within the file name, and 1 file that should be ignored
+    s3_client.put_object(Bucket = s3_bucket, Key = "data/file 1.csv", Body = b"A,B\n1,2\n")
+
+    s3_client.put_object(Bucket = s3_bucket, Key = "data/file_2.csv", Body = b"A,B\n3,4\n")
+
+    s3_client.put_object(Bucket = s3_bucket, Key = "other/file_3.csv", Body = b"A,B\n5,6\n")
+
+    sqs_wait_time_seconds = 1
+
+    sqs_notifications = receive_s3_files()
+
+    s3_test_files = [s3_file["name"] for sqs_notification in sqs_notifications for s3_file in sqs_notification["files"]]
+
+    print(s3_test_files)
+
+    print(pd.concat(map(extract_s3_file, s3_test_files)))
+
+    # Delete the notifications, then verify that the mocked AWS SQS queue is empty
+    delete_sqs_notifications([sqs_notification["receipt_handle"] for sqs_notification in sqs_notifications])
+
+    print(receive_s3_files())
+"""
+
+
+"""
+# Display a message that informs the developer that the Python data pipeline has completed
+    # Comment out once the entire data pipeline has completed successfully
+print()
+print("The <DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook has completed successfully")
+print()
+"""
\ No newline at end of file
@@ -11,7 +11,7 @@
 
         Step 4: Connect to the AWS S3 Bucket
 
-        Step 5: Collect a list of file names for all files within the AWS S3 Bucket
+        Step 5: Collect a list of file names for the files within the AWS S3 Bucket prefix
 
         Step 6: Extract and Load the data from the file within the AWS S3 Bucket
 
@@ -30,7 +30,12 @@
                 3. Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
                 4. Transform and load the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
                 5. Merge the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.GRUBHUB.FACT_ORDER table
-                6. Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+                6. Record the file within the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table
+                7. Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+
+        Step 9: Record the file within the local load manifest
+
+        Step 10: Move the file into the archive folder within the AWS S3 Bucket
 """
 
 
@@ -53,6 +58,10 @@
     # Used to store data in Series and DataFrames	
 %pip install pandas
 
+# Install the zstandard Python package
+    # Used to decompress zstd compressed files within the AWS S3 Bucket
+%pip install zstandard
+
 # Install the snowflake-connector-python[pandas] Python package
     # Used to connect to Snowflake and utilize Pandas DataFrames	
 %pip install snowflake-connector-python[pandas]
@@ -71,9 +80,37 @@
 # Used when working with and manipulating dates and times
 from datetime import datetime, timedelta
 
+# Used to read and write the AWS S3 Bucket key index file that is persisted between data pipeline executions
+import json
+
+# Used to verify if the AWS S3 Bucket key index file exists before reading it
+import os
+
+# Used to memory map large files within the AWS S3 Bucket once they have been downloaded, so that they can be read without copying them into memory
+import mmap
+
+# Used to hand each chunk of rows from the thread that reads the file within the AWS S3 Bucket to the Snowflake data warehouse load
+import queue
+
+# Used to read the file within the AWS S3 Bucket in the background, while the previous chunk of rows is being loaded into the Snowflake data warehouse
+import threading
+
+# Used to hold the columns returned by AWS S3 Select in memory, or on disk once they no longer fit in memory
+import tempfile
+
+# Used to close the file within the AWS S3 Bucket, along with its temporary file and memory map, once it has been read, even if reading it fails
+import contextlib
+
 # Enables the ability to connect to multiple AWS services, such as S3 Bucket
 import boto3
 
+# Used to set the part size and number of threads used to download large files within the AWS S3 Bucket in parallel byte ranges
+from boto3.s3.transfer import TransferConfig
+
+# Used to identify a file that no longer exists within the AWS S3 Bucket
+    # The botocore Python package is installed along with the boto3 Python package
+from botocore.exceptions import ClientError
+
 # Enables the ability to utilize DataFrames, which are 2 dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
     # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
         # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
@@ -117,11 +154,171 @@ file_name = "<File_Name>"
 # The extension of the file within the AWS S3 Bucket
 s3_file_extension = "<File_Extension>"
 
-# The list collect the name for all of the files within the S3 bucket
+# The folder within the AWS S3 Bucket that contains the date partitions
+s3_folder_name = "<Folder_Name>"
+
+# The layout of the date partitions within the s3_folder_name folder
+    # "HIVE" stores the files for each date within a folder named after each date part, such as <Folder_Name>/year=2024/month=01/day=31/
+    # "DATE_PATH" stores the files for each date within a folder named after the date, such as <Folder_Name>/2024/01/31/
+    # "FLAT" stores the files for every date within the s3_folder_name folder, with the date at the beginning of the file name, such as <Folder_Name>/20240131_<File_Name>.csv
+        # Only the date partition of the date being extracted is listed in Step 5, rather than every file within the AWS S3 Bucket
+s3_partition_layout = "DATE_PATH"
+
+# The folder path (prefix) of a single date partition for each partition layout above
+    # Filled in with the year, month and day parts of the date below
+s3_partition_prefixes = {
+    "HIVE": "{s3_folder_name}/year={s3_file_year}/month={s3_file_month}/day={s3_file_day}/"
+    ,"DATE_PATH": "{s3_folder_name}/{s3_file_year}/{s3_file_month}/{s3_file_day}/"
+    ,"FLAT": "{s3_folder_name}/{s3_file_year}{s3_file_month}{s3_file_day}_"
+}
+
+# The columns to keep from the file within the AWS S3 Bucket, along with the data type of each column
+    # Only these columns are read from the file, rather than reading every column and removing the unwanted columns afterwards
+        # Declaring the data type of each column prevents pandas from having to guess the data type of each column
+            # This is similar to the SELECT clause in SQL
+                # Set to None to read every column within the file
+s3_file_columns = {
+    '<Column_1>': 'string'
+    ,'<Column_2>': 'string'
+    ,'<Column_...N>': 'string'
+}
+
+# Use AWS S3 Select to return only the columns listed above from the AWS S3 Bucket, rather than downloading every column
+    # AWS S3 Select is only available to AWS accounts that were already using it before July 2024
+        # Set to False to download the entire file and only parse the columns listed above
+s3_use_select = False
+
+# The SQL query that AWS S3 Select runs against the file within the AWS S3 Bucket
+    # The column names are taken from the header row of the file
+s3_select_expression = "SELECT " + ", ".join(f's."{column}"' for column in s3_file_columns or []) + " FROM S3Object s"
+
+# The format of the file that AWS S3 Select reads from the AWS S3 Bucket
+    # FileHeaderInfo = "USE" reads the column names from the header row of the file, so they can be used within s3_select_expression
+        # The CompressionType of the file is added in select_s3_file below
+s3_select_input_serialization = {"CSV": {"FileHeaderInfo": "USE"}}
+
+# The format of the rows that AWS S3 Select returns, which are read into a Pandas DataFrame using s3_read_csv_options below
+s3_select_output_serialization = {"CSV": {}}
+
+# The options used to read the file within the AWS S3 Bucket into a Pandas DataFrame
+    # AWS S3 Select returns only the columns listed above, without a header row
+        # Without AWS S3 Select, the entire file is downloaded but only the columns listed above are parsed
+            # Without any columns listed above, every column is parsed and the first column is used as the index of the Pandas DataFrame
+if s3_file_columns and s3_use_select:
+
+    s3_read_csv_options = {"header": None, "names": list(s3_file_columns), "dtype": s3_file_columns}
+
+elif s3_file_columns:
+
+    s3_read_csv_options = {"usecols": list(s3_file_columns), "dtype": s3_file_columns}
+
+else:
+
+    s3_read_csv_options = {"index_col": 0}
+
+# The compression codec for each compressed file extension within the AWS S3 Bucket
+    # Compressed files are decompressed as they are read, so the file is never fully decompressed in memory or on disk
+        # Files without one of these file extensions are identified by their first few bytes instead
+s3_compression_extensions = {
+    ".gz": "gzip"
+    ,".gzip": "gzip"
+    ,".bz2": "bz2"
+    ,".zst": "zstd"
+    ,".zstd": "zstd"
+}
+
+# The compression codec for each Content-Encoding that can be set on a file within the AWS S3 Bucket
+    # The Content-Encoding is returned by the HEAD request in Step 6, so no extra request is needed to identify the compression codec
+s3_content_encodings = {
+    "gzip": "gzip"
+    ,"x-gzip": "gzip"
+    ,"bzip2": "bz2"
+    ,"x-bzip2": "bz2"
+    ,"zstd": "zstd"
+}
+
+# The file extensions of files within the AWS S3 Bucket that are not compressed
+    # Files with one of these file extensions, and without a Content-Encoding above, are not read to identify their compression codec
+s3_uncompressed_extensions = (".csv", ".txt", ".tsv")
+
+# The compression codec for the first few bytes (magic bytes) that each compression codec writes at the beginning of a compressed file
+s3_compression_magic_bytes = {
+    b"\x1f\x8b": "gzip"
+    ,b"BZh": "bz2"
+    ,b"\x28\xb5\x2f\xfd": "zstd"
+}
+
+# The AWS S3 Select compression type for each compression codec
+    # AWS S3 Select does not support zstd compressed files
+s3_select_compression_types = {
+    "gzip": "GZIP"
+    ,"bz2": "BZIP2"
+}
+
+# The size, in bytes, at which the file within the AWS S3 Bucket is downloaded in parallel byte ranges, rather than with a single GET request
+    # A single GET request is limited to the throughput of 1 connection, which is too slow for files that are multiple GB
+s3_large_file_threshold = 256 * 1024 * 1024
+
+# The size, in bytes, of each byte range that a large file within the AWS S3 Bucket is split into
+s3_large_file_part_size = 64 * 1024 * 1024
+
+# The number of byte ranges of a large file within the AWS S3 Bucket that are downloaded at the same time
+s3_large_file_max_concurrency = 16
+
+# The method used to load the file(s) within the AWS S3 Bucket into the Snowflake data warehouse
+    # "PANDAS" downloads the file(s) into a Pandas DataFrame and loads the Pandas DataFrame into the Snowflake data warehouse using write_pandas
+    # "COPY_INTO" loads the file(s) straight from the AWS S3 Bucket into the Snowflake data warehouse, using COPY INTO and the external stage below
+        # The file(s) are never downloaded into Python, which is much faster when no Python transformation is needed
+            # The columns of the file(s) must match the columns of the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, as s3_file_columns is not used
+s3_load_method = "PANDAS"
+
+# The Snowflake external stage that points to the AWS S3 Bucket
+    # Created in the "Snowflake SQL Queries Template.sql" file
+        # The stage URL must point to the root of the AWS S3 Bucket, so that the file names within the stage match the file names within the AWS S3 Bucket
+s3_stage_name = "DB_KKF_MAIN.PUBLIC.STG_AWS_S3_CSV_COMMA"
+
+# Move the file(s) into the archive folder within the AWS S3 Bucket, once they have been loaded into the Snowflake data warehouse
+    # This keeps the folder(s) that are listed by the data pipeline small, so that listing the files stays fast
+        # Set to False to leave the file(s) where they are
+s3_archive_enabled = False
+
+# The folder within the AWS S3 Bucket that the file(s) are moved into
+    # The file name, including its date partition folders, is kept inside of the archive folder, such as <Archive_Folder_Name>/<Folder_Name>/2024/01/31/<File_Name>.csv
+        # Must be outside of the s3_folder_name folder, so that the archived file(s) are not listed by the data pipeline
+s3_archive_folder_name = "<Archive_Folder_Name>"
+
+# The set collects the name for all of the files within the S3 bucket prefix, specified below
     # This will allow us to verify if the file that we would like to extract exists
         # If the file does not exist, the data pipeline will not try to extract the file
             # This will prevent the data pipeline from failing
-s3_file_list = []
+    # A set is used instead of a list, so that verifying if the file exists is a hashed lookup rather than a search through every file name
+s3_file_index = set()
+
+# The local file that records the key, ETag, size and last modified date of every file loaded from the AWS S3 Bucket
+    # A file that has not changed since it was last loaded is skipped before it is extracted or loaded into the Snowflake data warehouse
+        # This only costs 1 HEAD request against the AWS S3 Bucket, rather than extracting and loading the entire file again
+            # Set to None to extract and load the file on every data pipeline execution, even if it has not changed
+s3_manifest_path = "<Path_To_S3_Load_Manifest_File>.json"
+
+# Also record each loaded file within the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table in Snowflake
+    # This keeps a history of the files that have been loaded, which can be queried in Snowflake
+        # The local load manifest above is still used to decide whether the file has changed
+s3_manifest_table_enabled = False
+
+# The local file that persists the AWS S3 Bucket key index between data pipeline executions
+    # Each execution only lists the files added after the last file name recorded for the prefix, specified below
+        # Set to None, if you do not want to persist the AWS S3 Bucket key index between data pipeline executions
+s3_file_index_path = "<Path_To_S3_Key_Index_File>.json"
+
+# List every file name within the prefix on every data pipeline execution, rather than only the file names that sort after the last file name already listed
+    # A file that is added with a name that sorts before a file name that was already listed, such as a backfilled date or a different naming scheme, is never listed unless this is set to True
+        # Listing every file name also removes the file names that no longer exist within the prefix from the persisted key index
+s3_file_index_full_listing = False
+
+# The number of prefixes that are kept within the persisted key index
+    # Each date partition is a different prefix, so the persisted key index would otherwise grow by 1 prefix every day
+        # The prefixes that were listed the longest time ago are removed first
+s3_file_index_max_prefixes = 7
 
 # The date used to calulate the date variables below
 today = datetime.now()
@@ -139,8 +336,28 @@ s3_file_month = (today - timedelta(days = 3)).strftime("%m")
 # The day part of the file name within the AWS S3 Bucket
 s3_file_day = (today - timedelta(days = 3)).strftime("%d")
 
+# The folder path (prefix) of the date partition within the AWS S3 Bucket, built from the partition layout and the year, month and day parts above
+    # Only the files that begin with this prefix are listed in Step 5, rather than every file within the AWS S3 Bucket
+        # Set to "" if the files are not stored in date partitions, which will list every file within the AWS S3 Bucket
+s3_file_prefix = s3_partition_prefixes[s3_partition_layout].format(
+    s3_folder_name = s3_folder_name
+    ,s3_file_year = s3_file_year
+    ,s3_file_month = s3_file_month
+    ,s3_file_day = s3_file_day
+)
+
 # The file within the AWS S3 Bucket that you would like to extract
-s3_file_name = f"{file_name}.{s3_file_extension}"
+s3_file_name = f"{s3_file_prefix}{file_name}.{s3_file_extension}"
+
+# The number of rows that are read from the file within the AWS S3 Bucket and loaded into the Snowflake data warehouse at a time
+    # Streaming the file in chunks of rows keeps only a few chunks in memory at once, no matter how big the file is
+        # Each chunk is loaded with its own write_pandas call, so use a large number of rows, such as 1000000
+            # Set to None to load the entire file into the df Pandas DataFrame at once
+s3_file_chunksize = None
+
+# The number of chunks of rows that can be read ahead of the Snowflake data warehouse load
+    # The file within the AWS S3 Bucket stops being read while this many chunks are waiting to be loaded, which keeps the memory used bounded
+s3_file_chunk_queue_size = 2
 
 
 ##############################################################################################################
@@ -158,30 +375,254 @@ s3 = boto3.resource(
     ,aws_secret_access_key = s3_secret_access_key
 )
 
+# The AWS S3 client that sits underneath the AWS S3 resource
+s3_client = s3.meta.client
+
+
+# Identify the compression codec of the file within the AWS S3 Bucket
+    # The compression codec is identified by the file extension, or by the Content-Encoding returned by the HEAD request in Step 6
+        # The first 4 bytes of the file are only downloaded if neither of them identifies whether the file is compressed
+            # Returns None if the file is not compressed
+def detect_s3_file_compression(s3_file_name, s3_file_head):
+
+    # Identify the compression codec by the file extension
+    for s3_compression_extension, s3_compression_codec in s3_compression_extensions.items():
+
+        if s3_file_name.lower().endswith(s3_compression_extension):
+
+            return s3_compression_codec
+
+    # Identify the compression codec by the Content-Encoding of the file
+    s3_file_encoding = s3_file_head.get("ContentEncoding", "").lower()
+
+    if s3_file_encoding in s3_content_encodings:
+
+        return s3_content_encodings[s3_file_encoding]
+
+    # Files with an uncompressed file extension are not compressed
+    if s3_file_name.lower().endswith(s3_uncompressed_extensions):
+
+        return None
+
+    # An empty file is not compressed
+    if s3_file_head["ContentLength"] == 0:
+
+        return None
+
+    # Identify the compression codec by the first 4 bytes of the file
+        # Range only downloads the first 4 bytes, rather than the entire file
+            # An empty file has no bytes to download, which returns a 416 InvalidRange error, so the file is treated as not compressed
+    try:
+
+        s3_file_magic_bytes = s3_client.get_object(Bucket = s3_bucket, Key = s3_file_name, Range = "bytes=0-3")['Body'].read()
+
+    except ClientError as s3_file_error:
+
+        if s3_file_error.response["Error"]["Code"] != "InvalidRange":
+
+            raise
+
+        return None
+
+    for s3_compression_magic_byte, s3_compression_codec in s3_compression_magic_bytes.items():
+
+        if s3_file_magic_bytes.startswith(s3_compression_magic_byte):
+
+            return s3_compression_codec
+
+    return None
+
+
+# Run the AWS S3 Select SQL query against the file within the AWS S3 Bucket, which returns only the columns listed in s3_file_columns
+    # The rows are kept in memory up to 100 MB and written to a temporary file on disk after that
+        # Returns the rows, from the beginning, so they can be read into a Pandas DataFrame using s3_read_csv_options
+def select_s3_file(s3_file_name, s3_file_compression):
+
+    # AWS S3 Select does not support zstd compressed files, which would otherwise be read as if they were not compressed
+    if s3_file_compression is not None and s3_file_compression not in s3_select_compression_types:
+
+        raise ValueError(f"AWS S3 Select does not support {s3_file_compression} compressed files, set s3_use_select to False to load the {s3_file_name} file")
+
+    s3_file_select = s3_client.select_object_content(
+        Bucket = s3_bucket
+        ,Key = s3_file_name
+        ,ExpressionType = "SQL"
+        ,Expression = s3_select_expression
+        ,InputSerialization = {**s3_select_input_serialization, "CompressionType": s3_select_compression_types.get(s3_file_compression, "NONE")}
+        ,OutputSerialization = s3_select_output_serialization
+    )
+
+    # The temporary file is closed if collecting the rows fails, otherwise it is returned open
+    with contextlib.ExitStack() as s3_select_resources:
+
+        s3_file_body = s3_select_resources.enter_context(tempfile.SpooledTemporaryFile(max_size = 100 * 1024 * 1024))
+
+        for s3_select_event in s3_file_select["Payload"]:
+
+            # The AWS S3 Select response also contains progress and stats events, which do not contain any rows
+            if "Records" in s3_select_event:
+
+                s3_file_body.write(s3_select_event["Records"]["Payload"])
+
+        s3_file_body.seek(0)
+
+        s3_select_resources.pop_all()
+
+    return s3_file_body
+
+
+# Move files into the archive folder within the AWS S3 Bucket, without downloading them
+    # Each file is copied into the s3_archive_folder_name folder by AWS S3 itself (server-side copy)
+        # Files larger than s3_large_file_threshold are copied in s3_large_file_part_size parts at the same time (multipart copy), as a single copy request is limited to 5 GB
+    # The original files are then deleted, 1000 files per delete request, which is the most that AWS S3 allows
+        # Only the files that were copied successfully are deleted
+            # Returns the files that were moved into the archive folder
+def archive_s3_files(s3_file_names):
+
+    s3_archived_files = []
+
+    for s3_file_name in s3_file_names:
+
+        try:
+
+            s3_client.copy(
+                CopySource = {"Bucket": s3_bucket, "Key": s3_file_name}
+                ,Bucket = s3_bucket
+                ,Key = f"{s3_archive_folder_name}/{s3_file_name}"
+                ,Config = TransferConfig(
+                    multipart_threshold = s3_large_file_threshold
+                    ,multipart_chunksize = s3_large_file_part_size
+                    ,max_concurrency = s3_large_file_max_concurrency
+                )
+            )
+
+        except Exception as s3_archive_error:
+
+            print(f"Failed to copy the {s3_file_name} file into the archive folder: {s3_archive_error}")
+
+            continue
+
+        s3_archived_files.append(s3_file_name)
+
+    # Delete the original files, 1000 files per delete request
+        # Quiet only returns the files that failed to be deleted
+    for i in range(0, len(s3_archived_files), 1000):
+
+        s3_delete_response = s3_client.delete_objects(
+            Bucket = s3_bucket
+            ,Delete = {"Objects": [{"Key": s3_file_name} for s3_file_name in s3_archived_files[i:i + 1000]], "Quiet": True}
+        )
+
+        for s3_delete_error in s3_delete_response.get("Errors", []):
+
+            print(f"Failed to delete the {s3_delete_error['Key']} file after archiving it: {s3_delete_error['Message']}")
+
+    return s3_archived_files
+
+
+# Load files within the AWS S3 Bucket into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table straight from the Snowflake external stage, up to 1000 files per COPY INTO statement
+    # FROM points at the s3_copy_folder folder within the external stage, and FILES lists each file by its name within that folder
+        # Snowflake only reads the listed files, rather than listing every file within the AWS S3 Bucket and matching each one against a PATTERN
+            # 1000 is the most files that FILES allows within a single COPY INTO statement
+    # FORCE = TRUE loads the file(s) even if Snowflake has already loaded them within the last 64 days, as the table is truncated before the file(s) are loaded
+def copy_s3_files_into_snowflake(cur, s3_copy_folder, s3_copy_files):
+
+    for i in range(0, len(s3_copy_files), 1000):
+
+        # The name of each file within the s3_copy_folder folder, as a Snowflake string
+            # Backslashes and single quotes are escaped, because Snowflake treats them as special characters within a string
+        s3_copy_file_names = ", ".join(
+            "'" + s3_copy_file[len(s3_copy_folder):].replace("\\", "\\\\").replace("'", "''") + "'"
+            for s3_copy_file in s3_copy_files[i:i + 1000]
+        )
+
+        cur.execute(f"""
+            COPY INTO DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>
+                FROM @{s3_stage_name}/{s3_copy_folder}
+                FILES = ({s3_copy_file_names})
+                FORCE = TRUE
+            ;
+        """)
+
 
 ##############################################################################################################
-# Step 5: Collect a list of file names for all files within the AWS S3 Bucket
+# Step 5: Collect a list of file names for the files within the AWS S3 Bucket prefix
 ##############################################################################################################
 
 
-# Loop through each file within the AWS S3 Bucket
-for s3_bucket_file in s3.Bucket(s3_bucket).objects.all():
+# Load the AWS S3 Bucket key index that was persisted by the previous data pipeline execution, if it exists
+    # The persisted key index is keyed by prefix, so that each prefix keeps its own list of file names
+if s3_file_index_path and os.path.exists(s3_file_index_path):
+
+    with open(s3_file_index_path) as s3_file_index_file:
+
+        s3_file_index_persisted = json.load(s3_file_index_file)
+
+else:
+
+    s3_file_index_persisted = {}
+
+# Add the file names that were already listed for the prefix to the s3_file_index set, if every file name is NOT being listed
+if not s3_file_index_full_listing:
+
+    s3_file_index.update(s3_file_index_persisted.get(s3_file_prefix, []))
+
+
+# Persist the AWS S3 Bucket key index, so that the next data pipeline execution only lists the newly added files
+    # The prefix is moved to the end of the persisted key index, so that only the s3_file_index_max_prefixes most recently listed prefixes are kept
+def save_s3_file_index():
+
+    global s3_file_index_persisted
+
+    if s3_file_index_path:
 
-    # Display all of the file names within the AWS S3 Bucket
-        # Comment Out once the files have been verified
-    # print()
-    # print(s3_bucket_file.key)
+        s3_file_index_persisted.pop(s3_file_prefix, None)
 
-    # Collect the name of each file within the AWS S3 Bucket
-    s3_file_list.append(s3_bucket_file.key)
+        s3_file_index_persisted[s3_file_prefix] = sorted(s3_file_index)
+
+        s3_file_index_persisted = dict(list(s3_file_index_persisted.items())[-s3_file_index_max_prefixes:])
+
+        with open(s3_file_index_path, "w") as s3_file_index_file:
+
+            json.dump(s3_file_index_persisted, s3_file_index_file)
+
+
+# Establish a paginator that lists the files within the AWS S3 Bucket, 1 page of up to 1,000 file names at a time
+    # The pages are requested lazily as the for loop below moves through them, so the file names are never all held in a single response
+s3_paginator = s3.meta.client.get_paginator("list_objects_v2")
+
+# Loop through each page of files within the AWS S3 Bucket prefix
+    # AWS S3 returns the file names in alphabetical order, so StartAfter skips every file name that was already listed by a previous data pipeline execution
+        # StartAfter is left empty when there is no persisted key index for the prefix, or s3_file_index_full_listing is set to True, which lists every file name within the prefix
+            # A file added with a name that sorts before a file name that was already listed is skipped, unless s3_file_index_full_listing is set to True
+for s3_bucket_page in s3_paginator.paginate(
+    Bucket = s3_bucket
+    ,Prefix = s3_file_prefix
+    ,StartAfter = max(s3_file_index, default = "")
+):
+
+    # Loop through each file within the page
+        # A page without any files does not contain the Contents key
+    for s3_bucket_file in s3_bucket_page.get("Contents", []):
+
+        # Display all of the file names within the AWS S3 Bucket prefix
+            # Comment Out once the files have been verified
+        # print()
+        # print(s3_bucket_file["Key"])
+
+        # Collect the name of each file within the AWS S3 Bucket prefix
+        s3_file_index.add(s3_bucket_file["Key"])
+
+# Persist the AWS S3 Bucket key index, so that the next data pipeline execution only lists the newly added files
+save_s3_file_index()
 
 """
-# Display all of the files within the AWS S3 Bucket
+# Display all of the files within the AWS S3 Bucket prefix
     # Comment Out once the files have been verified
 print()
 print("AWS S3 Bucket Files:")
 print()
-print(s3_file_list)
+print(s3_file_index)
 """
 
 
@@ -190,28 +631,385 @@ print(s3_file_list)
 ##############################################################################################################
 
 
+# Load the load manifest that was written by the previous data pipeline executions, if it exists
+if s3_manifest_path and os.path.exists(s3_manifest_path):
+
+    with open(s3_manifest_path) as s3_manifest_file:
+
+        s3_manifest = json.load(s3_manifest_file)
+
+else:
+
+    s3_manifest = {}
+
+# The file is only extracted if it exists within the AWS S3 Bucket and has changed since it was last loaded
+s3_file_changed = False
+
+s3_file_head = None
+
 # Verify if the desired file name exists within the AWS S3 Bucket
-    # If the file exists within the AWS S3 Bucket, extaract the file
-if s3_file_name in s3_file_list:
+if s3_file_name in s3_file_index:
+
+    # Retrieve the ETag, size and last modified date of the file within the AWS S3 Bucket, without downloading the file
+        # A file within the persisted key index may have been deleted or archived since it was listed, which returns a 404 error
+            # The file is removed from the persisted key index, rather than failing the data pipeline
+    try:
+
+        s3_file_head = s3.meta.client.head_object(Bucket = s3_bucket, Key = s3_file_name)
+
+    except ClientError as s3_file_error:
+
+        if s3_file_error.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+
+            raise
+
+        print(f"The {s3_file_name} file no longer exists within the AWS S3 Bucket and was removed from the key index")
+
+        s3_file_index.discard(s3_file_name)
+
+        save_s3_file_index()
+
+# If the file exists within the AWS S3 Bucket, verify if the file has changed since it was last loaded
+if s3_file_head is not None:
+
+    # The load manifest entry for the file within the AWS S3 Bucket
+        # The ETag changes whenever the content of the file changes
+    s3_manifest_entry = {
+        "etag": s3_file_head["ETag"]
+        ,"size": s3_file_head["ContentLength"]
+        ,"last_modified": s3_file_head["LastModified"].isoformat()
+    }
+
+    # The file has changed if it is not within the load manifest, or if its load manifest entry is different
+    s3_file_changed = s3_manifest.get(s3_file_name) != s3_manifest_entry
+
+    # Display a message that the file is being skipped because it has not changed
+        # Comment out once the load manifest has been verified
+    if not s3_file_changed:
+
+        print(f"The {s3_file_name} file has not changed since it was last loaded and will be skipped")
+
+# If the file has changed, extract the file
+if s3_file_changed:
+
+    # Extract the file, if the PANDAS load method IS being used
+        # The COPY_INTO load method loads the file straight from the AWS S3 Bucket in Step 8
+    if s3_load_method == "PANDAS":
+
+        # The file within the AWS S3 Bucket, along with its temporary file and memory map, is closed automatically after the with block is exited, even if extracting the file fails
+            # When the file IS being streamed in chunks of rows, they are handed over to the thread that reads the file, which closes them once it has finished
+        with contextlib.ExitStack() as s3_file_resources:
+
+            # The compression codec of the file within the AWS S3 Bucket
+            s3_file_compression = detect_s3_file_compression(s3_file_name, s3_file_head)
+
+            # Extract only the columns listed in s3_file_columns from the file within the AWS S3 Bucket, if AWS S3 Select IS being used
+            if s3_file_columns and s3_use_select:
+
+                # Run the AWS S3 Select SQL query against the file within the AWS S3 Bucket and collect the rows that it returns
+                s3_file_body = s3_file_resources.enter_context(select_s3_file(s3_file_name, s3_file_compression))
+
+                # AWS S3 Select decompresses the file before returning the rows
+                s3_file_compression = None
+
+            # Download the file in parallel byte ranges, if the file is larger than s3_large_file_threshold
+            elif s3_manifest_entry["size"] >= s3_large_file_threshold:
+
+                # The byte ranges are written into their position within a temporary file on disk as they are downloaded
+                    # The temporary file is deleted automatically once it is closed
+                s3_file_download = s3_file_resources.enter_context(tempfile.TemporaryFile())
+
+
+                # Add IfMatch to each byte range GET request for the file, the same as the single GET request below
+                    # download_fileobj does not accept IfMatch within ExtraArgs, so it is added to each GET request just before it is sent
+                        # If the file is replaced during the download, the GET request fails, rather than loading data that does not match the load manifest entry
+                def add_s3_file_if_match(params, **kwargs):
+
+                    if params.get("Key") == s3_file_name:
+
+                        params["IfMatch"] = s3_manifest_entry["etag"]
+
+
+                s3.meta.client.meta.events.register("before-parameter-build.s3.GetObject", add_s3_file_if_match)
+
+                try:
+
+                    s3.meta.client.download_fileobj(
+                        Bucket = s3_bucket
+                        ,Key = s3_file_name
+                        ,Fileobj = s3_file_download
+                        ,Config = TransferConfig(
+                            multipart_threshold = s3_large_file_threshold
+                            ,multipart_chunksize = s3_large_file_part_size
+                            ,max_concurrency = s3_large_file_max_concurrency
+                        )
+                    )
+
+                finally:
 
-    # Extract the data from the file within the AWS S3 Bucket
-    s3_file = s3.Bucket(s3_bucket).Object(s3_file_name).get()
+                    s3.meta.client.meta.events.unregister("before-parameter-build.s3.GetObject", add_s3_file_if_match)
+
+                s3_file_download.flush()
+
+                # Memory map the temporary file, so that the CSV parser reads the file straight from the operating system page cache, if the file is NOT compressed
+                    # This prevents the entire file from being copied into memory before it is parsed
+                if s3_file_compression is None:
+
+                    s3_file_body = s3_file_resources.enter_context(mmap.mmap(s3_file_download.fileno(), 0, access = mmap.ACCESS_READ))
+
+                # Read the temporary file from the beginning, if the file IS compressed
+                    # The file is decompressed as it is read, which is not possible with a memory mapped file
+                else:
+
+                    s3_file_download.seek(0)
+
+                    s3_file_body = s3_file_download
+
+            # Extract the data from the file within the AWS S3 Bucket with a single GET request, if AWS S3 Select is NOT being used
+            else:
+
+                # IfMatch ensures the file has not been replaced since the HEAD request above, so that the load manifest matches the data that is loaded
+                s3_file_body = s3_file_resources.enter_context(s3.Bucket(s3_bucket).Object(s3_file_name).get(IfMatch = s3_manifest_entry["etag"])['Body'])
+
+            # Load the entire file into the df Pandas DataFrame, if the file is NOT being streamed in chunks of rows
+            if s3_file_chunksize is None:
+
+                # Load the data from s3_file_body into the df Pandas DataFrame
+                df = pd.read_csv(s3_file_body, compression = s3_file_compression, **s3_read_csv_options)
+
+                """
+                # Verify if there is any data within the df Pandas DataFrame
+                    # Comment out once the data has been verified
+                if not df.empty:
+
+                    print("The df Pandas DataFrame contains data:")
+                    print()
+                    print(df)
+
+                else:
+
+                    print("The df Pandas DataFrame is empty")
+                """
+
+            # Stream the file in chunks of rows, if the file IS being streamed in chunks of rows
+            else:
+
+                # The queue holds the chunks of rows that have been read, until they are loaded into the Snowflake data warehouse in Step 8
+                    # Once the queue is full, reading the file waits until a chunk of rows has been loaded
+                s3_file_chunks = queue.Queue(maxsize = s3_file_chunk_queue_size)
+
+                # Set by Step 8 once it stops loading chunks of rows, including when loading a chunk of rows fails
+                    # This tells the thread below to stop reading the file, rather than waiting forever for room within the queue
+                s3_file_chunks_stop = threading.Event()
+
+
+                # Add a chunk of rows to the queue, waiting until the queue has room for it
+                    # Checks every second whether Step 8 has stopped loading chunks of rows
+                        # Returns False if Step 8 has stopped, as the chunk of rows will never be loaded
+                def put_s3_file_chunk(s3_file_chunk):
+
+                    while not s3_file_chunks_stop.is_set():
+
+                        try:
+
+                            s3_file_chunks.put(s3_file_chunk, timeout = 1)
+
+                            return True
+
+                        except queue.Full:
+
+                            continue
+
+                    return False
+
+
+                # Read the file within the AWS S3 Bucket in chunks of rows and add each chunk of rows to the queue
+                    # None is added to the queue once the entire file has been read, which tells Step 8 that there are no more chunks of rows
+                        # If reading the file fails, the error is added to the queue, so that Step 8 can raise it
+                            # The file is closed once it has been read or Step 8 has stopped, which releases the connection to the AWS S3 Bucket
+                def read_s3_file_chunks(s3_file_reader_resources):
+
+                    with s3_file_reader_resources:
+
+                        try:
+
+                            for df_chunk in pd.read_csv(s3_file_body, compression = s3_file_compression, chunksize = s3_file_chunksize, **s3_read_csv_options):
+
+                                if not put_s3_file_chunk(df_chunk):
+
+                                    return
+
+                            put_s3_file_chunk(None)
+
+                        except Exception as s3_file_error:
+
+                            put_s3_file_chunk(s3_file_error)
+
+
+                # Start reading the file within the AWS S3 Bucket in the background
+                    # The file continues to be downloaded and read while the previous chunks of rows are loaded into the Snowflake data warehouse
+                    # pop_all hands the open file, temporary file and memory map over to the thread, so that they are not closed when this with block is exited
+                s3_file_reader = threading.Thread(target = read_s3_file_chunks, args = (s3_file_resources.pop_all(),), daemon = True)
+
+                s3_file_reader.start()
 
-    # Load the data from s3_file into the df Pandas DataFrame
-    df = pd.read_csv(s3_file['Body'], index_col = 0)
 
     """
-    # Verify if there is any data within the df Pandas DataFrame
-        # Comment out once the data has been verified
-    if not df.empty:
+    # Verify that s3_select_expression, s3_select_input_serialization and s3_select_output_serialization only return the columns listed in s3_file_columns
+        # The mocked AWS S3 Bucket from the moto Python package can not be used, as its AWS S3 Select does not support quoted column names, the S3Object alias or more than 1 column
+            # Requires an AWS account that can use AWS S3 Select, as a small test file is uploaded into the AWS S3 Bucket and deleted afterwards
+                # Run after executing Steps 1 through 4 with s3_use_select set to True
+                    # Comment out once the column pruning has been verified
+    import gzip
+    import io
 
-        print("The df Pandas DataFrame contains data:")
-        print()
-        print(df)
+    # Build a test file that contains every column within s3_file_columns, with an unselected column before each one
+        # The values contain commas and quotes, which must be returned quoted by AWS S3 Select to be read back correctly
+    df_test_file = pd.DataFrame({
+        f"{s3_test_column_name}": [f'{s3_test_column}, "row {i}"' if s3_test_column_name == s3_test_column else f"unselected {i}" for i in range(3)]
+        for s3_test_column in s3_file_columns
+        for s3_test_column_name in [f"UNSELECTED {s3_test_column}", s3_test_column]
+    })
 
-    else:
+    s3_test_csv = df_test_file.to_csv(index = False).encode()
+
+    # Run the AWS S3 Select SQL query against the test file, both as a plain csv file and as a gzip compressed csv file
+    for s3_test_key, s3_test_body, s3_test_compression in [
+        ("s3_select_test/test.csv", s3_test_csv, None)
+        ,("s3_select_test/test.csv.gz", gzip.compress(s3_test_csv), "gzip")
+    ]:
+
+        s3_client.put_object(Bucket = s3_bucket, Key = s3_test_key, Body = s3_test_body)
+
+        try:
+
+            df_test = pd.read_csv(select_s3_file(s3_test_key, s3_test_compression), **s3_read_csv_options)
+
+        finally:
+
+            s3_client.delete_object(Bucket = s3_bucket, Key = s3_test_key)
+
+        print(df_test)
+
+        assert list(df_test.columns) == list(s3_file_columns)
+        assert df_test.equals(df_test_file[list(s3_file_columns)].astype(s3_file_columns))
+    """
+
+    """
+    # Compare downloading a large file with a single GET request against downloading it in parallel byte ranges, using a mocked AWS S3 Bucket
+        # Requires the moto Python package, which can be installed using %pip install moto[s3]
+            # The mocked AWS S3 Bucket has no network, therefore each GET request is slowed down to 20 MB per second to act like a single connection to AWS S3
+                # Comment out once the parallel download has been verified
+    import time
+
+    from moto import mock_aws
+
+    with mock_aws():
+
+        s3_test_client = boto3.client("s3", region_name = "us-east-1")
+
+        s3_test_client.create_bucket(Bucket = "s3-large-file-test")
+
+        # Create a 128 MB csv file within the mocked AWS S3 Bucket
+        s3_test_row = b"1,abcdefghij,3.14159,2024-01-01\n"
+
+        s3_test_client.put_object(Bucket = "s3-large-file-test", Key = "test.csv", Body = b"A,B,C,D\n" + s3_test_row * (128 * 1024 * 1024 // len(s3_test_row)))
+
+
+        # Slow down each GET request to 20 MB per second, based on the number of bytes that the GET request returns
+        def throttle_s3_connection(parsed, **kwargs):
+
+            time.sleep(parsed["ContentLength"] / (20 * 1024 * 1024))
+
+
+        s3_test_client.meta.events.register("after-call.s3.GetObject", throttle_s3_connection)
+
+        # Download and parse the file with a single GET request
+        s3_test_start = time.perf_counter()
+
+        df_test = pd.read_csv(s3_test_client.get_object(Bucket = "s3-large-file-test", Key = "test.csv")["Body"])
+
+        print(f"Single GET request: {time.perf_counter() - s3_test_start:.2f} seconds")
 
-        print("The df Pandas DataFrame is empty")
+        # Download and parse the file in parallel byte ranges
+        s3_test_start = time.perf_counter()
+
+        s3_test_download = tempfile.TemporaryFile()
+
+        s3_test_client.download_fileobj(
+            Bucket = "s3-large-file-test"
+            ,Key = "test.csv"
+            ,Fileobj = s3_test_download
+            ,Config = TransferConfig(
+                multipart_threshold = 16 * 1024 * 1024
+                ,multipart_chunksize = 16 * 1024 * 1024
+                ,max_concurrency = s3_large_file_max_concurrency
+            )
+        )
+
+        s3_test_download.flush()
+
+        df_test = pd.read_csv(mmap.mmap(s3_test_download.fileno(), 0, access = mmap.ACCESS_READ))
+
+        print(f"Parallel byte ranges: {time.perf_counter() - s3_test_start:.2f} seconds")
+    """
+
+    """
+    # Compare the end to end time of loading a plain csv file against the same csv file compressed with gzip, bz2 and zstd, using a mocked AWS S3 Bucket
+        # Requires the moto Python package, which can be installed using %pip install moto[s3]
+            # The mocked AWS S3 Bucket has no network, therefore each GET request is slowed down to 20 MB per second to act like a single connection to AWS S3
+                # Comment out once the compressed files have been verified
+    import bz2
+    import gzip
+    import time
+
+    import zstandard
+
+    from moto import mock_aws
+
+    with mock_aws():
+
+        s3_test_client = boto3.client("s3", region_name = "us-east-1")
+
+        s3_test_client.create_bucket(Bucket = "s3-compression-test")
+
+        # Create a csv file with 2 million rows, along with a gzip, bz2 and zstd compressed copy of the csv file, within the mocked AWS S3 Bucket
+        s3_test_csv = b"A,B,C,D\n" + "".join(f"{i},{i * 7919 % 100000},{i / 7:.5f},2024-01-{i % 28 + 1:02d}\n" for i in range(2000000)).encode()
+
+        s3_test_files = {
+            "test.csv": s3_test_csv
+            ,"test.csv.gz": gzip.compress(s3_test_csv)
+            ,"test.csv.bz2": bz2.compress(s3_test_csv)
+            ,"test.csv.zst": zstandard.ZstdCompressor().compress(s3_test_csv)
+        }
+
+        for s3_test_key, s3_test_body in s3_test_files.items():
+
+            s3_test_client.put_object(Bucket = "s3-compression-test", Key = s3_test_key, Body = s3_test_body)
+
+
+        # Slow down each GET request to 20 MB per second, based on the number of bytes that the GET request returns
+        def throttle_s3_connection(parsed, **kwargs):
+
+            time.sleep(parsed["ContentLength"] / (20 * 1024 * 1024))
+
+
+        s3_test_client.meta.events.register("after-call.s3.GetObject", throttle_s3_connection)
+
+        # Download, decompress and parse each file, 1 chunk of rows at a time
+        for s3_test_key, s3_test_body in s3_test_files.items():
+
+            s3_test_start = time.perf_counter()
+
+            s3_test_compression = next((codec for extension, codec in s3_compression_extensions.items() if s3_test_key.endswith(extension)), None)
+
+            s3_test_rows = 0
+
+            for df_test in pd.read_csv(s3_test_client.get_object(Bucket = "s3-compression-test", Key = s3_test_key)["Body"], compression = s3_test_compression, chunksize = 1000000):
+
+                s3_test_rows += len(df_test)
+
+            print(f"{s3_test_key}: {len(s3_test_body) / 1024 / 1024:.1f} MB, {s3_test_rows} rows, {time.perf_counter() - s3_test_start:.2f} seconds")
     """
 
 
@@ -234,6 +1032,7 @@ if s3_file_name in s3_file_list:
     # Select the desired columns to keep from the df Pandas DataFrame
         # This method is used to remove any unwanted data that was extracted from the file within the AWS S3 Bucket
             # This is similar to the SELECT clause in SQL
+                # Not needed when s3_file_columns is set in Step 3, as only those columns are read from the file within the AWS S3 Bucket
     df_subset = df[
         [
             '<Column_1>'
@@ -272,6 +1071,7 @@ if s3_file_name in s3_file_list:
             # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
             # Transform and load the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
             # Merge the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.GRUBHUB.FACT_ORDER table
+            # Record the file within the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table
             # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
     ####################################################################################################
 
@@ -300,30 +1100,81 @@ if s3_file_name in s3_file_list:
         ####################################################################################################
 
         
-        write_pandas(
-            conn = dw_conn
-            # Use df = df_subset, if you ARE using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
-            # ,df = df_subset
-            # Use df = df_concat, if you are NOT using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
-            ,df = df_concat
-            ,table_name = "<Snowflake_Table_Name>"
-            ,schema = "<Snowflake_Schema_Name>"
-            # When set to False, no new table is created in Snowflake from the df_subset Pandas DataFrame
-                # If set to True, a new table will be created in Snowflake from the df_subset Pandas DataFrame
-            ,auto_create_table = False
-            # When set to False, no quotes are added to each column value
-                # When set to True, quotes are added to each column value
-                    # If the data already contains quotes, set to False
-                        # Quotes can be added to column values if working with csv files, which ensures the csv data is not parsed incorrecty
-            ,quote_identifiers = False
-            # The default value is False,
-            # which appends that data from the df_subset Pandas DataFrame to the end of the existing Snowflake table
-                # When overwrite and auto_create_table are both set to True,
-                # the Snowflake table is truncated before the data from the df_subset Pandas DataFrame is loaded into the Snowflake table
-                    # When overwrite is set to True and auto_create_table is set to False,
-                    # the Snowflake table is dropped and then recreated with the data from the df_subset Pandas DataFrame
-            ,overwrite = True
-        )
+        # Load the file(s) straight from the AWS S3 Bucket, if the COPY_INTO load method IS being used
+        if s3_load_method == "COPY_INTO":
+
+            with dw_conn.cursor() as cur:
+
+                # Truncate the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, the same as overwrite = True does for write_pandas below
+                cur.execute("""
+                    TRUNCATE TABLE DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>;
+                """)
+
+                # Load the file from the folder that contains it within the external stage into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+                copy_s3_files_into_snowflake(cur, s3_file_name[:s3_file_name.rfind("/") + 1], [s3_file_name])
+
+        # Load the entire df Pandas DataFrame at once, if the file is NOT being streamed in chunks of rows
+        elif s3_file_chunksize is None:
+
+            write_pandas(
+                conn = dw_conn
+                # Use df = df_subset, if you ARE using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
+                # ,df = df_subset
+                # Use df = df_concat, if you are NOT using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
+                ,df = df_concat
+                ,table_name = "<Snowflake_Table_Name>"
+                ,schema = "<Snowflake_Schema_Name>"
+                # When set to False, no new table is created in Snowflake from the df_subset Pandas DataFrame
+                    # If set to True, a new table will be created in Snowflake from the df_subset Pandas DataFrame
+                ,auto_create_table = False
+                # When set to False, no quotes are added to each column value
+                    # When set to True, quotes are added to each column value
+                        # If the data already contains quotes, set to False
+                            # Quotes can be added to column values if working with csv files, which ensures the csv data is not parsed incorrecty
+                ,quote_identifiers = False
+                # The default value is False,
+                # which appends that data from the df_subset Pandas DataFrame to the end of the existing Snowflake table
+                    # When overwrite and auto_create_table are both set to True,
+                    # the Snowflake table is truncated before the data from the df_subset Pandas DataFrame is loaded into the Snowflake table
+                        # When overwrite is set to True and auto_create_table is set to False,
+                        # the Snowflake table is dropped and then recreated with the data from the df_subset Pandas DataFrame
+                ,overwrite = True
+            )
+
+        # Load each chunk of rows as soon as it has been read, if the file IS being streamed in chunks of rows
+            # The first chunk of rows overwrites the Snowflake table, the remaining chunks of rows are appended to the Snowflake table
+        else:
+
+            s3_file_chunk_number = 0
+
+            try:
+
+                # The chunk of rows is compared to None with "is not", as comparing a Pandas DataFrame to None with "==" returns a Pandas DataFrame rather than True or False
+                while (df_chunk := s3_file_chunks.get()) is not None:
+
+                    # Raise the error if reading the file within the AWS S3 Bucket failed
+                    if isinstance(df_chunk, Exception):
+
+                        raise df_chunk
+
+                    write_pandas(
+                        conn = dw_conn
+                        ,df = df_chunk
+                        ,table_name = "<Snowflake_Table_Name>"
+                        ,schema = "<Snowflake_Schema_Name>"
+                        ,auto_create_table = False
+                        ,quote_identifiers = False
+                        ,overwrite = s3_file_chunk_number == 0
+                    )
+
+                    s3_file_chunk_number += 1
+
+            # Tell the thread reading the file to stop, in case loading a chunk of rows failed, and wait for it to close the file
+            finally:
+
+                s3_file_chunks_stop.set()
+
+                s3_file_reader.join()
         
 
         ####################################################################################################
@@ -521,6 +1372,76 @@ if s3_file_name in s3_file_list:
             """)
             
 
+            ####################################################################################################
+            # Record the file within the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table
+                # Only if s3_manifest_table_enabled is set to True
+            ####################################################################################################
+
+
+            if s3_manifest_table_enabled:
+
+                # Create the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table, if it does NOT already exist
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST
+                    (
+                        S3_BUCKET VARCHAR(255)
+                        ,S3_KEY VARCHAR(1024)
+                        ,S3_ETAG VARCHAR(255)
+                        ,S3_SIZE_IN_BYTES NUMBER(38, 0)
+                        ,S3_LAST_MODIFIED TIMESTAMP_TZ
+                        ,LOADED_AT TIMESTAMP_TZ
+                    )
+                ;
+                """)
+
+                # Update the file record within the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table in Snowflake if it already exists
+                # Insert the file record into the DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST table in Snowflake if it does NOT already exist
+                    # The values are passed as bind variables, rather than formatted into the SQL query
+                cur.execute("""
+                    MERGE INTO DB_KKF_MAIN.AUTOMATION.S3_LOAD_MANIFEST T
+
+                        USING
+                        (
+                            SELECT
+                                %(s3_bucket)s AS S3_BUCKET
+                                ,%(s3_key)s AS S3_KEY
+                                ,%(s3_etag)s AS S3_ETAG
+                                ,%(s3_size)s AS S3_SIZE_IN_BYTES
+                                ,TO_TIMESTAMP_TZ(%(s3_last_modified)s) AS S3_LAST_MODIFIED
+                                ,CURRENT_TIMESTAMP() AS LOADED_AT
+                        ) S
+                        ON T.S3_BUCKET = S.S3_BUCKET
+                        AND T.S3_KEY = S.S3_KEY
+
+                        WHEN MATCHED
+
+                            THEN UPDATE SET
+                                T.S3_ETAG = S.S3_ETAG
+                                ,T.S3_SIZE_IN_BYTES = S.S3_SIZE_IN_BYTES
+                                ,T.S3_LAST_MODIFIED = S.S3_LAST_MODIFIED
+                                ,T.LOADED_AT = S.LOADED_AT
+
+                        WHEN NOT MATCHED
+
+                            THEN INSERT VALUES
+                            (
+                                S.S3_BUCKET
+                                ,S.S3_KEY
+                                ,S.S3_ETAG
+                                ,S.S3_SIZE_IN_BYTES
+                                ,S.S3_LAST_MODIFIED
+                                ,S.LOADED_AT
+                            )
+                    ;
+                """, {
+                    "s3_bucket": s3_bucket
+                    ,"s3_key": s3_file_name
+                    ,"s3_etag": s3_manifest_entry["etag"]
+                    ,"s3_size": s3_manifest_entry["size"]
+                    ,"s3_last_modified": s3_manifest_entry["last_modified"]
+                })
+
+
             ####################################################################################################
             # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
             ####################################################################################################
@@ -570,6 +1491,40 @@ if s3_file_name in s3_file_list:
             """)
             
 
+    ####################################################################################################
+    # Step 9: Record the file within the local load manifest
+        # The file is only recorded once it has been loaded into the Snowflake data warehouse
+            # This way a failed load is retried by the next data pipeline execution
+    ####################################################################################################
+
+
+    if s3_manifest_path:
+
+        # Add or replace the load manifest entry for the file within the AWS S3 Bucket
+        s3_manifest[s3_file_name] = s3_manifest_entry
+
+        with open(s3_manifest_path, "w") as s3_manifest_file:
+
+            json.dump(s3_manifest, s3_manifest_file, indent = 4)
+
+
+    ####################################################################################################
+    # Step 10: Move the file into the archive folder within the AWS S3 Bucket
+        # Only if s3_archive_enabled is set to True
+            # The file is only moved once it has been loaded into the Snowflake data warehouse
+    ####################################################################################################
+
+
+    if s3_archive_enabled:
+
+        archive_s3_files([s3_file_name])
+
+        # Remove the archived file from the persisted key index, so that the next data pipeline execution does not look for it
+        s3_file_index.discard(s3_file_name)
+
+        save_s3_file_index()
+
+
 """
 # Display a message that informs the developer that the Python data pipeline has completed
     # Comment out once the entire data pipeline has completed successfully
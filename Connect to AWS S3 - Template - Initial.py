@@ -11,11 +11,11 @@
 
         Step 4: Connect to the AWS S3 Bucket
 
-        Step 5: Collect a list of file names for all files within the AWS S3 Bucket
+        Step 5: Collect a list of file names for the files within each date partition of the AWS S3 Bucket
 
-        Step 6: Extract and Load the data from the file within the AWS S3 Bucket
+        Step 6: Extract and Load the data from the files within the AWS S3 Bucket
 
-        Step 7: Consolidate all csv files in the all_date List into 1 Pandas Dataframe
+        Step 7: Consolidate all csv files in the all_date List into 1 Pandas Dataframe, unless they were written into local Parquet part files
 
         Step 8: Select the Columns to Keep from the df Pandas DataFrame and load the data into the df_subset Pandas DataFrame
 
@@ -33,6 +33,8 @@
                 4. Transform and load the GrubHub Order data into the Snowflake DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
                 5. Merge the GrubHub Order data into the Snowflake DB_KKF_MAIN.GRUBHUB.FACT_ORDER table
                 6. Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+
+        Step 10: Move the file(s) into the archive folder within the AWS S3 Bucket
 """
 
 
@@ -55,6 +57,14 @@
     # Used to store data in Series and DataFrames	
 %pip install pandas
 
+# Install the pyarrow Python package
+    # Used to write each extracted file into a local Parquet part file
+%pip install pyarrow
+
+# Install the zstandard Python package
+    # Used to decompress zstd compressed files within the AWS S3 Bucket
+%pip install zstandard
+
 # Install the snowflake-connector-python[pandas] Python package
     # Used to connect to Snowflake and utilize Pandas DataFrames	
 %pip install snowflake-connector-python[pandas]
@@ -70,12 +80,32 @@
 ##############################################################################################################
 
 
+# Used to extract the files for multiple dates at the same time, using a pool of threads
+from concurrent.futures import ThreadPoolExecutor
+
 # Used when working with and manipulating dates and times
 from datetime import datetime, timedelta
 
+# Used to hold the columns returned by AWS S3 Select in memory, or on disk once they no longer fit in memory
+import tempfile
+
+# Used to build the path of each local Parquet part file
+import os
+
+# Used to delete the local Parquet part files once they have been loaded into the Snowflake data warehouse
+import shutil
+
 # Enables the ability to connect to multiple AWS services, such as S3 Bucket
 import boto3
 
+# Used to set the number of connections that the AWS S3 Bucket connection keeps open, so that each thread has its own connection
+    # The botocore Python package is installed along with the boto3 Python package
+from botocore.config import Config
+
+# Used to identify an empty file within the AWS S3 Bucket, which can not be read with a Range request
+    # The botocore Python package is installed along with the boto3 Python package
+from botocore.exceptions import ClientError
+
 # Enables the ability to utilize DataFrames, which are 2 dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
     # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
         # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
@@ -114,16 +144,123 @@ s3_bucket = "<AWS_S3_Bucket>"
 
 # The report associated with the file within the AWS S3 Bucket
     # Available datasets assigned to the account connecting to the AWS service
+        # Every file within a date partition whose name begins with file_name is extracted
+            # Set to "" to extract every file within each date partition, such as the part files written by Spark or Hive
 file_name = "<File_Name>"
 
 # The extension of the file within the AWS S3 Bucket
 s3_file_extension = "<File_Extension>"
 
-# The list collect the name for all of the files within the S3 bucket
-    # This will allow us to verify if the file that we would like to extract exists
-        # If the file does not exist, the data pipeline will not try to extract the file
+# The folder within the AWS S3 Bucket that contains the date partitions
+s3_folder_name = "<Folder_Name>"
+
+# The layout of the date partitions within the s3_folder_name folder
+    # "HIVE" stores the files for each date within a folder named after each date part, such as <Folder_Name>/year=2024/month=01/day=31/
+    # "DATE_PATH" stores the files for each date within a folder named after the date, such as <Folder_Name>/2024/01/31/
+    # "FLAT" stores the files for every date within the s3_folder_name folder, with the date at the beginning of the file name, such as <Folder_Name>/20240131_<File_Name>.csv
+        # Only the date partitions covered by the dates being extracted are listed and read, rather than every file within the AWS S3 Bucket
+s3_partition_layout = "DATE_PATH"
+
+# The folder path (prefix) of a single date partition for each partition layout above
+    # Filled in with the year, month and day parts of each date in Step 5
+s3_partition_prefixes = {
+    "HIVE": "{s3_folder_name}/year={s3_file_year}/month={s3_file_month}/day={s3_file_day}/"
+    ,"DATE_PATH": "{s3_folder_name}/{s3_file_year}/{s3_file_month}/{s3_file_day}/"
+    ,"FLAT": "{s3_folder_name}/{s3_file_year}{s3_file_month}{s3_file_day}_"
+}
+
+# The columns to keep from the file within the AWS S3 Bucket, along with the data type of each column
+    # Only these columns are read from the file, rather than reading every column and removing the unwanted columns afterwards
+        # Declaring the data type of each column prevents pandas from having to guess the data type of each column
+            # This is similar to the SELECT clause in SQL
+                # Set to None to read every column within the file
+s3_file_columns = {
+    '<Column_1>': 'string'
+    ,'<Column_2>': 'string'
+    ,'<Column_...N>': 'string'
+}
+
+# Use AWS S3 Select to return only the columns listed above from the AWS S3 Bucket, rather than downloading every column
+    # AWS S3 Select is only available to AWS accounts that were already using it before July 2024
+        # Set to False to download the entire file and only parse the columns listed above
+s3_use_select = False
+
+# The SQL query that AWS S3 Select runs against the file within the AWS S3 Bucket
+    # The column names are taken from the header row of the file
+s3_select_expression = "SELECT " + ", ".join(f's."{column}"' for column in s3_file_columns or []) + " FROM S3Object s"
+
+# The options used to read the file within the AWS S3 Bucket into a Pandas DataFrame
+    # AWS S3 Select returns only the columns listed above, without a header row
+        # Without AWS S3 Select, the entire file is downloaded but only the columns listed above are parsed
+            # Without any columns listed above, every column is parsed and the first column is used as the index of the Pandas DataFrame
+if s3_file_columns and s3_use_select:
+
+    s3_read_csv_options = {"header": None, "names": list(s3_file_columns), "dtype": s3_file_columns}
+
+elif s3_file_columns:
+
+    s3_read_csv_options = {"usecols": list(s3_file_columns), "dtype": s3_file_columns}
+
+else:
+
+    s3_read_csv_options = {"index_col": 0}
+
+# The compression codec for each compressed file extension within the AWS S3 Bucket
+    # Compressed files are decompressed as they are read, so the file is never fully decompressed in memory or on disk
+        # Files without one of these file extensions are identified by their first few bytes instead
+s3_compression_extensions = {
+    ".gz": "gzip"
+    ,".gzip": "gzip"
+    ,".bz2": "bz2"
+    ,".zst": "zstd"
+    ,".zstd": "zstd"
+}
+
+# The file extensions of files within the AWS S3 Bucket that are not compressed
+    # Files with one of these file extensions are not read to identify their compression codec
+s3_uncompressed_extensions = (".csv", ".txt", ".tsv")
+
+# The compression codec for the first few bytes (magic bytes) that each compression codec writes at the beginning of a compressed file
+s3_compression_magic_bytes = {
+    b"\x1f\x8b": "gzip"
+    ,b"BZh": "bz2"
+    ,b"\x28\xb5\x2f\xfd": "zstd"
+}
+
+# The AWS S3 Select compression type for each compression codec
+    # AWS S3 Select does not support zstd compressed files
+s3_select_compression_types = {
+    "gzip": "GZIP"
+    ,"bz2": "BZIP2"
+}
+
+# The method used to load the file(s) within the AWS S3 Bucket into the Snowflake data warehouse
+    # "PANDAS" downloads the file(s) into a Pandas DataFrame and loads the Pandas DataFrame into the Snowflake data warehouse using write_pandas
+    # "COPY_INTO" loads the file(s) straight from the AWS S3 Bucket into the Snowflake data warehouse, using COPY INTO and the external stage below
+        # The file(s) are never downloaded into Python, which is much faster when no Python transformation is needed
+            # The columns of the file(s) must match the columns of the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, as s3_file_columns is not used
+s3_load_method = "PANDAS"
+
+# The Snowflake external stage that points to the AWS S3 Bucket
+    # Created in the "Snowflake SQL Queries Template.sql" file
+        # The stage URL must point to the root of the AWS S3 Bucket, so that the file names within the stage match the file names within the AWS S3 Bucket
+s3_stage_name = "DB_KKF_MAIN.PUBLIC.STG_AWS_S3_CSV_COMMA"
+
+# Move the file(s) into the archive folder within the AWS S3 Bucket, once they have been loaded into the Snowflake data warehouse
+    # This keeps the folder(s) that are listed by the data pipeline small, so that listing the files stays fast
+        # Set to False to leave the file(s) where they are
+s3_archive_enabled = False
+
+# The folder within the AWS S3 Bucket that the file(s) are moved into
+    # The file name, including its date partition folders, is kept inside of the archive folder, such as <Archive_Folder_Name>/<Folder_Name>/2024/01/31/<File_Name>.csv
+        # Must be outside of the s3_folder_name folder, so that the archived file(s) are not listed by the data pipeline
+s3_archive_folder_name = "<Archive_Folder_Name>"
+
+# The dictionary collects the name of the files within each date partition of the AWS S3 Bucket, in date order
+    # Only the files within the date partitions are extracted
+        # If a date partition does not exist, the data pipeline will not try to extract any file for the date
             # This will prevent the data pipeline from failing
-s3_file_list = []
+s3_partition_files = {}
 
 # The list will consolidate all S3 csv files
     # Consolidating all S3 csv files into a list, then converting the entire list into a DataFrame
@@ -142,6 +279,43 @@ today = datetime.now()
     # 1 time per day that you would like to pull data for
 days_passed = (today - start_date).days - <Number of day offset>
 
+# The number of files that are extracted from the AWS S3 Bucket at the same time
+    # Each file is extracted and loaded into a Pandas DataFrame by its own thread
+        # Set to 1 to extract the files one at a time
+s3_max_workers = 16
+
+# Write each extracted file into a local Parquet part file, as soon as it is extracted from the AWS S3 Bucket
+    # This prevents the entire history from being held in memory, as the part files are loaded into the Snowflake data warehouse in Step 9 using PUT and COPY INTO
+        # Only used by the PANDAS load method, as the COPY_INTO load method never extracts the files
+            # Set to True when the extracted files are too large to be held in memory at the same time
+                # The default of False consolidates all of the extracted files in memory into the df_concat Pandas DataFrame, using pd.concat, and loads it with write_pandas
+s3_spill_enabled = False
+
+# The local folder that the Parquet part files are written into
+    # A new temporary folder is created in Step 6, only if s3_spill_enabled is set to True and the PANDAS load method is being used
+        # The folder is deleted once the data pipeline has finished with it, even if loading the part files into the Snowflake data warehouse fails
+s3_spill_path = None
+
+# The folder within the table stage of the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table that the local Parquet part files are uploaded into
+    # Named after the local folder in Step 6, so each run uploads into and loads from its own folder
+        # Part files left in the table stage by an earlier run that failed before they were purged are never loaded again
+s3_spill_stage_path = None
+
+# The number of local Parquet part files that the PUT command uploads into the Snowflake table stage at the same time
+    # Snowflake allows 1 to 99, the Snowflake default is 4
+s3_put_parallel = 8
+
+# The list collects the path of each local Parquet part file, in date order
+s3_part_files = []
+
+# The number of rows written into the local Parquet part files
+    # A part file is still written for a file that only contains a header, so this decides whether any data was extracted, rather than the number of part files
+s3_part_rows = 0
+
+# The dictionary collects the error for each file that failed to be extracted from the AWS S3 Bucket
+    # A failed file does not stop the remaining files from being extracted
+s3_failed_files = {}
+
 
 ##############################################################################################################
 # Step 4: Connect to the AWS S3 Bucket
@@ -156,454 +330,821 @@ s3 = boto3.resource(
     ,region_name = aws_region_name
     ,aws_access_key_id = s3_access_id
     ,aws_secret_access_key = s3_secret_access_key
+    # Keep 1 open connection per thread, rather than the default of 10 open connections
+    ,config = Config(max_pool_connections = s3_max_workers)
 )
 
+# The AWS S3 client that sits underneath the AWS S3 resource
+    # The AWS S3 client can be shared between threads, while the AWS S3 resource can not
+s3_client = s3.meta.client
+
+
+# Identify the compression codec of the file within the AWS S3 Bucket
+    # The compression codec is identified by the file extension
+        # The first 4 bytes of the file are only downloaded if the file extension does not identify whether the file is compressed
+            # Returns None if the file is not compressed
+def detect_s3_file_compression(s3_file_name):
+
+    # Identify the compression codec by the file extension
+    for s3_compression_extension, s3_compression_codec in s3_compression_extensions.items():
+
+        if s3_file_name.lower().endswith(s3_compression_extension):
+
+            return s3_compression_codec
+
+    # Files with an uncompressed file extension are not compressed
+    if s3_file_name.lower().endswith(s3_uncompressed_extensions):
+
+        return None
+
+    # Identify the compression codec by the first 4 bytes of the file
+        # Range only downloads the first 4 bytes, rather than the entire file
+            # An empty file has no bytes to download, which returns a 416 InvalidRange error, so the file is treated as not compressed
+    try:
+
+        s3_file_magic_bytes = s3_client.get_object(Bucket = s3_bucket, Key = s3_file_name, Range = "bytes=0-3")['Body'].read()
+
+    except ClientError as s3_file_error:
+
+        if s3_file_error.response["Error"]["Code"] != "InvalidRange":
+
+            raise
+
+        return None
+
+    for s3_compression_magic_byte, s3_compression_codec in s3_compression_magic_bytes.items():
+
+        if s3_file_magic_bytes.startswith(s3_compression_magic_byte):
+
+            return s3_compression_codec
+
+    return None
+
+
+# Copy a single file into the archive folder within the AWS S3 Bucket, without downloading it
+    # The file is copied by AWS S3 itself (server-side copy)
+        # Files larger than 8 MB are copied in parts at the same time (multipart copy), as a single copy request is limited to 5 GB
+def copy_s3_file_to_archive(s3_file_name):
+
+    s3_client.copy(
+        CopySource = {"Bucket": s3_bucket, "Key": s3_file_name}
+        ,Bucket = s3_bucket
+        ,Key = f"{s3_archive_folder_name}/{s3_file_name}"
+    )
+
+
+# Move files into the archive folder within the AWS S3 Bucket, without downloading them
+    # The files are copied into the s3_archive_folder_name folder at the same time, using a pool of threads
+    # The original files are then deleted, 1000 files per delete request, which is the most that AWS S3 allows
+        # Only the files that were copied successfully are deleted
+            # Returns the files that were moved into the archive folder
+def archive_s3_files(s3_file_names):
+
+    s3_archived_files = []
+
+    with ThreadPoolExecutor(max_workers = s3_max_workers) as s3_executor:
+
+        s3_archive_futures = {s3_file_name: s3_executor.submit(copy_s3_file_to_archive, s3_file_name) for s3_file_name in s3_file_names}
+
+        for s3_file_name, s3_archive_future in s3_archive_futures.items():
+
+            try:
+
+                s3_archive_future.result()
+
+            except Exception as s3_archive_error:
+
+                print(f"Failed to copy the {s3_file_name} file into the archive folder: {s3_archive_error}")
+
+                continue
+
+            s3_archived_files.append(s3_file_name)
+
+    # Delete the original files, 1000 files per delete request
+        # Quiet only returns the files that failed to be deleted
+    for i in range(0, len(s3_archived_files), 1000):
+
+        s3_delete_response = s3_client.delete_objects(
+            Bucket = s3_bucket
+            ,Delete = {"Objects": [{"Key": s3_file_name} for s3_file_name in s3_archived_files[i:i + 1000]], "Quiet": True}
+        )
+
+        for s3_delete_error in s3_delete_response.get("Errors", []):
+
+            print(f"Failed to delete the {s3_delete_error['Key']} file after archiving it: {s3_delete_error['Message']}")
+
+    return s3_archived_files
+
+
+# Load files within the AWS S3 Bucket into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table straight from the Snowflake external stage, up to 1000 files per COPY INTO statement
+    # FROM points at the s3_copy_folder folder within the external stage, and FILES lists each file by its name within that folder
+        # Snowflake only reads the listed files, rather than listing every file within the AWS S3 Bucket and matching each one against a PATTERN
+            # 1000 is the most files that FILES allows within a single COPY INTO statement
+    # FORCE = TRUE loads the file(s) even if Snowflake has already loaded them within the last 64 days, as the table is truncated before the file(s) are loaded
+def copy_s3_files_into_snowflake(cur, s3_copy_folder, s3_copy_files):
+
+    for i in range(0, len(s3_copy_files), 1000):
+
+        # The name of each file within the s3_copy_folder folder, as a Snowflake string
+            # Backslashes and single quotes are escaped, because Snowflake treats them as special characters within a string
+        s3_copy_file_names = ", ".join(
+            "'" + s3_copy_file[len(s3_copy_folder):].replace("\\", "\\\\").replace("'", "''") + "'"
+            for s3_copy_file in s3_copy_files[i:i + 1000]
+        )
+
+        cur.execute(f"""
+            COPY INTO DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>
+                FROM @{s3_stage_name}/{s3_copy_folder}
+                FILES = ({s3_copy_file_names})
+                FORCE = TRUE
+            ;
+        """)
+
 
 ##############################################################################################################
-# Step 5: Collect a list of file names for all files within the AWS S3 Bucket
+# Step 5: Collect a list of file names for the files within each date partition of the AWS S3 Bucket
 ##############################################################################################################
 
 
-# Loop through each file within the AWS S3 Bucket
-for s3_bucket_file in s3.Bucket(s3_bucket).objects.all():
+# The date of each file within the AWS S3 Bucket that you would like to extract
+    # 1 date per day that you would like to pull data for, from the date set in the start_date variable until the current date - 3 days
+        # The dates are sorted from oldest to newest, so the files are consolidated in date order in Step 7
+s3_file_dates = sorted(today - timedelta(days = 3 + i) for i in range(days_passed))
+
+
+# Build the folder path (prefix) of the date partition within the AWS S3 Bucket for a single date
+def build_s3_partition_prefix(s3_file_date):
+
+    return s3_partition_prefixes[s3_partition_layout].format(
+        s3_folder_name = s3_folder_name
+        # The year part of the date partition within the AWS S3 Bucket
+        ,s3_file_year = s3_file_date.strftime("%Y")
+        # The month part of the date partition within the AWS S3 Bucket
+        ,s3_file_month = s3_file_date.strftime("%m")
+        # The day part of the date partition within the AWS S3 Bucket
+        ,s3_file_day = s3_file_date.strftime("%d")
+    )
+
+
+# Collect the name of the files within the date partition of the AWS S3 Bucket for a single date
+    # Only the files that begin with the prefix of the date partition are listed, rather than every file within the AWS S3 Bucket
+        # The paginator requests the next page of up to 1000 file names until every file name within the date partition has been listed
+def list_s3_partition_files(s3_file_date):
+
+    s3_partition_prefix = build_s3_partition_prefix(s3_file_date)
+
+    s3_partition_keys = []
+
+    for s3_list_page in s3_client.get_paginator("list_objects_v2").paginate(Bucket = s3_bucket, Prefix = s3_partition_prefix):
+
+        for s3_bucket_file in s3_list_page.get("Contents", []):
+
+            # Keep only the files that begin with file_name and end with s3_file_extension
+                # This skips any folder markers and marker files, such as _SUCCESS, within the date partition
+            s3_partition_file_name = s3_bucket_file["Key"][len(s3_partition_prefix):]
+
+            if s3_partition_file_name.startswith(file_name) and s3_partition_file_name.endswith(f".{s3_file_extension}"):
+
+                s3_partition_keys.append(s3_bucket_file["Key"])
 
-    # Display all of the file names within the AWS S3 Bucket
-        # Comment Out once the files have been verified
-    # print()
-    # print(s3_bucket_file.key)
+    return sorted(s3_partition_keys)
 
-    # Collect the name of each file within the AWS S3 Bucket
-    s3_file_list.append(s3_bucket_file.key)
+
+# List the date partitions for multiple dates at the same time, using a pool of threads
+    # The pool of threads closes automatically after the with block is exited, once every date partition has been listed
+with ThreadPoolExecutor(max_workers = s3_max_workers) as s3_executor:
+
+    # Loop through the dates in date order, collecting the name of the files within each date partition
+        # Dates without a date partition, or without any matching files, are skipped
+    for s3_file_date, s3_partition_keys in zip(s3_file_dates, s3_executor.map(list_s3_partition_files, s3_file_dates)):
+
+        if s3_partition_keys:
+
+            s3_partition_files[s3_file_date] = s3_partition_keys
 
 """
-# Display all of the files within the AWS S3 Bucket
+# Display the files within each date partition of the AWS S3 Bucket
     # Comment Out once the files have been verified
 print()
 print("AWS S3 Bucket Files:")
 print()
-print(s3_file_list)
+
+for s3_file_date, s3_partition_keys in s3_partition_files.items():
+
+    print(s3_file_date.strftime("%Y-%m-%d"), s3_partition_keys)
 """
 
 
 ##############################################################################################################
-# Step 6: Extract and Load the data from the file within the AWS S3 Bucket
+# Step 6: Extract and Load the data from the files within the AWS S3 Bucket
 ##############################################################################################################
 
 
-# Loop through the S3 bucket, once per day that we would like to pull data for
-for i in range(days_passed) and today >= datetime.strptime("<Oldest Date you want data for>", "%Y-%m-%d"):
+# The files within the AWS S3 Bucket that exist for the dates above, in date order
+    # Used by the COPY_INTO load method, which loads these files straight from the AWS S3 Bucket in Step 9
+s3_copy_files = [s3_file_name for s3_partition_keys in s3_partition_files.values() for s3_file_name in s3_partition_keys]
 
-    # The date that the GET request is being executed
-        # The date the data pipeline is executed
-    file_date = today.strftime("%Y%m%d")
 
-    # The year part of the file name within the AWS S3 Bucket
-    s3_file_year = (today - timedelta(days = 3)).strftime("%Y")
+# Extract and load the data from a single file within the AWS S3 Bucket
+    # Each thread within the pool of threads below runs this function for 1 file at a time
+def extract_s3_file(s3_file_date, s3_file_name, s3_file_number):
 
-    # The month part of the file name within the AWS S3 Bucket
-    s3_file_month = (today - timedelta(days = 3)).strftime("%m")
+    # The compression codec of the file within the AWS S3 Bucket
+    s3_file_compression = detect_s3_file_compression(s3_file_name)
 
-    # The day part of the file name within the AWS S3 Bucket
-    s3_file_day = (today - timedelta(days = 3)).strftime("%d")
+    # Extract only the columns listed in s3_file_columns from the file within the AWS S3 Bucket, if AWS S3 Select IS being used
+    if s3_file_columns and s3_use_select:
 
-    # The file within the AWS S3 Bucket that you would like to extract
-    s3_file_name = f"{file_name}.{s3_file_extension}"
+        # AWS S3 Select does not support zstd compressed files, which would otherwise be read as if they were not compressed
+            # The file is added to the failed files, rather than loading unreadable rows
+        if s3_file_compression is not None and s3_file_compression not in s3_select_compression_types:
 
-    # Verify if the desired file name exists within the AWS S3 Bucket
-        # If the file exists within the AWS S3 Bucket, extaract the file
-    if s3_file_name in s3_file_list:
+            raise ValueError(f"AWS S3 Select does not support {s3_file_compression} compressed files, set s3_use_select to False to load the {s3_file_name} file")
 
-        # Extract the data from the file within the AWS S3 Bucket
-        s3_file = s3.Bucket(s3_bucket).Object(s3_file_name).get()
+        # Run the AWS S3 Select SQL query against the file within the AWS S3 Bucket
+        s3_file_select = s3_client.select_object_content(
+            Bucket = s3_bucket
+            ,Key = s3_file_name
+            ,ExpressionType = "SQL"
+            ,Expression = s3_select_expression
+            ,InputSerialization = {"CSV": {"FileHeaderInfo": "USE"}, "CompressionType": s3_select_compression_types.get(s3_file_compression, "NONE")}
+            ,OutputSerialization = {"CSV": {}}
+        )
 
-        # Load the data from s3_file into the df Pandas DataFrame
-        df = pd.read_csv(s3_file['Body'], index_col = 0)
+        # AWS S3 Select decompresses the file before returning the rows
+        s3_file_compression = None
 
-        """
-        # Verify if there is any data within the df Pandas DataFrame
-            # Comment out once the data has been verified
-        if not df.empty:
+        # Collect the rows returned by AWS S3 Select
+            # The rows are kept in memory up to 100 MB and written to a temporary file on disk after that
+        s3_file_body = tempfile.SpooledTemporaryFile(max_size = 100 * 1024 * 1024)
+
+        for s3_select_event in s3_file_select["Payload"]:
+
+            # The AWS S3 Select response also contains progress and stats events, which do not contain any rows
+            if "Records" in s3_select_event:
+
+                s3_file_body.write(s3_select_event["Records"]["Payload"])
+
+        # Move back to the beginning of the rows, so they can be read into a Pandas DataFrame
+        s3_file_body.seek(0)
+
+    # Extract the data from the file within the AWS S3 Bucket, if AWS S3 Select is NOT being used
+    else:
+
+        s3_file_body = s3_client.get_object(Bucket = s3_bucket, Key = s3_file_name)['Body']
+
+    # Load the data from the file within the AWS S3 Bucket into a Pandas DataFrame
+    df = pd.read_csv(s3_file_body, compression = s3_file_compression, **s3_read_csv_options)
+
+    # Return the Pandas DataFrame, if the extracted files are NOT being written into local Parquet part files
+    if s3_spill_path is None:
+
+        return df
+
+    # Write the Pandas DataFrame into a local Parquet part file, then return the path of the part file and its number of rows
+        # The part file is named after the position of the file in the list of files being extracted, so files with the same name in different folders never overwrite each other
+            # The Pandas DataFrame is released from memory as soon as this function returns
+                # The index is not written, the same as write_pandas does not load the index into the Snowflake data warehouse
+    s3_part_file = os.path.join(s3_spill_path, f"{s3_file_number:06d}_{s3_file_date.strftime('%Y%m%d')}_{os.path.basename(s3_file_name)}.parquet")
+
+    df.to_parquet(s3_part_file, index = False)
+
+    return s3_part_file, len(df)
+
+
+# The local Parquet part files are deleted in the finally block below, once the data pipeline has finished with them
+    # The try block starts before the local folder is created, so the folder is deleted even when extracting the files fails
+        # This includes when no data was extracted, or when loading the data into the Snowflake data warehouse fails
+try:
+
+    # Extract the files, if the PANDAS load method IS being used
+        # The COPY_INTO load method loads the files straight from the AWS S3 Bucket in Step 9
+    if s3_load_method == "PANDAS":
 
-            print("The df Pandas DataFrame contains data:")
+        # Create the local folder for the Parquet part files, if the extracted files ARE being written into local Parquet part files
+        if s3_spill_enabled:
+
+            s3_spill_path = tempfile.mkdtemp(prefix = "s3_backfill_")
+
+            s3_spill_stage_path = f"@DB_KKF_MAIN.TRANSIENT.%<TRANSIENT_TABLE_NAME>/{os.path.basename(s3_spill_path)}"
+
+        # Extract every file within every date partition at the same time, using a pool of threads
+            # The pool of threads closes automatically after the with block is exited, once every file has been extracted
+        with ThreadPoolExecutor(max_workers = s3_max_workers) as s3_executor:
+
+            # Submit 1 task per file to the pool of threads, in date order
+                # Only s3_max_workers tasks run at the same time, the remaining tasks wait for a thread to become available
+                    # Each file is numbered by its position, which names its local Parquet part file
+            s3_file_futures = {
+                s3_file_name: s3_executor.submit(extract_s3_file, s3_file_date, s3_file_name, s3_file_number)
+                for s3_file_number, (s3_file_date, s3_file_name) in enumerate(
+                    (s3_file_date, s3_file_name)
+                    for s3_file_date, s3_partition_keys in s3_partition_files.items()
+                    for s3_file_name in s3_partition_keys
+                )
+            }
+
+            # Loop through the tasks in date order, waiting for each task to complete
+            for s3_file_name, s3_file_future in s3_file_futures.items():
+
+                # Collect the Pandas DataFrame, or the path and number of rows of the local Parquet part file, for the file
+                    # If the file failed to be extracted, record the error and move on to the next file
+                try:
+
+                    s3_file_result = s3_file_future.result()
+
+                except Exception as s3_file_error:
+
+                    s3_failed_files[s3_file_name] = s3_file_error
+
+                    continue
+
+                # Append each local Parquet part file into the s3_part_files list and count its rows, if the extracted files ARE being written into local Parquet part files
+                if s3_spill_path:
+
+                    s3_part_file, s3_part_file_rows = s3_file_result
+
+                    s3_part_files.append(s3_part_file)
+
+                    s3_part_rows += s3_part_file_rows
+
+                # Append each S3 csv file into the all_data list to consolidate all of the S3 csv files that are being extracted from S3
+                else:
+
+                    all_data.append(s3_file_result)
+
+        # Display the files that failed to be extracted from the AWS S3 Bucket
+            # These files can be extracted again by setting the start_date variable and the day offset to cover only the dates of the failed files
+        if s3_failed_files:
+
+            print()
+            print("The following files failed to be extracted from the AWS S3 Bucket:")
             print()
-            print(df)
 
-        else:
+            for s3_failed_file, s3_file_error in s3_failed_files.items():
 
-            print("The df Pandas DataFrame is empty")
-        """
-    
-        # Append each S3 csv file into the all_data list to consolidate all of the S3 csv files that are being extracted from S3
-        all_data.append(df)
+                print(f"{s3_failed_file}: {s3_file_error}")
 
-    # Adjust the date value in the today variable to subtract 1 day from the variable
-        # This allowas us to look at and extract the S3 csv file for the next previous day
-            # 1 day will be subtracted from the today variable after each S3 csv file is extracted until the end of the for loop
-                # This allows us to extract the S3 csv file for each day from the date set in the start_date variable until the current date - 3 days
-    today = today - timedelta(days = 1)
 
+    ##############################################################################################################
+    # Step 7: Consolidate all csv files in the all_date List into 1 Pandas Dataframe, unless they were written into local Parquet part files
+    ##############################################################################################################
 
-##############################################################################################################
-# Step 7: Consolidate all csv files in the all_date List into 1 Pandas Dataframe
-##############################################################################################################
 
+    # Verify whether any data was extracted from the AWS S3 Bucket, which decides whether Step 8 and Step 9 are executed
+        # The local Parquet part files are loaded into the Snowflake data warehouse in Step 9 without being consolidated, if the extracted files ARE being written into local Parquet part files
+    if s3_load_method == "PANDAS" and s3_spill_path:
 
-# Concat all of the separate S3 csv files into a formal Pandas DataFrame
-df_concat = pd.concat(all_data)
+        s3_data_found = s3_part_rows > 0
 
-"""
-# Verify if there is any data within the all_data Pandas DataFrame
-    # Comment out once the data has been verified
-print()
-print("The df_concat Pandas DataFrame contains data:")
-print()
-print(df_concat)
-"""
+    # Concat all of the separate S3 csv files into a formal Pandas DataFrame, if the PANDAS load method IS being used
+        # pd.concat fails on an empty list, so every file must have failed to be extracted, or every date partition must be empty, for all_data to be empty
+    elif s3_load_method == "PANDAS" and all_data:
 
+        df_concat = pd.concat(all_data)
 
-##############################################################################################################
-# Step 8: Select the Columns to Keep from the df Pandas DataFrame and load the data into the df_subset Pandas DataFrame
-##############################################################################################################
+        s3_data_found = not df_concat.empty
 
+    # No file was extracted from the AWS S3 Bucket, if the PANDAS load method IS being used and the all_data list is empty
+    elif s3_load_method == "PANDAS":
 
-"""
-# Display the columns within the df_concat Pandas DataFrame
-    # This will allow you to identify the columns within the dataset
-        # This allows you to be able to remove any unecessary columns, using df_subset below, from the dataset before loading into Snowflake
-print()
-print("Here are all of the columns within the df_concat Pandas DataFrame")
-print()
-print(df_concat.columns)
-"""
+        s3_data_found = False
 
-# Verify if the df_subset Pandas DataFrame contains data
-# Verify if the df_concat Pandas DataFrame contains data
-    # If the df_subset Pandas DataFrame contains data, load the data into Snowflake
-#if not df_subset.empty:
-if not df_concat.empty:
-    """
-    # Select the desired columns to keep from the df Pandas DataFrame
-        # This method is used to remove any unwanted data that was extracted from the file within the AWS S3 Bucket
-            # This is similar to the SELECT clause in SQL
-    df_subset = df_concat[
-        [
-            '<Column_1>'
-            ',<Column_2>'
-            ,'<Column_...N>'
-        ]
-    ]
-    """
+    # The files are loaded straight from the AWS S3 Bucket in Step 9, if the COPY_INTO load method IS being used
+    else:
+
+        s3_data_found = len(s3_copy_files) > 0
+
+    # Display a message that nothing will be loaded into the Snowflake data warehouse, if no data was extracted from the AWS S3 Bucket
+        # Step 8 and Step 9 are skipped, rather than failing the data pipeline
+    if not s3_data_found:
+
+        print()
+        print(f"No data was extracted from the AWS S3 Bucket for the {len(s3_file_dates)} date(s) being extracted")
+        print(f"{len(s3_partition_files)} date partition(s) contained files and {len(s3_failed_files)} file(s) failed to be extracted")
 
     """
-    # Verify if there is any data within the df_subset Pandas DataFrame
+    # Verify if there is any data within the all_data Pandas DataFrame
         # Comment out once the data has been verified
-    if not df_subset.empty:
+    print()
+    print("The df_concat Pandas DataFrame contains data:")
+    print()
+    print(df_concat)
+    """
 
-        print('The df_subset Pandas DataFrame contains data:')
-        print()
-        print(df_subset)
 
-    else:
+    ##############################################################################################################
+    # Step 8: Select the Columns to Keep from the df Pandas DataFrame and load the data into the df_subset Pandas DataFrame
+    ##############################################################################################################
+
 
-        print('The df_subset Pandas DataFrame is empty')
     """
+    # Display the columns within the df_concat Pandas DataFrame
+        # This will allow you to identify the columns within the dataset
+            # This allows you to be able to remove any unecessary columns, using df_subset below, from the dataset before loading into Snowflake
+    print()
+    print("Here are all of the columns within the df_concat Pandas DataFrame")
+    print()
+    print(df_concat.columns)
+    """
+
+    if s3_data_found:
+        """
+        # Select the desired columns to keep from the df Pandas DataFrame
+            # This method is used to remove any unwanted data that was extracted from the file within the AWS S3 Bucket
+                # This is similar to the SELECT clause in SQL
+                    # Not needed when s3_file_columns is set in Step 3, as only those columns are read from the file within the AWS S3 Bucket
+        df_subset = df_concat[
+            [
+                '<Column_1>'
+                ',<Column_2>'
+                ,'<Column_...N>'
+            ]
+        ]
+        """
 
+        """
+        # Verify if there is any data within the df_subset Pandas DataFrame
+            # Comment out once the data has been verified
+        if not df_subset.empty:
 
-    ####################################################################################################
-    # Step 9: Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse
-        # Setup the credentials to connect to the Snowflake data warehouse
-        # Connect to the Snowflake data warehouse
-        # Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse table
-        # Establish the cur cursor
-            # Assign the proper values for the following Snowflake objects:
-                # Role
-                # Warehouse
-                # Database
-            # Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
-            # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
-            # Transform and load the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
-            # Merge the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.GRUBHUB.FACT_ORDER table
-            # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
-    ####################################################################################################
-
-
-    # The connection to the Snowflake data warehouse closes automatically after the with block is exited
-        # Therefore, no need for the dw_conn.close() command
-    with snowflake.connector.connect(
-        # The username should be tied to a service account, rather than and specific individual
-        user = "<Snowflake_User_Name>"
-        # The password should be tied to a service account, rather than and specific individual
-        ,password = "<Snowflake_User_Password>"
-        # The account consists of 3 parts separated by a decimal (".")
-            # Part 1: Snowflake account identifier
-            # Part 2: Snowflake cloud region
-            # Part 3: Snowflake cloud provider
-        ,account = "<Snowflake_Account_Identifier>.<Snowflake_Cloud_Region>.<Snowflake_Cloud_Provider>"
-        # The Snowflake warehouse that will be used to write the data into Snowflake
-        ,warehouse = "<Snowflake_Warehouse_Name>"
-        # The Snowflake database where the data will be written into
-        ,database = "<Snowflake_Database_Name>"
-    ) as dw_conn:
+            print('The df_subset Pandas DataFrame contains data:')
+            print()
+            print(df_subset)
 
+        else:
 
-        ####################################################################################################
-        # Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse table
-        ####################################################################################################
+            print('The df_subset Pandas DataFrame is empty')
+        """
 
-        
-        write_pandas(
-            conn = dw_conn
-            # Use df = df_subset, if you ARE using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
-            # ,df = df_subset
-            # Use df = df_concat, if you are NOT using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
-            ,df = df_concat
-            ,table_name = "<Snowflake_Table_Name>"
-            ,schema = "<Snowflake_Schema_Name>"
-            # When set to False, no new table is created in Snowflake from the df_subset Pandas DataFrame
-                # If set to True, a new table will be created in Snowflake from the df_subset Pandas DataFrame
-            ,auto_create_table = False
-            # When set to False, no quotes are added to each column value
-                # When set to True, quotes are added to each column value
-                    # If the data already contains quotes, set to False
-                        # Quotes can be added to column values if working with csv files, which ensures the csv data is not parsed incorrecty
-            ,quote_identifiers = False
-            # The default value is False,
-            # which appends that data from the df_subset Pandas DataFrame to the end of the existing Snowflake table
-                # When overwrite and auto_create_table are both set to True,
-                # the Snowflake table is truncated before the data from the df_subset Pandas DataFrame is loaded into the Snowflake table
-                    # When overwrite is set to True and auto_create_table is set to False,
-                    # the Snowflake table is dropped and then recreated with the data from the df_subset Pandas DataFrame
-            ,overwrite = True
-        )
-        
 
         ####################################################################################################
-        # Establish a cursor
+        # Step 9: Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse
+            # Setup the credentials to connect to the Snowflake data warehouse
+            # Connect to the Snowflake data warehouse
+            # Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse table
+            # Establish the cur cursor
+                # Assign the proper values for the following Snowflake objects:
+                    # Role
+                    # Warehouse
+                    # Database
+                # Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+                # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
+                # Transform and load the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.PERSISTED.GRUBHUB_ORDER_DAILY table
+                # Merge the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.GRUBHUB.FACT_ORDER table
+                # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
         ####################################################################################################
 
 
-        # Setup a cursor in order to execute SQL queries to retrieve data from the Snowflake data warehouse
-        with dw_conn.cursor() as cur:
+        # The connection to the Snowflake data warehouse closes automatically after the with block is exited
+            # Therefore, no need for the dw_conn.close() command
+        with snowflake.connector.connect(
+            # The username should be tied to a service account, rather than and specific individual
+            user = "<Snowflake_User_Name>"
+            # The password should be tied to a service account, rather than and specific individual
+            ,password = "<Snowflake_User_Password>"
+            # The account consists of 3 parts separated by a decimal (".")
+                # Part 1: Snowflake account identifier
+                # Part 2: Snowflake cloud region
+                # Part 3: Snowflake cloud provider
+            ,account = "<Snowflake_Account_Identifier>.<Snowflake_Cloud_Region>.<Snowflake_Cloud_Provider>"
+            # The Snowflake warehouse that will be used to write the data into Snowflake
+            ,warehouse = "<Snowflake_Warehouse_Name>"
+            # The Snowflake database where the data will be written into
+            ,database = "<Snowflake_Database_Name>"
+        ) as dw_conn:
 
 
             ####################################################################################################
-            # Test the connection to Snowflake
-                # Comment out once the connection has been verified
+            # Load the data from the df_subset Pandas DataFrame into the Snowflake data warehouse table
             ####################################################################################################
 
-            
-            """
-            # Write and execute the SQL query that will return the current version of the Snowflake data warehouse
-                # Identifying the current version of the Snowflake data warehouse ensures a successful connection to the Snowflake data warehouse
-            cur.execute('''
-                SELECT current_version()
-            ''')
 
-            # Fetch the first row/record from the SQL query above
-            one_row = cur.fetchone()
-            
-            # Display the first row/record from the SQL query above
-            print(one_row[0])
-            """
+            # Load the file(s) straight from the AWS S3 Bucket, if the COPY_INTO load method IS being used
+            if s3_load_method == "COPY_INTO":
+
+                with dw_conn.cursor() as cur:
+
+                    # Truncate the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, the same as overwrite = True does for write_pandas below
+                    cur.execute("""
+                        TRUNCATE TABLE DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>;
+                    """)
+
+                    # Load every file from the s3_folder_name folder within the external stage into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+                        # Every date partition is within the s3_folder_name folder, so each file is listed by its date partition and name within that folder
+                    copy_s3_files_into_snowflake(cur, f"{s3_folder_name}/", s3_copy_files)
+
+            # Load the local Parquet part files, if the extracted files ARE being written into local Parquet part files
+                # Only 1 part file is ever read into memory at a time, by the PUT command below
+            elif s3_spill_path:
+
+                with dw_conn.cursor() as cur:
+
+                    # Truncate the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, the same as overwrite = True does for write_pandas below
+                    cur.execute("""
+                        TRUNCATE TABLE DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>;
+                    """)
+
+                    # Upload every local Parquet part file into the folder for this run within the table stage of the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+                        # PARALLEL sets the number of part files uploaded at the same time
+                    cur.execute(f"""
+                        PUT 'file://{s3_spill_path}/*.parquet' {s3_spill_stage_path}/
+                            PARALLEL = {s3_put_parallel}
+                            OVERWRITE = TRUE
+                        ;
+                    """)
+
+                    # Load every part file from the folder for this run within the table stage into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+                        # MATCH_BY_COLUMN_NAME loads each Parquet column into the table column with the same name, the same as write_pandas does
+                            # PURGE = TRUE removes the part files from the table stage once they have been loaded
+                    cur.execute(f"""
+                        COPY INTO DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>
+                            FROM {s3_spill_stage_path}/
+                            FILE_FORMAT = (TYPE = PARQUET)
+                            MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+                            PURGE = TRUE
+                        ;
+                    """)
+
+            # Load the file(s) through the Pandas DataFrame, if the PANDAS load method IS being used
+            else:
+
+                write_pandas(
+                    conn = dw_conn
+                    # Use df = df_subset, if you ARE using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
+                    # ,df = df_subset
+                    # Use df = df_concat, if you are NOT using df_subset to remove specific columns from the S3 csv files before loading the data into Snowflake
+                    ,df = df_concat
+                    ,table_name = "<Snowflake_Table_Name>"
+                    ,schema = "<Snowflake_Schema_Name>"
+                    # When set to False, no new table is created in Snowflake from the df_subset Pandas DataFrame
+                        # If set to True, a new table will be created in Snowflake from the df_subset Pandas DataFrame
+                    ,auto_create_table = False
+                    # When set to False, no quotes are added to each column value
+                        # When set to True, quotes are added to each column value
+                            # If the data already contains quotes, set to False
+                                # Quotes can be added to column values if working with csv files, which ensures the csv data is not parsed incorrecty
+                    ,quote_identifiers = False
+                    # The default value is False,
+                    # which appends that data from the df_subset Pandas DataFrame to the end of the existing Snowflake table
+                        # When overwrite and auto_create_table are both set to True,
+                        # the Snowflake table is truncated before the data from the df_subset Pandas DataFrame is loaded into the Snowflake table
+                            # When overwrite is set to True and auto_create_table is set to False,
+                            # the Snowflake table is dropped and then recreated with the data from the df_subset Pandas DataFrame
+                    ,overwrite = True
+                )
 
 
             ####################################################################################################
-            # Assign the proper values for the following Snowflake object
-                # Role
-                # Warehouse
-                # Database
+            # Establish a cursor
             ####################################################################################################
 
-            
-            # Assume the <Snowflake_Role_Name> role
-            cur.execute("""
-                USE ROLE <Snowflake_Role_Name>;
-            """)
 
-            # Assume the <Snowflake_Warehouse_Name> ELT Production Warehouse
-            cur.execute("""
-                USE WAREHOUSE <Snowflake_Warehouse_Name>;
-            """)
+            # Setup a cursor in order to execute SQL queries to retrieve data from the Snowflake data warehouse
+            with dw_conn.cursor() as cur:
 
-            # Assume the <Snowflake_Database_Name> database
-            cur.execute("""
-                USE DATABASE <Snowflake_Database_Name>;
-            """)
-            
 
-            ####################################################################################################
-            # Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
-            ####################################################################################################
+                ####################################################################################################
+                # Test the connection to Snowflake
+                    # Comment out once the connection has been verified
+                ####################################################################################################
+
+
+                """
+                # Write and execute the SQL query that will return the current version of the Snowflake data warehouse
+                    # Identifying the current version of the Snowflake data warehouse ensures a successful connection to the Snowflake data warehouse
+                cur.execute('''
+                    SELECT current_version()
+                ''')
+
+                # Fetch the first row/record from the SQL query above
+                one_row = cur.fetchone()
+
+                # Display the first row/record from the SQL query above
+                print(one_row[0])
+                """
+
+
+                ####################################################################################################
+                # Assign the proper values for the following Snowflake object
+                    # Role
+                    # Warehouse
+                    # Database
+                ####################################################################################################
+
+
+                # Assume the <Snowflake_Role_Name> role
+                cur.execute("""
+                    USE ROLE <Snowflake_Role_Name>;
+                """)
+
+                # Assume the <Snowflake_Warehouse_Name> ELT Production Warehouse
+                cur.execute("""
+                    USE WAREHOUSE <Snowflake_Warehouse_Name>;
+                """)
+
+                # Assume the <Snowflake_Database_Name> database
+                cur.execute("""
+                    USE DATABASE <Snowflake_Database_Name>;
+                """)
+
+
+                ####################################################################################################
+                # Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+                ####################################################################################################
+
+
+                # Verify whether or not the <SNOWFLAKE_TASK_NAME> task exists within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                    # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake if it already exists
+                    # Insert the <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake if it does NOT already exist
+                cur.execute("""
+                    MERGE INTO DB_KKF_MAIN.AUTOMATION.TASK_LIST T
+
+                        USING
+                        (
+                            -- Assign the necessary values for each column
+                            SELECT
+                                '<SNOWFLAKE_TASK_NAME>' AS TASK_NAME
+                                ,'<SNOWFLAKE_TASK_DESCRIPTIONI>' AS TASK_DESCRIPTION
+                                ,'<SNOWFLAKE_TASK_FREQUENCY>' AS TASK_FREQUENCY
+                                ,'<SNOWFLAKE_TASK_DAY_OF_WEEK>' AS TASK_DAY_OF_WEEK
+                                ,'<SNOWFLAKE_TASK_TIME_OF_DAY>' AS TASK_TIME_OF_DAY
+                                ,NULL AS TASK_PREDECESSOR_NAME
+                                ,CURRENT_DATE() AS TASK_LAST_RUN_START_DATE
+                                ,TO_TIME(CONVERT_TIMEZONE('America/New_York', CURRENT_TIMESTAMP())) AS TASK_LAST_RUN_START_TIME_IN_EST
+                                ,NULL AS TASK_LAST_RUN_END_DATE
+                                ,NULL AS TASK_LAST_RUN_END_TIME_IN_EST
+                                ,NULL AS TASK_LAST_RUN_DURATION_IN_SECONDS
+                        ) S
+                        ON T.TASK_NAME = S.TASK_NAME
+
+                        -- Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                        -- Set the TASK_LAST_RUN_START_DATE & TASK_LAST_RUN_START_TIME_IN_EST with the current date and time in EST that the TASK started
+                        WHEN MATCHED
+
+                            THEN UPDATE SET
+                                T.TASK_LAST_RUN_START_DATE = S.TASK_LAST_RUN_START_DATE
+                                ,T.TASK_LAST_RUN_START_TIME_IN_EST = S.TASK_LAST_RUN_START_TIME_IN_EST
+
+                        -- Insert the <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                        WHEN NOT MATCHED
+
+                            THEN INSERT VALUES
+                            (
+                                S.TASK_NAME
+                                ,S.TASK_DESCRIPTION
+                                ,S.TASK_FREQUENCY
+                                ,S.TASK_DAY_OF_WEEK
+                                ,S.TASK_TIME_OF_DAY
+                                ,S.TASK_PREDECESSOR_NAME
+                                ,S.TASK_LAST_RUN_START_DATE
+                                ,S.TASK_LAST_RUN_START_TIME_IN_EST
+                                ,S.TASK_LAST_RUN_END_DATE
+                                ,S.TASK_LAST_RUN_END_TIME_IN_EST
+                                ,S.TASK_LAST_RUN_DURATION_IN_SECONDS
+                            )
+                    ;
+                """)
+
+
+                ####################################################################################################
+                # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+                ####################################################################################################
+
+
+                # Truncate tabe DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table so the data can be replace with updated data
+                cur.execute("""
+                    TRUNCATE TABLE DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>;
+                """)
+
+
+                ####################################################################################################
+                # Transform and load the review data into the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+                ####################################################################################################
+
+
+                # Extract the raw data from the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+                # Transform the raw data to make it more useable for reporting purposes
+                # Load the transformed data into the DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+                cur.execute("""
+                    INSERT INTO DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>
+
+                        SELECT DISTINCT
+                            UPPER(TRIM(COLUMN_NAME_1)) AS COLUMN_NAME_1
+                            ,TO_DATE(TRIM(COLUMN_NAME_2)) AS COLUMN_NAME_2
+                            ,TO_NUMBER(TRIM(COLUMN_NAME_...N), 10, 2) AS COLUMN_NAME_...N
+
+                        FROM DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>
+
+                        WHERE <WHERE_CLAUSE_LOGIC>
+                    ;
+                """)
+
+
+                ####################################################################################################
+                # Truncate the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+                ####################################################################################################
+
+
+                # Truncate tabe DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table so the data can be replace with updated data
+                cur.execute("""
+                    TRUNCATE TABLE DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME>;
+                """)
+
+
+                ####################################################################################################
+                # Transform and load the review data into the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+                ####################################################################################################
+
+
+                # Extract the raw data from the DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+                # Transform the raw data to make it more useable for reporting purposes
+                # Load the transformed data into the DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+                cur.execute("""
+                    INSERT INTO DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME>
 
-            
-            # Verify whether or not the <SNOWFLAKE_TASK_NAME> task exists within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
-                # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake if it already exists
-                # Insert the <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake if it does NOT already exist
-            cur.execute("""
-                MERGE INTO DB_KKF_MAIN.AUTOMATION.TASK_LIST T
-                    
-                    USING
-                    (
-                        -- Assign the necessary values for each column
                         SELECT
-                            '<SNOWFLAKE_TASK_NAME>' AS TASK_NAME
-                            ,'<SNOWFLAKE_TASK_DESCRIPTIONI>' AS TASK_DESCRIPTION
-                            ,'<SNOWFLAKE_TASK_FREQUENCY>' AS TASK_FREQUENCY
-                            ,'<SNOWFLAKE_TASK_DAY_OF_WEEK>' AS TASK_DAY_OF_WEEK
-                            ,'<SNOWFLAKE_TASK_TIME_OF_DAY>' AS TASK_TIME_OF_DAY
-                            ,NULL AS TASK_PREDECESSOR_NAME
-                            ,CURRENT_DATE() AS TASK_LAST_RUN_START_DATE
-                            ,TO_TIME(CONVERT_TIMEZONE('America/New_York', CURRENT_TIMESTAMP())) AS TASK_LAST_RUN_START_TIME_IN_EST
-                            ,NULL AS TASK_LAST_RUN_END_DATE
-                            ,NULL AS TASK_LAST_RUN_END_TIME_IN_EST
-                            ,NULL AS TASK_LAST_RUN_DURATION_IN_SECONDS
-                    ) S
-                    ON T.TASK_NAME = S.TASK_NAME
-                    
-                    -- Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
-                    -- Set the TASK_LAST_RUN_START_DATE & TASK_LAST_RUN_START_TIME_IN_EST with the current date and time in EST that the TASK started
-                    WHEN MATCHED
-                        
-                        THEN UPDATE SET
-                            T.TASK_LAST_RUN_START_DATE = S.TASK_LAST_RUN_START_DATE
-                            ,T.TASK_LAST_RUN_START_TIME_IN_EST = S.TASK_LAST_RUN_START_TIME_IN_EST
-                    
-                    -- Insert the <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
-                    WHEN NOT MATCHED
-                        
-                        THEN INSERT VALUES
+                            UPPER(TRIM(COLUMN_NAME_1)) AS COLUMN_NAME_1
+                            ,TO_DATE(TRIM(COLUMN_NAME_2)) AS COLUMN_NAME_2
+                            ,TO_NUMBER(TRIM(COLUMN_NAME_...N), 10, 2) AS COLUMN_NAME_...N
+
+                        FROM DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>
+
+                        WHERE <WHERE_CLAUSE_LOGIC>
+                    ;
+                """)
+
+
+                ####################################################################################################
+                # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+                ####################################################################################################
+
+
+                # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                # Set the TASK_LAST_RUN_END_DATE & TASK_LAST_RUN_END_TIME_IN_EST with the current date and time in EST that the TASK started
+                cur.execute("""
+                    UPDATE DB_KKF_MAIN.AUTOMATION.TASK_LIST
+
+                        SET
+                            TASK_LAST_RUN_END_DATE = CURRENT_DATE()
+                            ,TASK_LAST_RUN_END_TIME_IN_EST = TO_TIME(CONVERT_TIMEZONE('America/New_York', CURRENT_TIMESTAMP()))
+
+                        WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
+                    ;
+                """)
+
+                '''
+                # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                # Set the TASK_LAST_RUN_DURATION_IN_SECONDS updated value from taking the difference between the task start date and time and task end date and time
+                cur.execute("""
+                    UPDATE DB_KKF_MAIN.AUTOMATION.TASK_LIST
+
+                        SET TASK_LAST_RUN_DURATION_IN_SECONDS = DATEDIFF
                         (
-                            S.TASK_NAME
-                            ,S.TASK_DESCRIPTION
-                            ,S.TASK_FREQUENCY
-                            ,S.TASK_DAY_OF_WEEK
-                            ,S.TASK_TIME_OF_DAY
-                            ,S.TASK_PREDECESSOR_NAME
-                            ,S.TASK_LAST_RUN_START_DATE
-                            ,S.TASK_LAST_RUN_START_TIME_IN_EST
-                            ,S.TASK_LAST_RUN_END_DATE
-                            ,S.TASK_LAST_RUN_END_TIME_IN_EST
-                            ,S.TASK_LAST_RUN_DURATION_IN_SECONDS
+                            SECOND
+                            ,TASK_LAST_RUN_START_TIME_IN_EST
+                            ,TASK_LAST_RUN_END_TIME_IN_EST
                         )
-                ;
-            """)
-            
 
-            ####################################################################################################
-            # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
-            ####################################################################################################
-
-            
-            # Truncate tabe DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table so the data can be replace with updated data
-            cur.execute("""
-                TRUNCATE TABLE DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>;
-            """)
-            
+                        WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
+                    ;
+                """)
+                '''
 
-            ####################################################################################################
-            # Transform and load the review data into the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
-            ####################################################################################################
+                # Load the updated <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_RUN_HISTORY table in Snowflake that keeps history of all task runs
+                cur.execute("""
+                    INSERT INTO DB_KKF_MAIN.AUTOMATION.TASK_RUN_HISTORY
 
-            
-            # Extract the raw data from the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
-            # Transform the raw data to make it more useable for reporting purposes
-            # Load the transformed data into the DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
-            cur.execute("""
-                INSERT INTO DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>
+                        SELECT *
 
-                    SELECT DISTINCT
-                        UPPER(TRIM(COLUMN_NAME_1)) AS COLUMN_NAME_1
-                        ,TO_DATE(TRIM(COLUMN_NAME_2)) AS COLUMN_NAME_2
-                        ,TO_NUMBER(TRIM(COLUMN_NAME_...N), 10, 2) AS COLUMN_NAME_...N
+                        FROM DB_KKF_MAIN.AUTOMATION.TASK_LIST
 
-                    FROM DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>
-                        
-                    WHERE <WHERE_CLAUSE_LOGIC>
-                ;
-            """)
+                        WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
+                    ;
+                """)
 
 
-            ####################################################################################################
-            # Truncate the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
-            ####################################################################################################
+        ####################################################################################################
+        # Step 10: Move the file(s) into the archive folder within the AWS S3 Bucket
+            # Only if s3_archive_enabled is set to True
+                # The file(s) are only moved once they have been loaded into the Snowflake data warehouse
+                    # Files that failed to be extracted are left where they are, so that they can be extracted again
+        ####################################################################################################
 
-            
-            # Truncate tabe DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table so the data can be replace with updated data
-            cur.execute("""
-                TRUNCATE TABLE DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME>;
-            """)
-            
 
-            ####################################################################################################
-            # Transform and load the review data into the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
-            ####################################################################################################
+        if s3_archive_enabled:
 
-            
-            # Extract the raw data from the DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
-            # Transform the raw data to make it more useable for reporting purposes
-            # Load the transformed data into the DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
-            cur.execute("""
-                INSERT INTO DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME>
+            s3_archived_files = archive_s3_files([s3_file_name for s3_file_name in s3_copy_files if s3_file_name not in s3_failed_files])
 
-                    SELECT
-                        UPPER(TRIM(COLUMN_NAME_1)) AS COLUMN_NAME_1
-                        ,TO_DATE(TRIM(COLUMN_NAME_2)) AS COLUMN_NAME_2
-                        ,TO_NUMBER(TRIM(COLUMN_NAME_...N), 10, 2) AS COLUMN_NAME_...N
+            print(f"Moved {len(s3_archived_files)} file(s) into the {s3_archive_folder_name} archive folder")
 
-                    FROM DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>
-                        
-                    WHERE <WHERE_CLAUSE_LOGIC>
-                ;
-            """)
 
+# Delete the local folder of Parquet part files, if the extracted files WERE written into local Parquet part files
+finally:
 
-            ####################################################################################################
-            # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
-            ####################################################################################################
+    if s3_spill_path:
 
-            
-            # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
-            # Set the TASK_LAST_RUN_END_DATE & TASK_LAST_RUN_END_TIME_IN_EST with the current date and time in EST that the TASK started
-            cur.execute("""
-                UPDATE DB_KKF_MAIN.AUTOMATION.TASK_LIST
-
-                    SET
-                        TASK_LAST_RUN_END_DATE = CURRENT_DATE()
-                        ,TASK_LAST_RUN_END_TIME_IN_EST = TO_TIME(CONVERT_TIMEZONE('America/New_York', CURRENT_TIMESTAMP()))
-                    
-                    WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
-                ;
-            """)
-            
-            '''
-            # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
-            # Set the TASK_LAST_RUN_DURATION_IN_SECONDS updated value from taking the difference between the task start date and time and task end date and time
-            cur.execute("""
-                UPDATE DB_KKF_MAIN.AUTOMATION.TASK_LIST
-
-                    SET TASK_LAST_RUN_DURATION_IN_SECONDS = DATEDIFF
-                    (
-                        SECOND
-                        ,TASK_LAST_RUN_START_TIME_IN_EST
-                        ,TASK_LAST_RUN_END_TIME_IN_EST
-                    )
-                    
-                    WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
-                ;
-            """)
-            '''
-            
-            # Load the updated <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_RUN_HISTORY table in Snowflake that keeps history of all task runs
-            cur.execute("""
-                INSERT INTO DB_KKF_MAIN.AUTOMATION.TASK_RUN_HISTORY
-
-                    SELECT *
-                    
-                    FROM DB_KKF_MAIN.AUTOMATION.TASK_LIST
-                    
-                    WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
-                ;
-            """)
+        shutil.rmtree(s3_spill_path, ignore_errors = True)
 
 """
 # Display a message that informs the developer that the Python data pipeline has completed
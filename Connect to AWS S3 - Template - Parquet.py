@@ -0,0 +1,663 @@
+"""
+    The "<DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook" pulls KKC operator review data from <DATA_SOURCE_NAME> and loads it into Snowflake, where it is then cleaned up to make it ready for reporting purposes.
+
+    The files within the AWS S3 Bucket are columnar Parquet (or ORC) files, which are read using a PyArrow dataset rather than being parsed as csv files.
+    Only the columns and row groups needed for the date range are downloaded from the AWS S3 Bucket.
+
+    Data Pipeline Process:
+
+        Step 1: Install Required Python Packages
+
+        Step 2: Install Required Python Libraries
+
+        Step 3: Setup the credentials to connect to the AWS S3 Bucket
+
+        Step 4: Connect to the AWS S3 Bucket
+
+        Step 5: Collect the files within the AWS S3 Bucket folder into a PyArrow dataset
+
+        Step 6: Select the Columns and Rows to Keep from the PyArrow dataset
+
+        Step 7: Load the data from the PyArrow dataset into the Snowflake data warehouse
+            1. Setup the credentials to connect to the Snowflake data warehouse
+            2. Connect to the Snowflake data warehouse
+            3. Load the data from the PyArrow dataset into the Snowflake data warehouse table, 1 batch of rows at a time
+            4. Establish the cur cursor
+                1. Assign the proper values for the following Snowflake objects:
+                    1. Role
+                    2. Warehouse
+                    3. Database
+                2. Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+                3. Truncate the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+                4. Transform and load the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+                5. Merge the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+                6. Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+"""
+
+
+##############################################################################################################
+# Step 1: Install Required Python Packages
+    # Install all of the require Python packages in order to perform the necessary actions within the Python notebook
+        # This section is only used for tools that require you to install all of the necessary packages before each time the code is executed, such as Databricks
+##############################################################################################################
+
+
+# Install the datetime Python package
+    # Used when working with and manipulating dates and times
+%pip install datetime
+
+# Install the pandas Python package
+    # Used to store data in Series and DataFrames
+%pip install pandas
+
+# Install the pyarrow Python package
+    # Used to read the Parquet (or ORC) files within the AWS S3 Bucket
+%pip install pyarrow
+
+# Install the snowflake-connector-python[pandas] Python package
+    # Used to connect to Snowflake and utilize Pandas DataFrames
+%pip install snowflake-connector-python[pandas]
+
+# Restart the kernel to use updated packages
+    # Databricks specific command that is required to use any newly install Python packages listed above
+%restart_python
+
+
+##############################################################################################################
+# Step 2: Install Required Python Libraries
+    # Install all of the require Python libraries in order to perform the necessary actions within the Python notebook
+##############################################################################################################
+
+
+# Used when working with and manipulating dates and times
+from datetime import datetime, timedelta
+
+# Used to build the date filter that is compared against the row group statistics of the Parquet (or ORC) files
+import pyarrow as pa
+
+# Used to read the Parquet (or ORC) files within the AWS S3 Bucket as a single dataset
+import pyarrow.dataset as ds
+
+# Used to connect to the AWS S3 Bucket
+    # PyArrow uses its own AWS S3 client, rather than boto3
+from pyarrow import fs
+
+# Enables the ability to utilize DataFrames, which are 2 dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+import pandas as pd
+
+# Enables the ability to connect to the Snowflake Data Warehouse
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+import snowflake.connector
+
+# Enables the ability to write data into Snowflake from Pandas DataFrames
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+from snowflake.connector.pandas_tools import write_pandas
+
+
+##############################################################################################################
+# Step 3: Setup the credentials to connect to the AWS S3 Bucket
+##############################################################################################################
+
+
+# The access ID assigned to the account connecting to the AWS service
+s3_access_id = "<AWS_S3_Access_ID>"
+
+# The access key assigned to the account connecting to the AWS service
+s3_secret_access_key = "<AWS_S3_Access_Key>"
+
+# The AWS region that the AWS service is set to
+aws_region_name = "<AWS_Region>"
+
+# The AWS S3 Bucket that you would like to connect to
+s3_bucket = "<AWS_S3_Bucket>"
+
+# The folder within the AWS S3 Bucket that contains the Parquet (or ORC) files
+    # Every file within the folder, and within any folder inside of it, is part of the dataset
+s3_folder_name = "<Folder_Name>"
+
+# The format of the files within the AWS S3 Bucket folder
+    # "parquet" or "orc"
+s3_file_format = "parquet"
+
+# The columns to keep from the files within the AWS S3 Bucket folder
+    # Only these columns are downloaded from the AWS S3 Bucket, as each column is stored separately within a Parquet (or ORC) file
+        # This is similar to the SELECT clause in SQL, and replaces the df_subset Pandas DataFrame used by the csv templates
+            # Set to None to read every column
+s3_file_columns = [
+    '<Column_1>'
+    ,'<Column_2>'
+    ,'<Column_...N>'
+]
+
+# The date column used to filter the rows within the files
+    # The column must be stored as a date or timestamp within the files, or be the name of the Hive-style folders below
+s3_date_column = "<Date_Column>"
+
+# The layout of the folders inside of the s3_folder_name folder
+    # Hive-style folders are read as a column, such as <Folder_Name>/<Date_Column>=2024-01-31/, so that whole folders outside of the date range are skipped
+        # The folder names are declared as dates, otherwise they are read as text and can not be compared against the date range
+            # Set to None if the files are not stored in Hive-style folders
+s3_partitioning = ds.partitioning(pa.schema([(s3_date_column, pa.date32())]), flavor = "hive")
+
+# The date used to calulate the date variables below
+today = datetime.now()
+
+# The oldest date that you would like to pull data for
+s3_start_date = (today - timedelta(days = 3)).date()
+
+# The date after the newest date that you would like to pull data for
+s3_end_date = today.date()
+
+# The number of rows that are loaded into the Snowflake data warehouse with each write_pandas call
+    # Only a few batches of rows are held in memory at once, no matter how big the dataset is
+        # PyArrow never reads a batch of rows across more than 1 row group, so a file with small row groups is read in batches smaller than this
+            # The batches of rows are gathered in Step 6 until they reach this number of rows, before each write_pandas call
+s3_batch_size = 1000000
+
+
+##############################################################################################################
+# Step 4: Connect to the AWS S3 Bucket
+##############################################################################################################
+
+
+# Connect to the AWS S3 Bucket
+    # The connection to the AWS S3 Bucket closes automatically and does not use the close() command
+s3_filesystem = fs.S3FileSystem(
+    access_key = s3_access_id
+    ,secret_key = s3_secret_access_key
+    ,region = aws_region_name
+)
+
+
+##############################################################################################################
+# Step 5: Collect the files within the AWS S3 Bucket folder into a PyArrow dataset
+##############################################################################################################
+
+
+# Collect every file within the AWS S3 Bucket folder into a single PyArrow dataset
+    # Only the file names are listed at this point, no data is downloaded
+        # The schema is read from the first file within the AWS S3 Bucket folder
+s3_dataset = ds.dataset(
+    f"{s3_bucket}/{s3_folder_name}/"
+    ,filesystem = s3_filesystem
+    ,format = s3_file_format
+    ,partitioning = s3_partitioning
+)
+
+"""
+# Display the files and the columns within the PyArrow dataset
+    # This will allow you to identify the columns within the dataset
+        # This allows you to be able to remove any unecessary columns, using s3_file_columns in Step 3, from the dataset before loading into Snowflake
+            # Comment out once the files and columns have been verified
+print()
+print("AWS S3 Bucket Files:")
+print()
+print(s3_dataset.files)
+print()
+print("Here are all of the columns within the PyArrow dataset")
+print()
+print(s3_dataset.schema)
+"""
+
+
+##############################################################################################################
+# Step 6: Select the Columns and Rows to Keep from the PyArrow dataset
+##############################################################################################################
+
+
+# Keep only the rows from the start date up to, but not including, the end date
+    # The filter is compared against the minimum and maximum value of the date column that each Parquet (or ORC) file stores for each row group
+        # Row groups, and Hive-style folders, that are entirely outside of the date range are never downloaded from the AWS S3 Bucket
+            # This is similar to the WHERE clause in SQL
+s3_date_filter = (ds.field(s3_date_column) >= pa.scalar(s3_start_date)) & (ds.field(s3_date_column) < pa.scalar(s3_end_date))
+
+# Read the PyArrow dataset 1 batch of rows at a time, with only the columns and rows to keep
+    # Nothing is downloaded until the batches of rows are read in Step 7
+        # The next batches of rows are downloaded in the background while the current batch of rows is loaded into the Snowflake data warehouse
+s3_scanner = s3_dataset.scanner(
+    columns = s3_file_columns
+    ,filter = s3_date_filter
+    ,batch_size = s3_batch_size
+)
+
+
+# Gather the batches of rows read by the PyArrow scanner into PyArrow tables of at least s3_batch_size rows
+    # Each PyArrow table is loaded with its own write_pandas call in Step 7, rather than 1 write_pandas call for each row group
+        # Batches without any rows within the date range are skipped
+            # The remaining rows are returned as a smaller PyArrow table once every batch of rows has been read
+def gather_s3_batches(s3_batches):
+
+    s3_gathered_batches = []
+
+    s3_gathered_rows = 0
+
+    for s3_batch in s3_batches:
+
+        if s3_batch.num_rows == 0:
+
+            continue
+
+        s3_gathered_batches.append(s3_batch)
+
+        s3_gathered_rows += s3_batch.num_rows
+
+        if s3_gathered_rows >= s3_batch_size:
+
+            yield pa.Table.from_batches(s3_gathered_batches)
+
+            s3_gathered_batches = []
+
+            s3_gathered_rows = 0
+
+    if s3_gathered_batches:
+
+        yield pa.Table.from_batches(s3_gathered_batches)
+
+"""
+# Compare the time of loading a csv file against the same data within a Parquet file, using a mocked AWS S3 Bucket
+    # Requires the moto Python package, which can be installed using %pip install moto[server]
+        # PyArrow uses its own AWS S3 client rather than boto3, therefore the mocked AWS S3 Bucket is run as a local server
+            # Both reads keep 3 of the 5 columns and only the last 3 of the 30 days
+                # Comment out once the Parquet files have been verified
+import time
+
+import boto3
+
+import pyarrow.parquet as pq
+
+from moto.server import ThreadedMotoServer
+
+s3_test_server = ThreadedMotoServer(port = 5055)
+
+s3_test_server.start()
+
+s3_test_client = boto3.client("s3", region_name = "us-east-1", endpoint_url = "http://127.0.0.1:5055", aws_access_key_id = "test", aws_secret_access_key = "test")
+
+s3_test_client.create_bucket(Bucket = "s3-parquet-test")
+
+# Create 3 million rows across 30 days, then write the rows into a csv file and a Parquet file within the mocked AWS S3 Bucket
+    # The Parquet file stores 100000 rows per row group
+s3_test_rows = 3000000
+
+df_test = pd.DataFrame({
+    "ORDER_DATE": pd.to_datetime("2024-01-01") + pd.to_timedelta(pd.RangeIndex(s3_test_rows) * 30 // s3_test_rows, unit = "D")
+    ,"ORDER_ID": pd.RangeIndex(s3_test_rows)
+    ,"STORE_ID": pd.RangeIndex(s3_test_rows) % 500
+    ,"AMOUNT": pd.RangeIndex(s3_test_rows) / 7
+    ,"NOTE": "abcdefghijklmnopqrstuvwxyz"
+})
+
+s3_test_client.put_object(Bucket = "s3-parquet-test", Key = "csv/test.csv", Body = df_test.to_csv(index = False).encode())
+
+s3_test_buffer = pa.BufferOutputStream()
+
+pq.write_table(pa.Table.from_pandas(df_test, preserve_index = False), s3_test_buffer, row_group_size = 100000)
+
+s3_test_client.put_object(Bucket = "s3-parquet-test", Key = "parquet/test.parquet", Body = s3_test_buffer.getvalue().to_pybytes())
+
+s3_test_start_date = datetime(2024, 1, 28).date()
+
+# Read the csv file, which downloads and parses every row before the rows outside of the date range are removed
+s3_test_start = time.perf_counter()
+
+df_csv = pd.read_csv(s3_test_client.get_object(Bucket = "s3-parquet-test", Key = "csv/test.csv")["Body"], usecols = ["ORDER_DATE", "ORDER_ID", "AMOUNT"], parse_dates = ["ORDER_DATE"])
+
+df_csv = df_csv[df_csv["ORDER_DATE"] >= pd.Timestamp(s3_test_start_date)]
+
+print(f"CSV: {len(df_csv)} rows, {time.perf_counter() - s3_test_start:.2f} seconds")
+
+# Read the Parquet file, which only downloads the 3 columns within the row groups that overlap the date range
+s3_test_start = time.perf_counter()
+
+s3_test_dataset = ds.dataset(
+    "s3-parquet-test/parquet/"
+    ,filesystem = fs.S3FileSystem(access_key = "test", secret_key = "test", region = "us-east-1", endpoint_override = "http://127.0.0.1:5055")
+    ,format = "parquet"
+)
+
+s3_test_parquet_rows = 0
+
+for s3_test_batch in s3_test_dataset.scanner(columns = ["ORDER_DATE", "ORDER_ID", "AMOUNT"], filter = ds.field("ORDER_DATE") >= pa.scalar(s3_test_start_date)).to_batches():
+
+    s3_test_parquet_rows += len(s3_test_batch.to_pandas())
+
+print(f"Parquet: {s3_test_parquet_rows} rows, {time.perf_counter() - s3_test_start:.2f} seconds")
+
+s3_test_server.stop()
+"""
+
+
+####################################################################################################
+# Step 7: Load the data from the PyArrow dataset into the Snowflake data warehouse
+    # Setup the credentials to connect to the Snowflake data warehouse
+    # Connect to the Snowflake data warehouse
+    # Load the data from the PyArrow dataset into the Snowflake data warehouse table, 1 batch of rows at a time
+    # Establish the cur cursor
+        # Assign the proper values for the following Snowflake objects:
+            # Role
+            # Warehouse
+            # Database
+        # Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+        # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+        # Transform and load the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+        # Merge the <DATA_SOURCE_NAME> <DATASET_NAME> data into the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+        # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+####################################################################################################
+
+
+# Verify whether the AWS S3 Bucket folder contains any files
+    # If the folder is empty, there is no data to load into the Snowflake data warehouse
+if s3_dataset.files:
+
+    # The connection to the Snowflake data warehouse closes automatically after the with block is exited
+        # Therefore, no need for the dw_conn.close() command
+    with snowflake.connector.connect(
+        # The username should be tied to a service account, rather than and specific individual
+        user = "<Snowflake_User_Name>"
+        # The password should be tied to a service account, rather than and specific individual
+        ,password = "<Snowflake_User_Password>"
+        # The account consists of 3 parts separated by a decimal (".")
+            # Part 1: Snowflake account identifier
+            # Part 2: Snowflake cloud region
+            # Part 3: Snowflake cloud provider
+        ,account = "<Snowflake_Account_Identifier>.<Snowflake_Cloud_Region>.<Snowflake_Cloud_Provider>"
+        # The Snowflake warehouse that will be used to write the data into Snowflake
+        ,warehouse = "<Snowflake_Warehouse_Name>"
+        # The Snowflake database where the data will be written into
+        ,database = "<Snowflake_Database_Name>"
+    ) as dw_conn:
+
+
+        ####################################################################################################
+        # Load the data from the PyArrow dataset into the Snowflake data warehouse table, 1 batch of rows at a time
+        ####################################################################################################
+
+
+        # Truncate the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table, so that each batch of rows below can be appended to it
+            # This also empties the table when no rows are within the date range
+        with dw_conn.cursor() as cur:
+
+            cur.execute("""
+                TRUNCATE TABLE DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>;
+            """)
+
+        # The number of rows loaded into the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+        s3_rows_loaded = 0
+
+        # Load each group of batches as soon as it has reached s3_batch_size rows
+        for s3_batch_table in gather_s3_batches(s3_scanner.to_batches()):
+
+            write_pandas(
+                conn = dw_conn
+                ,df = s3_batch_table.to_pandas()
+                ,table_name = "<TRANSIENT_TABLE_NAME>"
+                ,schema = "TRANSIENT"
+                # When set to False, no new table is created in Snowflake from the Pandas DataFrame
+                ,auto_create_table = False
+                # When set to False, no quotes are added to each column value
+                ,quote_identifiers = False
+                # When set to False, the batch of rows is appended to the end of the existing Snowflake table
+                ,overwrite = False
+            )
+
+            s3_rows_loaded += s3_batch_table.num_rows
+
+        print(f"Loaded {s3_rows_loaded} rows from the AWS S3 Bucket")
+
+
+        ####################################################################################################
+        # Establish a cursor
+        ####################################################################################################
+
+
+        # Setup a cursor in order to execute SQL queries to retrieve data from the Snowflake data warehouse
+        with dw_conn.cursor() as cur:
+
+
+            ####################################################################################################
+            # Test the connection to Snowflake
+                # Comment out once the connection has been verified
+            ####################################################################################################
+
+            
+            """
+            # Write and execute the SQL query that will return the current version of the Snowflake data warehouse
+                # Identifying the current version of the Snowflake data warehouse ensures a successful connection to the Snowflake data warehouse
+            cur.execute('''
+                SELECT current_version()
+            ''')
+
+            # Fetch the first row/record from the SQL query above
+            one_row = cur.fetchone()
+            
+            # Display the first row/record from the SQL query above
+            print(one_row[0])
+            """
+
+
+            ####################################################################################################
+            # Assign the proper values for the following Snowflake object
+                # Role
+                # Warehouse
+                # Database
+            ####################################################################################################
+
+            
+            # Assume the <Snowflake_Role_Name> role
+            cur.execute("""
+                USE ROLE <Snowflake_Role_Name>;
+            """)
+
+            # Assume the <Snowflake_Warehouse_Name> ELT Production Warehouse
+            cur.execute("""
+                USE WAREHOUSE <Snowflake_Warehouse_Name>;
+            """)
+
+            # Assume the <Snowflake_Database_Name> database
+            cur.execute("""
+                USE DATABASE <Snowflake_Database_Name>;
+            """)
+            
+
+            ####################################################################################################
+            # Insert the data pipeline execution metadata into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+            ####################################################################################################
+
+            
+            # Verify whether or not the <SNOWFLAKE_TASK_NAME> task exists within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake if it already exists
+                # Insert the <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake if it does NOT already exist
+            cur.execute("""
+                MERGE INTO DB_KKF_MAIN.AUTOMATION.TASK_LIST T
+                    
+                    USING
+                    (
+                        -- Assign the necessary values for each column
+                        SELECT
+                            '<SNOWFLAKE_TASK_NAME>' AS TASK_NAME
+                            ,'<SNOWFLAKE_TASK_DESCRIPTIONI>' AS TASK_DESCRIPTION
+                            ,'<SNOWFLAKE_TASK_FREQUENCY>' AS TASK_FREQUENCY
+                            ,'<SNOWFLAKE_TASK_DAY_OF_WEEK>' AS TASK_DAY_OF_WEEK
+                            ,'<SNOWFLAKE_TASK_TIME_OF_DAY>' AS TASK_TIME_OF_DAY
+                            ,NULL AS TASK_PREDECESSOR_NAME
+                            ,CURRENT_DATE() AS TASK_LAST_RUN_START_DATE
+                            ,TO_TIME(CONVERT_TIMEZONE('America/New_York', CURRENT_TIMESTAMP())) AS TASK_LAST_RUN_START_TIME_IN_EST
+                            ,NULL AS TASK_LAST_RUN_END_DATE
+                            ,NULL AS TASK_LAST_RUN_END_TIME_IN_EST
+                            ,NULL AS TASK_LAST_RUN_DURATION_IN_SECONDS
+                    ) S
+                    ON T.TASK_NAME = S.TASK_NAME
+                    
+                    -- Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                    -- Set the TASK_LAST_RUN_START_DATE & TASK_LAST_RUN_START_TIME_IN_EST with the current date and time in EST that the TASK started
+                    WHEN MATCHED
+                        
+                        THEN UPDATE SET
+                            T.TASK_LAST_RUN_START_DATE = S.TASK_LAST_RUN_START_DATE
+                            ,T.TASK_LAST_RUN_START_TIME_IN_EST = S.TASK_LAST_RUN_START_TIME_IN_EST
+                    
+                    -- Insert the <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+                    WHEN NOT MATCHED
+                        
+                        THEN INSERT VALUES
+                        (
+                            S.TASK_NAME
+                            ,S.TASK_DESCRIPTION
+                            ,S.TASK_FREQUENCY
+                            ,S.TASK_DAY_OF_WEEK
+                            ,S.TASK_TIME_OF_DAY
+                            ,S.TASK_PREDECESSOR_NAME
+                            ,S.TASK_LAST_RUN_START_DATE
+                            ,S.TASK_LAST_RUN_START_TIME_IN_EST
+                            ,S.TASK_LAST_RUN_END_DATE
+                            ,S.TASK_LAST_RUN_END_TIME_IN_EST
+                            ,S.TASK_LAST_RUN_DURATION_IN_SECONDS
+                        )
+                ;
+            """)
+            
+
+            ####################################################################################################
+            # Truncate the Snowflake DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+            ####################################################################################################
+
+            
+            # Truncate tabe DB_KKF_MAIN.PERSISTED.DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table so the data can be replace with updated data
+            cur.execute("""
+                TRUNCATE TABLE DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>;
+            """)
+            
+
+            ####################################################################################################
+            # Transform and load the review data into the Snowflake DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+            ####################################################################################################
+
+            
+            # Extract the raw data from the DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME> table
+            # Transform the raw data to make it more useable for reporting purposes
+            # Load the transformed data into the DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+            cur.execute("""
+                INSERT INTO DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>
+
+                    SELECT DISTINCT
+                        UPPER(TRIM(COLUMN_NAME_1)) AS COLUMN_NAME_1
+                        ,TO_DATE(TRIM(COLUMN_NAME_2)) AS COLUMN_NAME_2
+                        ,TO_NUMBER(TRIM(COLUMN_NAME_...N), 10, 2) AS COLUMN_NAME_...N
+
+                    FROM DB_KKF_MAIN.TRANSIENT.<TRANSIENT_TABLE_NAME>
+                        
+                    WHERE <WHERE_CLAUSE_LOGIC>
+                ;
+            """)
+
+            ####################################################################################################
+            # Merge the review data into the Snowflake DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+                # The merge statement ensures that no duplicate records get loaded into the DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+                # as this will skew any reports that utilize the <DATA_SOURCE_NAME> <DATASET_NAME>
+            ####################################################################################################
+
+            
+            # Extract the transformed data from the DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME> table
+            # Load the transformed data into the DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table
+            cur.execute("""
+                MERGE INTO DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> T
+                    
+                    USING
+                    (
+                        SELECT DISTINCT
+                            COLUMN_NAME_1
+                            ,COLUMN_NAME_2
+                            ,COLUMN_NAME_...N
+                        
+                        FROM DB_KKF_MAIN.PERSISTED.<PERSISTED_TABLE_NAME>
+                    ) S
+                    ON T.COLUMN_NAME_1 = S.COLUMN_NAME_1
+                    AND T.COLUMN_NAME_2 = S.COLUMN_NAME_2
+                    AND T.COLUMN_NAME_...N = S.COLUMN_NAME_...N
+
+                    -- Insert new <Persisted_Table> records into the DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table in Snowflake
+                    WHEN NOT MATCHED
+                    
+                        THEN INSERT VALUES
+                        (
+                            S.COLUMN_NAME_1
+                            ,S.COLUMN_NAME_2
+                            ,S.COLUMN_NAME_...N
+                        )
+                    
+                    -- Update existing <Persisted_Table> records in the DB_KKF_MAIN.<PRESENTATION_SCHEMA_NAME>.<FACT/DIM_TABLE_NAME> table in Snowflake
+                    WHEN MATCHED
+                        -- AND      -- AND is optional to add additional logic to Match statement when multiple Match statements are needed to perform different actions based on criteria
+                                    -- AND look at T. columns and S. columns, even comparing one to another in the desired order
+                    
+                        THEN UPDATE
+
+                            SET
+                                T.COLUMN_NAME_1 = S.COLUMN_NAME_1
+                                ,T.COLUMN_NAME_2 = S.COLUMN_NAME_2
+                                ,T.COLUMN_NAME_...N = S.COLUMN_NAME_...N
+                ;
+            """)
+            
+
+            ####################################################################################################
+            # Update the data pipeline execution metadata in the DB_KKF_MAIN.AUTOMATION.TASK_LIST table
+            ####################################################################################################
+
+            
+            # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+            # Set the TASK_LAST_RUN_END_DATE & TASK_LAST_RUN_END_TIME_IN_EST with the current date and time in EST that the TASK started
+            cur.execute("""
+                UPDATE DB_KKF_MAIN.AUTOMATION.TASK_LIST
+
+                    SET
+                        TASK_LAST_RUN_END_DATE = CURRENT_DATE()
+                        ,TASK_LAST_RUN_END_TIME_IN_EST = TO_TIME(CONVERT_TIMEZONE('America/New_York', CURRENT_TIMESTAMP()))
+                    
+                    WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
+                ;
+            """)
+            
+            '''
+            # Update the <SNOWFLAKE_TASK_NAME> task record within the DB_KKF_MAIN.AUTOMATION.TASK_LIST table in Snowflake
+            # Set the TASK_LAST_RUN_DURATION_IN_SECONDS updated value from taking the difference between the task start date and time and task end date and time
+            cur.execute("""
+                UPDATE DB_KKF_MAIN.AUTOMATION.TASK_LIST
+
+                    SET TASK_LAST_RUN_DURATION_IN_SECONDS = DATEDIFF
+                    (
+                        SECOND
+                        ,TASK_LAST_RUN_START_TIME_IN_EST
+                        ,TASK_LAST_RUN_END_TIME_IN_EST
+                    )
+                    
+                    WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
+                ;
+            """)
+            '''
+            
+            # Load the updated <SNOWFLAKE_TASK_NAME> task record into the DB_KKF_MAIN.AUTOMATION.TASK_RUN_HISTORY table in Snowflake that keeps history of all task runs
+            cur.execute("""
+                INSERT INTO DB_KKF_MAIN.AUTOMATION.TASK_RUN_HISTORY
+
+                    SELECT *
+                    
+                    FROM DB_KKF_MAIN.AUTOMATION.TASK_LIST
+                    
+                    WHERE TASK_NAME = '<SNOWFLAKE_TASK_NAME>'
+                ;
+            """)
+            
+
+
+"""
+# Display a message that informs the developer that the Python data pipeline has completed
+    # Comment out once the entire data pipeline has completed successfully
+print()
+print("The <DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook has completed successfully")
+print()
+"""
\ No newline at end of file
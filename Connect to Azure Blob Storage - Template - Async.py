@@ -0,0 +1,308 @@
+"""
+    The "<DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook" pulls <DATASET_NAME> data from <DATA_SOURCE_NAME> and loads it into Snowflake, where it is then cleaned up to make it ready for reporting purposes.
+
+    Rather than processing the Azure Blob Storage source container file(s) one at a time, several files are processed at the same time using asyncio.
+    While one file is being downloaded, another file can be converted, archived or deleted.
+
+    Data Pipeline Process:
+
+        Step 1: Install Required Python Packages
+
+        Step 2: Install Required Python Libraries
+
+        Step 3: Setup the credentials to connect to Azure Blob Storage
+
+        Step 4: Process a single Azure Blob Storage source container file
+            1. Load the data from the Azure Blob Storage source container file into a Pandas DataFrame
+            2. Convert the Pandas DataFrame to the proper format
+            3. ENTER THE DATA LOAD LOGIC HERE
+            4. Load the data within the formatted Pandas DataFrame into the Azure Blob Storage archive container file
+            5. Delete the Azure Blob Storage source container file
+
+        Step 5: Process the Azure Blob Storage source container file(s) at the same time
+            1. Establish a BlobServiceClient
+            2. Establish a ContainerClient for the source container and the archive container
+            3. Identify the Azure Blob Storage source container file(s)
+            4. Process each file, with up to blob_max_concurrency files being processed at the same time
+
+        Step 6: Run the data pipeline
+"""
+
+
+##############################################################################################################
+# Step 1: Install Required Python Packages
+    # Install all of the require Python packages in order to perform the necessary actions within the Python notebook
+        # This section is only used for tools that require you to install all of the necessary packages before each time the code is executed, such as Databricks
+##############################################################################################################
+
+
+# Install the azure-storage-blob Python package
+    # Allows you to manipulate Azure Storage resources and blob containers
+%pip install azure-storage-blob
+
+# Install the aiohttp Python package
+    # Used by the asyncio version of the azure-storage-blob Python package to send requests to Azure Blob Storage
+%pip install aiohttp
+
+# Install the pandas Python package
+    # Used to store data in Series and DataFrames
+%pip install pandas
+
+# Restart the kernel to use updated packages
+    # Databricks specific command that is required to use any newly install Python packages listed above
+%restart_python
+
+
+####################################################################################################
+# Step 2: Install Required Python Libraries
+    # Install all of the require Python libraries in order to perform the necessary actions within the Python notebook
+####################################################################################################
+
+
+# Used to process several Azure Blob Storage files at the same time, within a single thread
+import asyncio
+
+# Used to read the downloaded Azure Blob Storage file into a Pandas DataFrame
+import io
+
+# Enables the ability to access and manipulate Azure Blob Storeage containers and blobs, using asyncio
+from azure.storage.blob.aio import BlobServiceClient
+
+# Enables the ability to utilize DataFrames, which are 2-dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
+import pandas as pd
+
+
+####################################################################################################
+# Step 3: Setup the credentials to connect to Azure Blob Storage
+####################################################################################################
+
+
+# Account Name of the Azure Blob Storage environment
+account_name = "<Account_Name>"
+
+# Account Key for the Azure Blob Storage environment
+account_key = "<Account_Key>"
+
+# Connection String for the Azure Blob Storage environment, which is created from the Account Name and Account Key listed above
+connection_string = f"DefaultEndpointsProtocol=https;AccountName={account_name};AccountKey={account_key};EndpointSuffix=core.windows.net"
+
+# Name of the Azure Blob Storage container that the file(s) are either:
+# - Loaded into from the source, such as a SFTP or other application
+# - Extracted from, to load into the:
+#    - Data warehouse
+#    - Azure Blob Storage archive container, for future use if needed
+container_name = "<Container_Name>"
+
+# Name of the Azure Blob Storage archive container that the file(s) will be archived into, for future use if needed
+archive_container_name = "<Archive_Container_Name>"
+
+# The number of files that are processed at the same time
+    # Each file holds its data in memory while it is being processed, so memory use grows with this number
+        # Set to 1 to process the files one at a time
+blob_max_concurrency = 8
+
+# The dictionary collects the error for each file that failed to be processed
+    # A failed file is left within the Azure Blob Storage source container, so that it is processed again by the next data pipeline execution
+blob_failed_files = {}
+
+
+####################################################################################################
+# Step 4: Process a single Azure Blob Storage source container file
+    # Each file moves through the steps below, one step after the other
+        # While this file waits on Azure Blob Storage, the other files being processed continue with their own steps
+####################################################################################################
+
+
+async def process_blob(blob, container_client, archive_container_client):
+
+
+    ####################################################################################################
+    # Load the data from the Azure Blob Storage source container file into a Pandas DataFrame
+    ####################################################################################################
+
+
+    # Download the Azure Blob Storage source container file
+    blob_downloader = await container_client.download_blob(blob)
+
+    blob_data = await blob_downloader.readall()
+
+    # Load the downloaded file into a Pandas DataFrame
+        # Parsing the file does not wait on Azure Blob Storage, so it is run on a separate thread to keep the other files moving
+    df = await asyncio.to_thread(pd.read_csv, io.BytesIO(blob_data))
+
+    """
+    # Select the desired columns to keep from the df Pandas DataFrame
+        # This is similar to the SELECT clause in SQL
+    df_subset = df[
+        [
+            'COLUMN_NAME_1'
+            ,'COLUMN_NAME_2'
+            ,'COLUMN_NAME_...N'
+        ]
+    ]
+    """
+
+    # Use df_subset = df, if you are NOT using df_subset to remove specific columns from the file before loading the data
+    df_subset = df
+
+
+    ####################################################################################################
+    # Convert the Pandas DataFrame to the proper format
+    ####################################################################################################
+
+
+    # Convert the Pandas DataFrame to a CSV string
+        # This enables the ability to write the data within the Pandas DataFrame into a Azure Blob Storage file
+    df_csv = await asyncio.to_thread(df_subset.to_csv, index = False)
+
+
+    ####################################################################################################
+    # ENTER THE DATA LOAD LOGIC HERE
+    ####################################################################################################
+
+
+    # ENTER THE DATA LOAD LOGIC HERE FOR LOADING THE DATA INTO THE DESTINATION LOCATION
+
+
+    ####################################################################################################
+    # Load the data within the formatted Pandas DataFrame into the Azure Blob Storage archive container file
+    ####################################################################################################
+
+
+    # Create a new file, or overwrite an existing file, within the Azure Blob Storage archive container
+        # Set overwrite = False, if you do not want to overwrite existing files that contain the same name as the file you are currently trying to create
+    await archive_container_client.upload_blob(blob, df_csv, overwrite = True)
+
+
+    ####################################################################################################
+    # Delete the Azure Blob Storage source container file
+    ####################################################################################################
+
+
+    # Delete the file from the Azure Blob Storage source container
+        # This prevents the same file from being loaded into the destination multiple times, which will create duplicate data
+    await container_client.delete_blob(blob)
+
+    print(f"Processed the {blob} file")
+
+
+####################################################################################################
+# Step 5: Process the Azure Blob Storage source container file(s) at the same time
+####################################################################################################
+
+
+async def process_blobs():
+
+    # Establish the BlobServiceClient in order to interact with Azure Blob Storage at the account level
+        # The same BlobServiceClient, and its open connections, are used for every file
+            # The connection to the BlobServiceClient closes automatically after the with block is exited
+    async with BlobServiceClient.from_connection_string(connection_string) as blob_service_client:
+
+        # Establish 1 ContainerClient for the Azure Blob Storage source container and 1 ContainerClient for the Azure Blob Storage archive container
+            # Both ContainerClients are shared by every file, rather than being established again for each file
+        container_client = blob_service_client.get_container_client(container_name)
+
+        archive_container_client = blob_service_client.get_container_client(archive_container_name)
+
+        # The queue holds the names of the files that are waiting to be processed
+            # Once the queue is full, listing the files waits until a file has been picked up, so the list of files is never held in memory all at once
+        blob_queue = asyncio.Queue(maxsize = blob_max_concurrency * 2)
+
+
+        # Identify the Azure Blob Storage source container file(s) and add each file name to the queue
+            # The file names are listed 1 page at a time as the queue has room for them
+                # None is added to the queue once for each worker, which tells each worker that there are no more files
+        async def list_blobs():
+
+            async for blob in container_client.list_blob_names():
+
+                await blob_queue.put(blob)
+
+            for _ in range(blob_max_concurrency):
+
+                await blob_queue.put(None)
+
+
+        # Process the files within the queue, 1 file at a time
+            # blob_max_concurrency workers run at the same time, which is the most files that are processed at the same time
+                # A file that fails to be processed is recorded within blob_failed_files and the worker moves on to the next file
+        async def process_blob_queue():
+
+            while (blob := await blob_queue.get()) is not None:
+
+                try:
+
+                    await process_blob(blob, container_client, archive_container_client)
+
+                except Exception as blob_error:
+
+                    blob_failed_files[blob] = blob_error
+
+
+        await asyncio.gather(list_blobs(), *[process_blob_queue() for _ in range(blob_max_concurrency)])
+
+
+####################################################################################################
+# Step 6: Run the data pipeline
+####################################################################################################
+
+
+# Run every step above until every Azure Blob Storage source container file has been processed
+    # If the notebook already has an event loop running, such as Jupyter, replace this line with: await process_blobs()
+asyncio.run(process_blobs())
+
+# Display the files that failed to be processed
+    # These files are still within the Azure Blob Storage source container and will be processed by the next data pipeline execution
+if blob_failed_files:
+
+    print()
+    print("The following files failed to be processed:")
+    print()
+
+    for blob, blob_error in blob_failed_files.items():
+
+        print(f"{blob}: {blob_error}")
+
+
+"""
+# Verify the data pipeline against Azurite, the Azure Blob Storage emulator
+    # Start Azurite before executing, such as: npx azurite-blob --blobPort 10000
+        # Run in place of Step 6, after executing Steps 1 through 5
+            # Comment out once the data pipeline has been verified
+connection_string = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+
+container_name = "async-source-test"
+
+archive_container_name = "async-archive-test"
+
+
+# Create the source and archive containers, and add 20 files into the source container
+async def create_test_blobs():
+
+    async with BlobServiceClient.from_connection_string(connection_string) as blob_service_client:
+
+        await blob_service_client.create_container(container_name)
+
+        await blob_service_client.create_container(archive_container_name)
+
+        for i in range(20):
+
+            await blob_service_client.get_container_client(container_name).upload_blob(f"file_{i}.csv", f"A,B\n{i},{i * 2}\n")
+
+
+# Display the files left within the source container, which should be none, and the files within the archive container, which should be all 20
+async def list_test_blobs():
+
+    async with BlobServiceClient.from_connection_string(connection_string) as blob_service_client:
+
+        print([blob async for blob in blob_service_client.get_container_client(container_name).list_blob_names()])
+
+        print([blob async for blob in blob_service_client.get_container_client(archive_container_name).list_blob_names()])
+
+
+asyncio.run(create_test_blobs())
+
+asyncio.run(process_blobs())
+
+asyncio.run(list_test_blobs())
+"""
\ No newline at end of file
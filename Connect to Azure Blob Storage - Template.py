@@ -13,13 +13,13 @@
 
         Step 5: Establish a ContainerClient to identify source files
 
-        Step 6: Identify the Azure Blob Storage source container file(s)
+        Step 6: Identify the new Azure Blob Storage source container file(s), since the last data pipeline execution
 
         Step 7: Loop through the Azure Blob Storage source container file(s)
 
         Step 8: Establish a second ContainerClient
 
-        Step 9: Establish a BlobClient
+        Step 9: Establish a BlobClient, and claim the file with a lease if blob_lease_enabled is set to True
 
         Step 10: Load the data from the Azure Blob Storage source container file into a Pandas DataFrame
 
@@ -33,7 +33,9 @@
 
         Step 15: Load the data within the formatted Pandas DataFrame into the Azure Blob Storage archive container file
 
-        Step 16: Delete the Azure Blob Storage source container
+        Step 16: Delete the Azure Blob Storage source container file(s), up to blob_delete_batch_size files at a time, or each file as soon as it has been archived if blob_lease_enabled is set to True
+
+        Step 17: Save the listing checkpoint
 """
 
 
@@ -60,6 +62,10 @@
     # Used to store data in Series and DataFrames	
 %pip install pandas
 
+# Install the pyarrow Python package
+    # Used to write the Azure Blob Storage archive container file(s) as Parquet files, and to read the archived file(s) back
+%pip install pyarrow
+
 # Install the snowflake-connector-python[pandas] Python package
     # Used to connect to Snowflake and utilize Pandas DataFrames	
 %pip install snowflake-connector-python[pandas]
@@ -75,8 +81,56 @@
 ####################################################################################################
 
 
+# Used to ensure that the Azure Blob Storage source container file is not changed while it is being downloaded in pieces
+from azure.core import MatchConditions
+
+# Used to identify when another worker has already claimed, or already deleted, the Azure Blob Storage source container file
+from azure.core.exceptions import HttpResponseError
+
 # Enables the ability to access and manipulate Azure Blob Storeage containers and blobs
-from azure.storage.blob import BlobServiceClient
+    # BlobBlock identifies each block of the Azure Blob Storage archive container file, which are uploaded separately and then committed as a single file
+        # ContentSettings sets the content type of the Azure Blob Storage archive container file, based on the archive format
+from azure.storage.blob import BlobBlock, BlobServiceClient, ContentSettings
+
+# Used to read every column that is not listed within blob_csv_dtypes as text, when the archive file is a Parquet file
+from collections import defaultdict
+
+# Used to upload several blocks of the Azure Blob Storage archive container file at the same time, using a pool of threads
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Used when working with and manipulating dates and times
+    # Used to build the date folder names and to compare the last modified date of each file against the listing checkpoint
+from datetime import datetime, timedelta, timezone
+
+# Used to build a file object that the CSV parser can read from while the Azure Blob Storage source container file is still being downloaded
+import io
+
+# Used to read and write the listing checkpoint file
+import json
+
+# Used to verify if the listing checkpoint file exists
+import os
+
+# Used to hand each downloaded piece of the Azure Blob Storage source container file from the thread that downloads the file to the CSV parser
+import queue
+
+# Used to download the Azure Blob Storage source container file in the background, while the previous piece of the file is being parsed
+import threading
+
+# Used to compress the Azure Blob Storage archive container file as a gzip CSV file, 1 chunk of rows at a time
+import zlib
+
+# Used to convert each chunk of rows into an Arrow table, and to read the archived file(s) back as Arrow tables
+import pyarrow as pa
+
+# Used to read the archived gzip CSV file(s) back as Arrow tables
+import pyarrow.csv as pa_csv
+
+# Used to write the Azure Blob Storage archive container file as a Parquet file, and to read the archived Parquet file(s) back
+import pyarrow.parquet as pq
+
+# Used to wait between checking whether the server-side copy of the Azure Blob Storage archive container file has completed
+import time
 
 # Enables the ability to utilize DataFrames, which are 2-dimension data structures, such as a 2-dimension arrays or a tables with rows and columns
 import pandas as pd
@@ -106,6 +160,458 @@ container_name = "<Container_Name>"
 # Name of the Azure Blob Storage archive container that the file(s) will be archived into, for future use if needed
 archive_container_name = "<Archive_Container_Name>"
 
+# The folder within the Azure Blob Storage source container that the file(s) are located within
+    # Only the files whose names start with this folder name are listed, such as "<Folder_Name>/"
+        # Set to "", if the files are not located within a folder
+blob_folder_name = ""
+
+# The format of the date folders within blob_folder_name, if the files are placed into a folder for each date, such as "%Y/%m/%d/" for <Folder_Name>/2024/01/31/
+    # Only the date folders from the listing checkpoint date, or blob_date_folder_days days ago, through today are listed, rather than the entire container
+        # Set to None, if the files are not placed into date folders
+blob_date_folder_format = None
+
+# The number of days before today, whose date folders are always listed
+    # Files that arrive late into an earlier date folder are still found, as long as they arrive within this number of days
+blob_date_folder_days = 1
+
+# The number of file names that are returned by each page of the listing
+    # Each page is only requested once the files within the previous page have been processed
+blob_page_size = 5000
+
+# The local file that records the last modified date of the newest file listed by the previous data pipeline execution
+    # Only the files modified after this date are processed, so the files that were already processed are skipped without being downloaded
+        # Set to None, to process every file within the Azure Blob Storage source container on every data pipeline execution
+blob_checkpoint_path = "<Path_To_Blob_Checkpoint_File>.json"
+
+# The number of seconds before the listing started, that the listing checkpoint is never moved past
+    # The files are listed in name order, so a file uploaded during the listing into a folder or page that was already listed can be older than a file listed after it
+        # Capping the listing checkpoint before the listing started means that file is still newer than the listing checkpoint during the next data pipeline execution
+            # The margin also covers the difference between the clock of this machine and the clock of Azure Blob Storage
+blob_checkpoint_skew_seconds = 300
+
+# A blob index tag filter used to find the files, such as "\"status\" = 'new'"
+    # Azure Blob Storage finds the files that match the filter itself, so the files do not need to be listed at all
+        # Blob index tags do not include the last modified date, so the listing checkpoint is not used while the filter is set
+            # Set to None, to list the files within blob_folder_name instead
+blob_tag_filter = None
+
+# The number of bytes of the Azure Blob Storage source container file that are downloaded at a time
+    # Only a few pieces of this size are held in memory at once, no matter how big the file is
+blob_read_size = 32 * 1024 * 1024
+
+# The number of ranged requests used to download each piece of the Azure Blob Storage source container file at the same time
+    # Each ranged request downloads 4 MB of the piece
+        # Set to 1 to download each piece with a single request
+blob_max_concurrency = 4
+
+# The number of downloaded pieces that can wait to be parsed, before the download waits for the CSV parser to catch up
+blob_read_queue_size = 2
+
+# The number of bytes within each block of the Azure Blob Storage archive container file
+    # Each block is uploaded separately, blob_max_concurrency blocks at the same time, and then committed as a single file
+        # A file can have at most 50000 blocks
+blob_block_size = 8 * 1024 * 1024
+
+# The format of the Azure Blob Storage archive container file(s)
+    # "CSV" - uncompressed CSV file, the same as the source file
+    # "CSV_GZIP" - gzip compressed CSV file, which is usually 5 to 10 times smaller than the CSV file
+    # "PARQUET" - zstd compressed Parquet file, which is smaller still and can be read back without parsing any text, see read_archived_blob
+        # The format is recorded within the archive_format metadata of each archive file, so the file can be read back without knowing its format beforehand
+blob_archive_format = "CSV"
+
+# The file extension that is added to the name of the Azure Blob Storage archive container file, for each archive format
+blob_archive_extensions = {
+    "CSV": ""
+    ,"CSV_GZIP": ".gz"
+    ,"PARQUET": ".parquet"
+}
+
+# The content type of the Azure Blob Storage archive container file, for each archive format
+blob_archive_content_types = {
+    "CSV": "text/csv"
+    ,"CSV_GZIP": "application/gzip"
+    ,"PARQUET": "application/vnd.apache.parquet"
+}
+
+# Copy the Azure Blob Storage source container file into the Azure Blob Storage archive container as it is, without downloading and uploading it
+    # The copy is done by Azure Blob Storage itself (server-side copy), while the file is read for the data load logic
+        # Only use when the archive file is meant to be exactly the same as the source file, as no columns are removed and no format changes are made
+            # Only used when blob_archive_format is "CSV", as the other archive formats are not the same as the source file
+                # Set to False to upload the converted chunks of rows from convert_blob_chunks as the archive file
+blob_archive_copy_source = False
+
+# The number of rows that are read from the Azure Blob Storage source container file, converted and archived at a time
+    # Streaming the file in chunks of rows keeps only a few chunks in memory at once, no matter how big the file is
+        # Use a large number of rows, such as 1000000
+blob_chunksize = 1000000
+
+# The data types of the columns within the Azure Blob Storage source container file, such as {'<Column_1>': 'string', '<Column_2>': 'Int64'}
+    # Each chunk of rows is read separately, so without a data type a column can be read as a different data type in each chunk of rows
+        # Such as float64 when the column is empty within the first chunk of rows, and text within a later chunk of rows
+            # Set to {}, to let the CSV parser choose the data type of each column within each chunk of rows
+blob_csv_dtypes = {}
+
+# The data types used to read each chunk of rows from the Azure Blob Storage source container file
+    # A Parquet file has a single set of columns and data types, taken from the first chunk of rows, that every later chunk of rows must match
+        # Every column that is not listed within blob_csv_dtypes is read as text when blob_archive_format is "PARQUET", so that every chunk of rows has the same data types
+if blob_archive_format == "PARQUET":
+
+    blob_read_dtypes = defaultdict(lambda: "string", blob_csv_dtypes)
+
+else:
+
+    blob_read_dtypes = blob_csv_dtypes or None
+
+# The number of Azure Blob Storage source container files that are deleted with a single request in Step 16
+    # Azure Blob Storage allows at most 256 files to be deleted with a single request
+blob_delete_batch_size = 256
+
+# The list collects the names of the Azure Blob Storage source container files that have been archived and are waiting to be deleted
+blob_processed_files = []
+
+# The dictionary collects the error for each Azure Blob Storage source container file that failed to be deleted
+    # A file that failed to be deleted is left within the Azure Blob Storage source container
+        # The listing checkpoint has usually already moved past the file, so it is NOT loaded again by the next data pipeline execution, unless blob_checkpoint_path is None or blob_lease_enabled is True
+            # A file modified within blob_checkpoint_skew_seconds of the start of the listing is newer than the listing checkpoint, so it is loaded again
+blob_failed_deletes = {}
+
+# Claim each Azure Blob Storage source container file with a lease before it is processed
+    # This allows several copies of this data pipeline (workers) to run at the same time, on the same or different machines, against the same container
+        # Only 1 worker can hold the lease on a file, so each file is only processed by the worker that claimed it, and the other workers skip it
+            # The file is deleted under the lease in Step 16, as soon as it has been archived, so a file is never deleted by a worker that does not hold its lease
+                # If a worker stops before the file is deleted, the lease expires after blob_lease_duration seconds and the file is claimed by the next worker that lists it
+                    # The listing checkpoint is not saved while this is set to True, as the other workers may still be processing the files that this worker skipped
+blob_lease_enabled = False
+
+# The number of seconds that each lease lasts before it expires, between 15 and 60 seconds
+    # The leases held by this worker are renewed every blob_lease_duration / 3 seconds by a background thread, while the files are being processed
+blob_lease_duration = 60
+
+# The dictionary collects the lease held by this worker for each Azure Blob Storage source container file that has been claimed and not yet deleted
+    # blob_lease_lock is held while the dictionary is changed or copied, as the leases are renewed by a background thread
+blob_active_leases = {}
+
+blob_lease_lock = threading.Lock()
+
+# Stops the background thread that renews the leases, once every file has been processed
+blob_lease_stop = threading.Event()
+
+# The dictionary collects the error for each lease that failed to be renewed
+    # The lease has expired and the file may have been claimed by another worker, so the file is not deleted by this worker
+blob_lost_leases = {}
+
+
+# A read-only file object over the Azure Blob Storage source container file, that the CSV parser can read from while the file is still being downloaded
+    # A background thread downloads the file blob_read_size bytes at a time, using blob_max_concurrency ranged requests for each piece,
+    # and hands each piece to the file object through a queue
+        # Once the queue is full, the background thread waits until the CSV parser has read a piece, so only a few pieces are held in memory at once
+            # If downloading the file fails, the error is raised by the CSV parser
+                # Closing the file object stops the background thread, so a file that fails to be processed does not leave the thread waiting on a full queue
+class BlobStreamReader(io.RawIOBase):
+
+    def __init__(self, blob_client):
+
+        self.blob_pieces = queue.Queue(maxsize = blob_read_queue_size)
+
+        self.blob_piece = memoryview(b"")
+
+        self.blob_download_complete = False
+
+        # Stops the background thread, once the file object is closed
+        self.blob_download_stop = threading.Event()
+
+        threading.Thread(target = self.download_blob_pieces, args = (blob_client,), daemon = True).start()
+
+    # Download the file 1 piece at a time and add each piece to the queue
+        # Every piece must match the ETag of the file when the download started, so that a file that is replaced during the download is not read as a mix of both files
+            # None is added to the queue once the entire file has been downloaded
+                # Stops downloading as soon as the file object is closed
+    def download_blob_pieces(self, blob_client):
+
+        try:
+
+            blob_properties = blob_client.get_blob_properties()
+
+            for blob_offset in range(0, blob_properties.size, blob_read_size):
+
+                if self.blob_download_stop.is_set():
+
+                    return
+
+                self.put_blob_piece(
+                    blob_client.download_blob(
+                        offset = blob_offset
+                        ,length = min(blob_read_size, blob_properties.size - blob_offset)
+                        ,max_concurrency = blob_max_concurrency
+                        ,etag = blob_properties.etag
+                        ,match_condition = MatchConditions.IfNotModified
+                    ).readall()
+                )
+
+        except Exception as blob_error:
+
+            self.put_blob_piece(blob_error)
+
+        self.put_blob_piece(None)
+
+    # Add a piece to the queue, checking every second whether the file object has been closed while the queue is full
+        # The piece is dropped once the file object has been closed, as nothing will read it
+    def put_blob_piece(self, blob_piece):
+
+        while not self.blob_download_stop.is_set():
+
+            try:
+
+                self.blob_pieces.put(blob_piece, timeout = 1)
+
+                return
+
+            except queue.Full:
+
+                continue
+
+    # Stop the background thread and release the pieces that are waiting within the queue
+    def close(self):
+
+        self.blob_download_stop.set()
+
+        while True:
+
+            try:
+
+                self.blob_pieces.get_nowait()
+
+            except queue.Empty:
+
+                break
+
+        self.blob_piece = memoryview(b"")
+
+        super().close()
+
+    def readable(self):
+
+        return True
+
+    # Copy the next bytes of the file into the buffer requested by the CSV parser
+        # Returns 0 once the entire file has been read
+    def readinto(self, buffer):
+
+        # Wait for the next piece once the current piece has been read
+        if not self.blob_piece and not self.blob_download_complete:
+
+            blob_piece = self.blob_pieces.get()
+
+            # Raise the error if downloading the file failed
+            if isinstance(blob_piece, Exception):
+
+                raise blob_piece
+
+            if blob_piece is None:
+
+                self.blob_download_complete = True
+
+            else:
+
+                self.blob_piece = memoryview(blob_piece)
+
+        blob_read_length = min(len(buffer), len(self.blob_piece))
+
+        buffer[:blob_read_length] = self.blob_piece[:blob_read_length]
+
+        self.blob_piece = self.blob_piece[blob_read_length:]
+
+        return blob_read_length
+
+
+# A write-only file object that the Parquet writer writes the Azure Blob Storage archive container file into
+    # The bytes written since the last call to take are handed to upload_blob_blocks, so the entire Parquet file is never held in memory
+        # The Parquet writer records the position of each row group, so tell returns the number of bytes written into the entire file
+class BlobArchiveSink(io.RawIOBase):
+
+    def __init__(self):
+
+        self.blob_archive_bytes = bytearray()
+
+        self.blob_archive_position = 0
+
+    def writable(self):
+
+        return True
+
+    def write(self, b):
+
+        self.blob_archive_bytes += b
+
+        self.blob_archive_position += len(b)
+
+        return len(b)
+
+    def tell(self):
+
+        return self.blob_archive_position
+
+    # Return the bytes written since the last call to take
+    def take(self):
+
+        blob_archive_data = bytes(self.blob_archive_bytes)
+
+        self.blob_archive_bytes.clear()
+
+        return blob_archive_data
+
+
+# Convert each chunk of rows from the Azure Blob Storage source container file into bytes of the blob_archive_format format, 1 chunk at a time
+    # Used to upload the archive file 1 chunk at a time in Step 15, rather than converting the entire file into a single CSV string
+        # For "CSV" and "CSV_GZIP", only the first chunk includes the header row
+def convert_blob_chunks(df_chunks):
+
+    # The gzip compressor keeps compressing across the chunks of rows, so the archive file is a single gzip file
+    blob_gzip_compressor = zlib.compressobj(wbits = zlib.MAX_WBITS | 16)
+
+    # The Parquet writer is created with the first chunk of rows, as it needs the columns of the file
+        # Each chunk of rows is written as a single row group of the Parquet file
+    blob_parquet_sink = BlobArchiveSink()
+
+    blob_parquet_writer = None
+
+    for blob_chunk_number, df_chunk in enumerate(df_chunks):
+
+        """
+        # Select the desired columns to keep from the df_chunk Pandas DataFrame
+            # This is similar to the SELECT clause in SQL
+        df_subset = df_chunk[
+            [
+                'COLUMN_NAME_1'
+                ,'COLUMN_NAME_2'
+                ,'COLUMN_NAME_...N'
+            ]
+        ]
+        """
+
+        # Use df_subset = df_chunk, if you are NOT using df_subset to remove specific columns from the file
+        df_subset = df_chunk
+
+        # ENTER THE DATA LOAD LOGIC HERE FOR LOADING EACH CHUNK OF ROWS INTO THE DESTINATION LOCATION, see Step 12
+
+        if blob_archive_format == "PARQUET":
+
+            # Every chunk of rows uses the columns of the first chunk of rows, as a Parquet file has a single set of columns
+            df_table = pa.Table.from_pandas(df_subset, schema = blob_parquet_writer.schema if blob_parquet_writer else None, preserve_index = False)
+
+            if blob_parquet_writer is None:
+
+                blob_parquet_writer = pq.ParquetWriter(blob_parquet_sink, df_table.schema, compression = "zstd")
+
+            blob_parquet_writer.write_table(df_table)
+
+            yield blob_parquet_sink.take()
+
+        elif blob_archive_format == "CSV_GZIP":
+
+            yield blob_gzip_compressor.compress(df_subset.to_csv(index = False, header = blob_chunk_number == 0).encode())
+
+        else:
+
+            yield df_subset.to_csv(index = False, header = blob_chunk_number == 0).encode()
+
+    # Write the end of the archive file, once every chunk of rows has been converted
+        # The Parquet footer records where each row group is located, and the gzip trailer records the checksum of the file
+    if blob_parquet_writer is not None:
+
+        blob_parquet_writer.close()
+
+        yield blob_parquet_sink.take()
+
+    if blob_archive_format == "CSV_GZIP":
+
+        yield blob_gzip_compressor.flush()
+
+
+# Upload the CSV bytes from convert_blob_chunks into the Azure Blob Storage archive container file, 1 block at a time
+    # The CSV bytes are split into blocks of blob_block_size bytes, and up to blob_max_concurrency blocks are uploaded (staged) at the same time
+        # Once every block has been uploaded, the list of blocks is committed, which creates the file, or overwrites an existing file, with the blocks in order
+            # Only the blocks that are waiting to be uploaded are held in memory, rather than the entire file
+def upload_blob_blocks(archive_blob_client, blob_csv_chunks):
+
+    blob_block_list = []
+
+    blob_block_futures = set()
+
+    blob_block_buffer = bytearray()
+
+    with ThreadPoolExecutor(max_workers = blob_max_concurrency) as blob_executor:
+
+        # Upload a single block of the file, waiting for an earlier block to finish uploading if too many blocks are already waiting
+        def stage_blob_block(blob_block_data):
+
+            nonlocal blob_block_futures
+
+            # The block ID must be the same length for every block within the file
+            blob_block_id = f"{len(blob_block_list):08d}"
+
+            blob_block_list.append(BlobBlock(block_id = blob_block_id))
+
+            if len(blob_block_futures) >= blob_max_concurrency * 2:
+
+                blob_block_done, blob_block_futures = wait(blob_block_futures, return_when = FIRST_COMPLETED)
+
+                # Raise the error if uploading a block failed
+                for blob_block_future in blob_block_done:
+
+                    blob_block_future.result()
+
+            blob_block_futures.add(blob_executor.submit(archive_blob_client.stage_block, blob_block_id, blob_block_data))
+
+        for blob_csv_chunk in blob_csv_chunks:
+
+            blob_block_buffer += blob_csv_chunk
+
+            while len(blob_block_buffer) >= blob_block_size:
+
+                stage_blob_block(bytes(blob_block_buffer[:blob_block_size]))
+
+                del blob_block_buffer[:blob_block_size]
+
+        # Upload the remaining bytes as the last block
+        if blob_block_buffer:
+
+            stage_blob_block(bytes(blob_block_buffer))
+
+        # Wait for every block to finish uploading, raising the error if uploading a block failed
+        for blob_block_future in blob_block_futures:
+
+            blob_block_future.result()
+
+    # The archive format is recorded within the metadata of the file
+    archive_blob_client.commit_block_list(
+        blob_block_list
+        ,content_settings = ContentSettings(content_type = blob_archive_content_types[blob_archive_format])
+        ,metadata = {"archive_format": blob_archive_format}
+    )
+
+
+# Copy the Azure Blob Storage source container file into the Azure Blob Storage archive container file, without downloading it
+    # Within the same Azure Blob Storage account, the copy is authorized by the account key, so the source file does not need to be public
+        # The copy is waited on before returning, so that the source file is not deleted in Step 16 before it has been copied
+def copy_blob_to_archive(blob_client, archive_blob_client, blob_csv_chunks):
+
+    archive_blob_client.start_copy_from_url(blob_client.url, metadata = {"archive_format": "CSV"})
+
+    # Read the source file for the data load logic within convert_blob_chunks, while the copy runs within Azure Blob Storage
+    for blob_csv_chunk in blob_csv_chunks:
+
+        pass
+
+    # Wait for the copy to complete
+    while (blob_copy := archive_blob_client.get_blob_properties().copy).status == "pending":
+
+        time.sleep(1)
+
+    if blob_copy.status != "success":
+
+        raise RuntimeError(f"The copy of the {blob_client.blob_name} file into the archive container did not succeed: {blob_copy.status} {blob_copy.status_description}")
+
 
 ####################################################################################################
 # Step 4: Establish a BlobServiceClient
@@ -113,6 +619,232 @@ archive_container_name = "<Archive_Container_Name>"
 ####################################################################################################
 
 
+# Load the listing checkpoint that was written by the previous data pipeline execution, if it exists
+    # The checkpoint records the newest last modified date that was listed, and the names of the files with that last modified date
+        # The file names are needed, as a file that arrives within the same second as the newest file has the same last modified date
+if blob_checkpoint_path and os.path.exists(blob_checkpoint_path):
+
+    with open(blob_checkpoint_path) as blob_checkpoint_file:
+
+        blob_checkpoint = json.load(blob_checkpoint_file)
+
+    blob_checkpoint["last_modified"] = datetime.fromisoformat(blob_checkpoint["last_modified"])
+
+else:
+
+    blob_checkpoint = {"last_modified": None, "names": []}
+
+# The newest last modified date listed by this data pipeline execution, which is saved as the listing checkpoint in Step 17
+    # Files modified after blob_checkpoint_skew_seconds before the listing started are still processed, but do not move the listing checkpoint forward
+        # The list of file names is copied, so that adding a file name to the new listing checkpoint does not also add it to the listing checkpoint being compared against
+blob_checkpoint_new = {"last_modified": blob_checkpoint["last_modified"], "names": list(blob_checkpoint["names"])}
+
+
+# The folders within the Azure Blob Storage source container that are listed
+    # 1 date folder for each date from the listing checkpoint date, or blob_date_folder_days days ago, through today, if blob_date_folder_format is set
+        # Otherwise, only blob_folder_name is listed
+def build_blob_prefixes():
+
+    if blob_date_folder_format is None:
+
+        return [blob_folder_name]
+
+    blob_today = datetime.now(timezone.utc).date()
+
+    blob_start_date = blob_today - timedelta(days = blob_date_folder_days)
+
+    if blob_checkpoint["last_modified"] is not None:
+
+        blob_start_date = min(blob_start_date, blob_checkpoint["last_modified"].date())
+
+    return [
+        blob_folder_name + (blob_start_date + timedelta(days = i)).strftime(blob_date_folder_format)
+        for i in range((blob_today - blob_start_date).days + 1)
+    ]
+
+
+# Identify the new Azure Blob Storage source container file(s), 1 page at a time
+    # Each page is only requested once the files within the previous page have been processed
+        # A file is new if it was modified after the listing checkpoint, or if it has the same last modified date but was not listed by the previous data pipeline execution
+def list_new_blobs(container_client):
+
+    # Let Azure Blob Storage find the files that match the blob index tag filter, if blob_tag_filter IS set
+    if blob_tag_filter:
+
+        for blob_page in container_client.find_blobs_by_tags(blob_tag_filter, results_per_page = blob_page_size).by_page():
+
+            for blob in blob_page:
+
+                if blob.name.startswith(blob_folder_name):
+
+                    yield blob.name
+
+        return
+
+    # The newest last modified date that the new listing checkpoint can be moved forward to
+    blob_checkpoint_limit = datetime.now(timezone.utc) - timedelta(seconds = blob_checkpoint_skew_seconds)
+
+    for blob_prefix in build_blob_prefixes():
+
+        for blob_page in container_client.list_blobs(name_starts_with = blob_prefix, results_per_page = blob_page_size).by_page():
+
+            for blob in blob_page:
+
+                if blob_checkpoint["last_modified"] is not None and (
+                    blob.last_modified < blob_checkpoint["last_modified"]
+                    or (blob.last_modified == blob_checkpoint["last_modified"] and blob.name in blob_checkpoint["names"])
+                ):
+
+                    continue
+
+                # Move the new listing checkpoint forward to the newest file, up to blob_checkpoint_limit
+                if blob.last_modified <= blob_checkpoint_limit:
+
+                    if blob_checkpoint_new["last_modified"] is None or blob.last_modified > blob_checkpoint_new["last_modified"]:
+
+                        blob_checkpoint_new["last_modified"] = blob.last_modified
+
+                        blob_checkpoint_new["names"] = []
+
+                    if blob.last_modified == blob_checkpoint_new["last_modified"]:
+
+                        blob_checkpoint_new["names"].append(blob.name)
+
+                yield blob.name
+
+
+# Read an Azure Blob Storage archive container file back as an Arrow table, such as when reprocessing earlier files
+    # The archive format is read from the archive_format metadata of the file
+        # A Parquet file is read back without parsing any text, and only the columns listed within columns are read, if columns is set
+            # Use read_archived_blob(...).to_pandas() to convert the Arrow table into a Pandas DataFrame
+def read_archived_blob(archive_container_client, archive_blob_name, columns = None):
+
+    archive_blob_downloader = archive_container_client.download_blob(archive_blob_name, max_concurrency = blob_max_concurrency)
+
+    archive_blob_format = archive_blob_downloader.properties.metadata.get("archive_format", "CSV")
+
+    archive_blob_data = pa.BufferReader(archive_blob_downloader.readall())
+
+    if archive_blob_format == "PARQUET":
+
+        return pq.read_table(archive_blob_data, columns = columns)
+
+    if archive_blob_format == "CSV_GZIP":
+
+        archive_blob_data = pa.CompressedInputStream(archive_blob_data, "gzip")
+
+    return pa_csv.read_csv(archive_blob_data, convert_options = pa_csv.ConvertOptions(include_columns = columns))
+
+
+# Claim the Azure Blob Storage source container file with a lease
+    # Returns None if another worker holds the lease on the file (409), or if the file has already been processed and deleted by another worker (404)
+def claim_blob(blob_client):
+
+    try:
+
+        blob_lease = blob_client.acquire_lease(lease_duration = blob_lease_duration)
+
+    except HttpResponseError as blob_lease_error:
+
+        if blob_lease_error.status_code in (404, 409):
+
+            return None
+
+        raise
+
+    with blob_lease_lock:
+
+        blob_active_leases[blob_client.blob_name] = blob_lease
+
+    print(f"Claimed the {blob_client.blob_name} file")
+
+    return blob_lease
+
+
+# Renew the leases on the claimed Azure Blob Storage source container files, once every blob_lease_duration / 3 seconds, until blob_lease_stop is set
+    # Runs within a background thread, so that a lease never expires while its worker is still processing the file, no matter how long a single chunk of rows or copy takes
+        # A lease that fails to be renewed has already expired and may have been claimed by another worker
+            # The lease is moved from blob_active_leases into blob_lost_leases, so that the file is not deleted by both workers
+def renew_blob_leases():
+
+    while not blob_lease_stop.wait(blob_lease_duration / 3):
+
+        with blob_lease_lock:
+
+            blob_renew_leases = dict(blob_active_leases)
+
+        for blob_name, blob_lease in blob_renew_leases.items():
+
+            try:
+
+                blob_lease.renew()
+
+            except HttpResponseError as blob_lease_error:
+
+                # A file that was deleted by this worker since the leases were copied is no longer within blob_active_leases, and is not a lost lease
+                with blob_lease_lock:
+
+                    if blob_active_leases.pop(blob_name, None) is not None:
+
+                        blob_lost_leases[blob_name] = blob_lease_error
+
+
+# Delete a single claimed Azure Blob Storage source container file under its lease, as soon as it has been archived
+    # The lease is only held while the file is being processed, so only 1 lease at a time is renewed by the background thread
+        # A file whose lease was lost, or that failed to be deleted, is recorded within blob_failed_deletes
+def delete_leased_blob(blob_service_client, blob_name):
+
+    with blob_lease_lock:
+
+        blob_lease = blob_active_leases.pop(blob_name, None)
+
+    if blob_lease is None:
+
+        blob_failed_deletes[blob_name] = f"The lease expired before the file was deleted: {blob_lost_leases.get(blob_name)}"
+
+        return
+
+    try:
+
+        blob_service_client.get_container_client(container_name).delete_blob(blob_name, lease = blob_lease)
+
+    except HttpResponseError as blob_delete_error:
+
+        blob_failed_deletes[blob_name] = f"{blob_delete_error.status_code} {blob_delete_error.reason}"
+
+        # Release the lease on a file that failed to be deleted, so that it can be claimed again without waiting for the lease to expire
+        try:
+
+            blob_lease.release()
+
+        except HttpResponseError:
+
+            pass
+
+
+# Delete the Azure Blob Storage source container files within blob_processed_files, using a single request for up to blob_delete_batch_size files
+    # raise_on_any_failure = False returns the response for each file, rather than raising an error once any file fails to be deleted
+        # The responses are returned in the same order as the files, so each failed file is recorded within blob_failed_deletes
+def delete_blob_batch(blob_service_client):
+
+    with blob_service_client.get_container_client(container_name) as delete_container_client:
+
+        for i in range(0, len(blob_processed_files), blob_delete_batch_size):
+
+            blob_delete_batch = blob_processed_files[i:i + blob_delete_batch_size]
+
+            blob_delete_responses = delete_container_client.delete_blobs(*blob_delete_batch, raise_on_any_failure = False)
+
+            for blob_delete_name, blob_delete_response in zip(blob_delete_batch, blob_delete_responses):
+
+                # A file that has been deleted returns a 202 status code
+                if blob_delete_response.status_code != 202:
+
+                    blob_failed_deletes[blob_delete_name] = f"{blob_delete_response.status_code} {blob_delete_response.reason}"
+
+    blob_processed_files.clear()
+
+
 # Establish the BlobServiceClient in order to interact with Azure Blob Storage at the account level
     # The connection to the BlobServiceClient closes automatically after the with block is exited
             # Therefore, no need for the blob_service_client.close() command
@@ -131,135 +863,277 @@ with BlobServiceClient.from_connection_string(connection_string) as blob_service
 
 
         ####################################################################################################
-        # Step 6: Identify the Azure Blob Storage source container file(s)
+        # Step 6: Identify the new Azure Blob Storage source container file(s), since the last data pipeline execution
         ####################################################################################################
 
 
-        # Create a list of files that are contained within the Azure Blob Storage source container, specified above
+        # Create a list of the new files that are contained within the Azure Blob Storage source container, specified above
             # This list will enable the ability to loop through each file, one at a time, and perform the same operations on each file
-        blob_list = container_client_list.list_blob_names()
+                # Only the folders within build_blob_prefixes are listed, 1 page at a time, so the listing grows with the number of new files rather than the size of the container
+        blob_list = list_new_blobs(container_client_list)
 
 
-    ####################################################################################################
-    # Step 7: Loop through the Azure Blob Storage source container file(s)
-    ####################################################################################################
+    # Renew the leases on the claimed files within a background thread, if blob_lease_enabled IS set to True
+        # The background thread is stopped once every file has been processed, even if processing a file fails
+    blob_lease_renewer = threading.Thread(target = renew_blob_leases, daemon = True)
 
+    if blob_lease_enabled:
 
-    # Loop through each of the files, one at a time, within the Azure Blob Storage source container, specified above
-        # This ensures that the same operations are performed on each file, one at a time
-    for blob in blob_list:
+        blob_lease_renewer.start()
+
+    # The file object that streams the file currently being processed, which is closed by the finally block below if processing the file fails
+    blob_stream_reader = None
+
+    try:
 
 
         ####################################################################################################
-        # Step 8: Establish a second ContainerClient
-            # Connect to the Azure Blob Storage source container, specified above
+        # Step 7: Loop through the Azure Blob Storage source container file(s)
         ####################################################################################################
 
 
-        # Establish the ContainerClient in order to interact with the Azure Blob Storage source container, specified above
-        with blob_service_client.get_container_client(container_name) as container_client:
+        # Loop through each of the files, one at a time, within the Azure Blob Storage source container, specified above
+            # This ensures that the same operations are performed on each file, one at a time
+        for blob in blob_list:
 
 
             ####################################################################################################
-            # Step 9: Establish a BlobClient
-                # Connect to the Azure Blob Storage source container file
+            # Step 8: Establish a second ContainerClient
+                # Connect to the Azure Blob Storage source container, specified above
             ####################################################################################################
 
 
-            # Establish the BlobClient in order to interact with the file within the Azure Blob Storage source container, specified above
-            with container_client.get_blob_client(blob) as blob_client:
-                
+            # Establish the ContainerClient in order to interact with the Azure Blob Storage source container, specified above
+            with blob_service_client.get_container_client(container_name) as container_client:
+
 
                 ####################################################################################################
-                # Step 10: Load the data from the Azure Blob Storage source container file into a Pandas DataFrame
+                # Step 9: Establish a BlobClient
+                    # Connect to the Azure Blob Storage source container file
                 ####################################################################################################
 
 
-                # Load the Azure Blob Storage source container file into a Pandas DataFrame
-                df = pd.read_csv(blob_client.download_blob())
+                # Establish the BlobClient in order to interact with the file within the Azure Blob Storage source container, specified above
+                with container_client.get_blob_client(blob) as blob_client:
 
-                # Verify if there is any data within the new Pandas DataFrame
-                    # Remove once the data has been verified
-                if not df.empty:
 
-                    print('The Pandas DataFrame contains data')
+                    # Claim the file with a lease, if blob_lease_enabled IS set to True
+                        # Skip the file if another worker has already claimed it, or has already processed and deleted it
+                    if blob_lease_enabled and claim_blob(blob_client) is None:
 
-                else:
+                        continue
+                
 
-                    print('The Pandas DataFrame is empty')
+                    ####################################################################################################
+                    # Step 10: Load the data from the Azure Blob Storage source container file into a Pandas DataFrame
+                    ####################################################################################################
 
-                # Display the data within the Pandas DataFrame
-                    # Remove once the data has been verified
-                print(df)
 
+                    # Stream the Azure Blob Storage source container file into the CSV parser, 1 chunk of rows at a time
+                        # Nothing is downloaded until the chunks of rows are read in Step 15
+                            # The file continues to be downloaded in the background while the previous chunk of rows is being parsed, converted and archived
+                        # The file object is closed once the file has been archived, or by the finally block below if processing the file fails
+                    blob_stream_reader = BlobStreamReader(blob_client)
 
-        ####################################################################################################
-        # Step 11: Convert the Pandas DataFrame to the proper format
-        ####################################################################################################
+                    df_chunks = pd.read_csv(io.BufferedReader(blob_stream_reader), chunksize = blob_chunksize, dtype = blob_read_dtypes)
+
+                    """
+                    # Load the Azure Blob Storage source container file into a single Pandas DataFrame, to verify the data
+                        # This downloads the entire file into memory
+                            # Remove once the data has been verified
+                    df = pd.read_csv(io.BufferedReader(BlobStreamReader(blob_client)), dtype = blob_read_dtypes)
+
+                    print(df)
+                    """
+
+
+            ####################################################################################################
+            # Step 11: Convert the Pandas DataFrame to the proper format
+            ####################################################################################################
     
 
-        # Convert the Pandas DataFrame to a CSV string in a new Pandas DataFrame
-            # This enables the ability to write the data within the Pandas DataFrame into a Azure Blob Storage file
-        df_csv = df_subset.to_csv(index = False)
+            # Convert each chunk of rows into CSV bytes, as each chunk of rows is read
+                # This enables the ability to write the data within each chunk of rows into a Azure Blob Storage file, without holding the entire file in memory
+            df_csv = convert_blob_chunks(df_chunks)
 
-        # Verify if there is any data within the df_csv Pandas DataFrame
-            # Comment out once the data has been verified
-        """
-        if not df_csv.empty:
 
-            print('The df_csv Pandas DataFrame contains data:')
-            print()
-            print(df_csv)
+            ####################################################################################################
+            # Step 12: ENTER THE DATA LOAD LOGIC HERE
+            ####################################################################################################
 
-        else:
 
-            print('The df_csv Pandas DataFrame is empty')
-        """
+            # ENTER THE DATA LOAD LOGIC HERE FOR LOADING THE DATA INTO THE DESTINATION LOCATION
+                # When streaming the file in chunks of rows, enter the data load logic within convert_blob_chunks in Step 3, so that each chunk of rows is loaded as it is read
+                    # To load the files into Snowflake without downloading them, see the "Connect to Snowflake - Template - Snowpipe" notebook
 
 
-        ####################################################################################################
-        # Step 12: ENTER THE DATA LOAD LOGIC HERE
-        ####################################################################################################
+            ####################################################################################################
+            # Step 13: Establish a third ContainerClient
+                # Connect to the Azure Blob Storage archive container, specified above
+            ####################################################################################################
 
 
-        # ENTER THE DATA LOAD LOGIC HERE FOR LOADING THE DATA INTO THE DESTINATION LOCATION
+            # Establish a second ContainerClient in order to interact with the Azure Blob Storage archive container, specified above
+            with blob_service_client.get_container_client(archive_container_name) as archive_container_client:
 
 
-        ####################################################################################################
-        # Step 13: Establish a third ContainerClient
-            # Connect to the Azure Blob Storage archive container, specified above
-        ####################################################################################################
+                ####################################################################################################
+                # Step 14: Establish a second BlobClient
+                    # Connect to the Azure Blob Storage archive container file
+                ####################################################################################################
+
+
+                # Establish a second BlobClient in order to interact with the archive file within the Azure Blob Storage archive container, specified above
+                    # The file extension of the archive format is added to the name of the archive file, such as .parquet
+                with archive_container_client.get_blob_client(blob + blob_archive_extensions[blob_archive_format]) as archive_blob_client:
+                
+
+                    ####################################################################################################
+                    # Step 15: Load the data within the formatted Pandas DataFrame into the Azure Blob Storage archive container file
+                    ####################################################################################################
+
+
+                    # Copy the Azure Blob Storage source container file as it is, if blob_archive_copy_source IS set to True and blob_archive_format IS "CSV"
+                    if blob_archive_copy_source and blob_archive_format == "CSV":
+
+                        copy_blob_to_archive(blob_client, archive_blob_client, df_csv)
 
+                    # Create a new file, or overwrite an existing file, within the Azure Blob Storage archive container
+                        # The bytes of each chunk of rows, in the blob_archive_format format, are uploaded as blocks as they are converted, which reads the Azure Blob Storage source container file
+                    else:
 
-        # Establish a second ContainerClient in order to interact with the Azure Blob Storage archive container, specified above
-        with blob_service_client.get_container_client(archive_container_name) as archive_container_client:
+                        upload_blob_blocks(archive_blob_client, df_csv)
+
+            blob_stream_reader.close()
 
 
             ####################################################################################################
-            # Step 14: Establish a second BlobClient
-                # Connect to the Azure Blob Storage archive container file
+            # Step 16: Delete the Azure Blob Storage source container file(s), up to blob_delete_batch_size files at a time
+                # Or each file as soon as it has been archived, if blob_lease_enabled is set to True
             ####################################################################################################
 
 
-            # Establish a second BlobClient in order to interact with the archive file within the Azure Blob Storage archive container, specified above
-            with archive_container_client.get_blob_client(blob) as archive_blob_client:
-                
+            # Delete the file from the Azure Blob Storage source container under its lease, as soon as it has been archived, if blob_lease_enabled IS set to True
+                # This way the lease is not held, or renewed, while the rest of the files are processed
+            if blob_lease_enabled:
 
-                ####################################################################################################
-                # Step 15: Load the data within the formatted Pandas DataFrame into the Azure Blob Storage archive container file
-                ####################################################################################################
+                delete_leased_blob(blob_service_client, blob)
 
+                continue
 
-                # Create a new file, or overwrite an existing file, within the Azure Blob Storage archive container
-                    # Set overwrite = False, if you do not want to overwrite existing files that contain the same name as the file you are currently trying to create
-                archive_blob_client.upload_blob(df_csv, overwrite = True)
+            # Add the file to the list of files that are waiting to be deleted from the Azure Blob Storage source container
+                # Deleting the files blob_delete_batch_size at a time uses 1 request for every blob_delete_batch_size files, rather than 1 request for every file
+            blob_processed_files.append(blob)
 
+            # Delete the files from the Azure Blob Storage source container, once blob_delete_batch_size files are waiting to be deleted
+                # This prevents the same files from being loaded into the destination multiple times, which will create duplicate data
+            if len(blob_processed_files) >= blob_delete_batch_size:
 
-        ####################################################################################################
-        # Step 16: Delete the Azure Blob Storage source container
-        ####################################################################################################
+                delete_blob_batch(blob_service_client)
+
+
+        # Delete the remaining files from the Azure Blob Storage source container, after every file has been processed
+        delete_blob_batch(blob_service_client)
+
+    finally:
+
+        if blob_stream_reader is not None:
 
+            blob_stream_reader.close()
 
-        # Delete the file from the Azure Blob Storage source container
-            # This prevents the same file from being loaded into the destination multiple times, which will create duplicate data
-        blob_client.delete_blob()
\ No newline at end of file
+        blob_lease_stop.set()
+
+        if blob_lease_renewer.is_alive():
+
+            blob_lease_renewer.join()
+
+
+####################################################################################################
+# Step 17: Save the listing checkpoint
+    # The checkpoint is only saved once every file has been processed
+        # This way a failed data pipeline execution lists the same files again during the next data pipeline execution
+            # The checkpoint is not saved if blob_lease_enabled is set to True
+####################################################################################################
+
+
+if blob_checkpoint_path and blob_checkpoint_new["last_modified"] is not None and not blob_lease_enabled:
+
+    with open(blob_checkpoint_path, "w") as blob_checkpoint_file:
+
+        json.dump({"last_modified": blob_checkpoint_new["last_modified"].isoformat(), "names": blob_checkpoint_new["names"]}, blob_checkpoint_file, indent = 4)
+
+
+# Display the files that failed to be deleted
+    # These files are still within the Azure Blob Storage source container, but the listing checkpoint has usually already moved past them
+        # Delete these files manually, as they are NOT loaded again by the next data pipeline execution, unless blob_checkpoint_path is None or blob_lease_enabled is True
+            # Or unless the file was modified within blob_checkpoint_skew_seconds of the start of the listing
+if blob_failed_deletes:
+
+    print()
+    print("The following files failed to be deleted:")
+    print()
+
+    for blob, blob_delete_error in blob_failed_deletes.items():
+
+        print(f"{blob}: {blob_delete_error}")
+
+"""
+# Reload Azure Blob Storage archive container file(s) into a Pandas DataFrame, such as when reprocessing earlier files
+    # Run after executing Steps 1 through 3
+        # Comment out once the files have been reprocessed
+with BlobServiceClient.from_connection_string(connection_string) as blob_service_client:
+
+    with blob_service_client.get_container_client(archive_container_name) as archive_container_client:
+
+        df_archive = pa.concat_tables(
+            [
+                read_archived_blob(archive_container_client, archive_blob_name)
+                for archive_blob_name in archive_container_client.list_blob_names(name_starts_with = "<Archive_Folder_Name>")
+            ]
+        ).to_pandas()
+
+print(df_archive)
+"""
+
+
+"""
+# Verify the lease-coordinated workers against Azurite, the Azure Blob Storage emulator
+    # Start Azurite before executing, such as: npx azurite-blob --blobPort 10000
+        # Export this notebook as a Python script with the Azurite connection string and container names below, blob_lease_enabled = True and blob_checkpoint_path = None
+            # Run after executing Steps 1 through 3
+                # Comment out once the workers have been verified
+import subprocess
+import sys
+
+connection_string = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+
+container_name = "lease-source-test"
+
+archive_container_name = "lease-archive-test"
+
+# Create the source and archive containers, and add 200 files into the source container
+with BlobServiceClient.from_connection_string(connection_string) as blob_service_client:
+
+    blob_service_client.create_container(container_name)
+
+    blob_service_client.create_container(archive_container_name)
+
+    for i in range(200):
+
+        blob_service_client.get_container_client(container_name).upload_blob(f"file_{i}.csv", f"A,B\n{i},{i * 2}\n")
+
+# Run 4 workers at the same time, each as a separate process
+blob_workers = [subprocess.Popen([sys.executable, "<Path_To_This_Notebook_Exported_As_A_Python_Script>.py"], stdout = subprocess.PIPE, text = True) for _ in range(4)]
+
+blob_claimed_files = [line for blob_worker in blob_workers for line in blob_worker.communicate()[0].splitlines() if line.startswith("Claimed the ")]
+
+# Each file should be claimed exactly once across all of the workers, which should display 200 and 200
+print(len(blob_claimed_files), len(set(blob_claimed_files)))
+
+# The source container should have no files left, and the archive container should have all 200 files
+with BlobServiceClient.from_connection_string(connection_string) as blob_service_client:
+
+    print(len(list(blob_service_client.get_container_client(container_name).list_blob_names())))
+
+    print(len(list(blob_service_client.get_container_client(archive_container_name).list_blob_names())))
+"""
@@ -1,27 +1,32 @@
 """
     The "<DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook" pulls <DATASET_NAME> data from <DATA_SOURCE_NAME> and loads it into Snowflake, where it is then cleaned up to make it ready for reporting purposes.
 
+    Rather than downloading the SFTP file path file(s) one at a time over a single SFTP connection, several files are downloaded at the same time over a pool of SFTP connections.
+    Each SFTP request waits on the round trip to the SFTP server, so a single connection spends most of its time waiting rather than downloading.
+    Each SFTP connection also keeps many read requests waiting on the SFTP server at once, with a large enough window size, so that a single large file is not limited by the round trip either.
+
     Data Pipeline Process:
 
         Step 1: Install Required Python Packages
-        
+
         Step 2: Install Required Python Libraries
 
         Step 3: Setup the credentials to connect to the SFTP
 
-        Step 4: Establish a SFTP client object
-
-        Step 5: Identify the SFTP file path file(s)
-
-        Step 6: Connect to the SFTP file path file
+        Step 4: Process a single SFTP file path file
+            1. Connect to the SFTP file path file
+            2. Load the data from the SFTP file path file into a Pandas DataFrame
+            3. Convert the Pandas DataFrame to the proper format
+            4. ENTER THE DATA LOAD LOGIC HERE
+            5. Delete the SFTP file path file, if sftp_delete_after_load is set to True
 
-        Step 7: Load the data from the SFTP file path file into a Pandas DataFrame
+        Step 5: Establish a pool of SFTP client objects and process the SFTP file path file(s) at the same time
+            1. Open sftp_max_connections SSH connections and establish a SFTP client object on each
+            2. Identify the new or changed SFTP file path file(s) that have finished being written
+            3. Process each file, with up to sftp_max_connections files being processed at the same time
+            4. Save the state of each SFTP file path file
 
-        Step 8: Convert the Pandas DataFrame to the proper format
-
-        Step 9: ENTER THE DATA LOAD LOGIC HERE
-
-        Step 10: Delete the SFTP file path file
+        Step 6: Run the data pipeline
 """
 
 
@@ -33,19 +38,19 @@
 
 
 # Install the datetime Python package
-    # Used when working with and manipulating dates and times	
+    # Used when working with and manipulating dates and times
 %pip install datetime
 
 # Install the pandas Python package
-    # Used to store data in Series and DataFrames	
+    # Used to store data in Series and DataFrames
 %pip install pandas
 
 # Install the paramiko Python package
-    # Used to connect to SFTP environments	
+    # Used to connect to SFTP environments
 %pip install paramiko
 
 # Install the snowflake-connector-python[pandas] Python package
-    # Used to connect to Snowflake and utilize Pandas DataFrames	
+    # Used to connect to Snowflake and utilize Pandas DataFrames
 %pip install snowflake-connector-python[pandas]
 
 # Restart the kernel to use updated packages
@@ -59,6 +64,24 @@
 ####################################################################################################
 
 
+# Used to open the SFTP connections and to process several SFTP files at the same time, using a pool of threads
+from concurrent.futures import ThreadPoolExecutor
+
+# Used to read and write the SFTP state file
+import json
+
+# Used to verify if the SFTP state file exists
+import os
+
+# Used to hand each SFTP file name to the next SFTP connection that is free
+import queue
+
+# Used to identify the folders within the SFTP file path, which are skipped
+import stat
+
+# Used to compare the last modified date of each SFTP file against the current time
+import time
+
 # Enables the ability to connect to the SFTP
     # pysftp not longer being maintained, therefore should use paramiko instead
 import paramiko
@@ -69,25 +92,21 @@ import pandas as pd
 
 ####################################################################################################
 # Step 3: Setup the credentials to connect to the SFTP
-    # Open a SSH connection and connect to the SFTP
-        # SSH uses encryption to establish a secure connection between a client and a server, such as a SFTP server
+    # SSH uses encryption to establish a secure connection between a client and a server, such as a SFTP server
 ####################################################################################################
 
 
-# Establish the SSHClient in order to interact with the SFTP SSH server
-ssh_client = paramiko.SSHClient()
+# The host name of the SFTP SSH server
+sftp_host_name = "<Host_Name>"
 
-# Set the policy for handling unknown host keys to autmoatically add the host keys to the known hosts file
-ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+# The port number of the SFTP SSH server
+sftp_port = "<Port_Number>"
 
-# Connect to the SFTP SSH server
-ssh_client.connect(
-    hostname = "<Host_Name>"
-    ,port = "<Port_Number>"
-    ,username = "<Username>"
-    ,password = "<Password>"
-    ,look_for_keys = False
-)
+# The username used to connect to the SFTP SSH server
+sftp_username = "<Username>"
+
+# The password used to connect to the SFTP SSH server
+sftp_password = "<Password>"
 
 # Set the SFTP file path that contains the source file(s)
     # "." is the default file path used if no file path is specified
@@ -95,95 +114,584 @@ ssh_client.connect(
             # i.e. the file(s) are not stored in a folder
 sftp_file_path = "<Path_To_SFTP_File(s)>"
 
+# The number of SFTP connections that are opened, which is the most files that are downloaded at the same time
+    # Each SFTP connection is a separate SSH connection to the SFTP SSH server, so the files do not wait on each other
+        # Check how many connections the SFTP SSH server allows for a single user, as some servers only allow a few, such as 10
+            # Set to 1 to download the files one at a time
+sftp_max_connections = 8
+
+# The number of bytes that the SFTP server can send on each SFTP connection before it waits for the data pipeline to confirm that the bytes were received (the SSH window size)
+    # A single SFTP connection can download at most sftp_window_size bytes per round trip to the SFTP server, no matter how fast the network is
+        # Set to at least the network speed multiplied by the round trip time, such as 12.5 MB per second (100 Mbps) * 0.2 seconds = 2.5 MB
+            # The paramiko default is 2 MB, which is too small for SFTP servers that are far away
+sftp_window_size = 32 * 1024 * 1024
+
+# The largest SSH packet that the SFTP server can send
+    # Each SFTP read request returns 32 KB of the file plus a small header, which does not fit within the paramiko default of 32 KB and is split into 2 packets
+        # 64 KB fits each response within a single packet
+sftp_max_packet_size = 64 * 1024
+
+# The number of 32 KB read requests for each SFTP file that are sent to the SFTP server without waiting for the earlier read requests to return (pipelined)
+    # The file is downloaded in the background as soon as it is opened, while the earlier pieces of the file are parsed
+        # sftp_max_concurrent_requests * 32 KB should be at least sftp_window_size, so that the window is kept full
+            # paramiko waits 10 milliseconds each time this number of read requests are waiting to return, so a small number, such as 64, slows down the download
+            # Set to None to send every read request for the file at once
+sftp_max_concurrent_requests = 1024
+
+# The number of bytes read from each SFTP file at a time, once its pieces have been downloaded
+    # Reading large pieces of the file reduces the number of times the CSV parser has to ask for more of the file
+sftp_read_buffer_size = 1024 * 1024
+
+# The number of SFTP file names that can wait to be picked up by a free SFTP connection
+    # Once the queue is full, adding file names waits until a SFTP connection has picked up a file
+sftp_queue_size = sftp_max_connections * 2
+
+# Delete each SFTP file after it has been loaded into the destination
+    # Set to False, if the SFTP file path keeps a history of the files that should not be deleted
+        # The SFTP state file below still prevents the files that have already been loaded from being loaded again
+sftp_delete_after_load = True
+
+# The local file that records the size and last modified date of every file within the SFTP file path, and whether the file has been loaded
+    # A file with the same size and last modified date as a file that has already been loaded is skipped without being opened
+        # Set to None to process every file within the SFTP file path on every data pipeline execution
+sftp_state_path = "<Path_To_SFTP_State_File>.json"
+
+# The number of seconds since a SFTP file was last modified before the file is treated as finished being written
+    # A file that was modified more recently is only processed once a later data pipeline execution finds the file with the same size and last modified date,
+    # or once the file has not been modified for sftp_settle_seconds seconds
+        # When sftp_state_path is None, the size and last modified date are not kept between data pipeline executions,
+        # so a file that was modified more recently is only processed once it has not been modified for sftp_settle_seconds seconds
+            # This prevents a file that is still being written by the source, which is still growing, from being loaded part way through
+                # The last modified date is set by the SFTP server, so allow for any difference between the SFTP server clock and the local clock
+                    # Set to 0 to process every file as soon as it is found, such as when the source writes each file under a temporary name and then renames it
+sftp_settle_seconds = 300
+
+# The dictionary collects the error for each SFTP file that failed to be processed
+    # A failed file is not deleted from the SFTP file path, so that it is processed again by the next data pipeline execution
+sftp_failed_files = {}
+
+
+# Load the SFTP state file that was written by the previous data pipeline execution, if it exists
+if sftp_state_path and os.path.exists(sftp_state_path):
+
+    with open(sftp_state_path) as sftp_state_file:
+
+        sftp_state = json.load(sftp_state_file)
+
+else:
+
+    sftp_state = {}
+
+
+# Open a SSH connection and connect to the SFTP
+def connect_sftp():
+
+    # Establish the SSHClient in order to interact with the SFTP SSH server
+    ssh_client = paramiko.SSHClient()
+
+    # Set the policy for handling unknown host keys to autmoatically add the host keys to the known hosts file
+    ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    # Connect to the SFTP SSH server
+    ssh_client.connect(
+        hostname = sftp_host_name
+        ,port = sftp_port
+        ,username = sftp_username
+        ,password = sftp_password
+        ,look_for_keys = False
+    )
+
+    return ssh_client
+
+
+# Establish a SFTP client object on a SSH connection, which enables the ability to interact with the SFTP
+    # The SFTP client object is established straight from the SSH connection (Transport), rather than using open_sftp, so that the window size and packet size are set
+def open_sftp(ssh_client):
+
+    return paramiko.SFTPClient.from_transport(
+        ssh_client.get_transport()
+        ,window_size = sftp_window_size
+        ,max_packet_size = sftp_max_packet_size
+    )
+
 
 ####################################################################################################
-# Step 4: Establish a SFTP client object
+# Step 4: Process a single SFTP file path file
+    # Each SFTP connection runs through the steps below for 1 file at a time
+        # While this file waits on the SFTP server, the other SFTP connections continue with their own files
 ####################################################################################################
 
 
-# Establish a SFTP client object, which enables the ability to interact with the SFTP
-    # The connection to the SFTP closes automatically after the with block is exited
-        # Therefore, no need for the sftp.close() command
-with ssh_client.open_sftp() as sftp:
+def process_sftp_file(sftp, file):
 
 
     ####################################################################################################
-    # Step 5: Identify the SFTP file path file(s)
-        # Loop through the SFTP file path file(s)
+    # Connect to the SFTP file path file
+        # Open the SFTP file path file
     ####################################################################################################
 
 
-    # Create a list of files that are contained within the SFTP file path, specified above
-        # Loop through each of the files, one at a time, within the SFTP file path, specified above
-            # This ensures that the same operations are performed on each file, one at a time
-    for file in sftp.listdir(sftp_file_path):
+    # Open the SFTP file in order to interact with the file within the SFTP file path, specified above
+        # The file is automatically closed after the with block is exited
+            # Therefore no need for the remote_file.close() command
+        # bufsize = sftp_read_buffer_size reads the file sftp_read_buffer_size bytes at a time
+    with sftp.open(f"{sftp_file_path}/{file}", bufsize = sftp_read_buffer_size) as sftp_file:
 
 
         ####################################################################################################
-        # Step 6: Connect to the SFTP file path file
-            # Open the SFTP file path file
+        # Load the data from the SFTP file path file into a Pandas DataFrame
         ####################################################################################################
 
 
-        # Open the SFTP file in order to interact with the file within the SFTP file path, specified above
-            # The file is automatically closed after the with block is exited
-                # Therefore no need for the remote_file.close() command
-        with sftp.open(file) as sftp_file:
-        
+        # Prefetches the data within the SFTP file in the background as soon as the file is open
+        # Prefetch helps speed up the process of pulling the data from the SFTP file and loading it to the df Pandas DataFrame
+            # Up to sftp_max_concurrent_requests read requests are sent at the same time, rather than waiting on each read request
+                # The size of the file from scan_sftp_files is used, rather than requesting the size of the file from the SFTP server again
+        sftp_file.prefetch(sftp_state.get(file, {}).get("size"), max_concurrent_requests = sftp_max_concurrent_requests)
 
-            ####################################################################################################
-            # Step 7: Load the data from the SFTP file path file into a Pandas DataFrame
-            ####################################################################################################
+        # Load the SFTP file into the a Pandas DataFrame
+        df = pd.read_csv(sftp_file)
 
+        # Verify if there is any data within the new Pandas DataFrame
+            # Remove once the data has been verified
+        if not df.empty:
 
-            # Prefetches the data within the SFTP file in the background as soon as the file is open
-            # Prefetch helps speed up the process of pulling the data from the SFTP file and loading it to the df Pandas DataFrame
-            sftp_file.prefetch()
+            print(f'The Pandas DataFrame for the {file} file contains data')
 
-            # Load the SFTP file into the a Pandas DataFrame
-            df = pd.read_csv(sftp_file)
+        else:
 
-            # Verify if there is any data within the new Pandas DataFrame
-                # Remove once the data has been verified
-            if not df.empty:
+            print(f'The Pandas DataFrame for the {file} file is empty')
 
-                print('The Pandas DataFrame contains data')
 
-            else:
+    ####################################################################################################
+    # Convert the Pandas DataFrame to the proper format
+    ####################################################################################################
 
-                print('The Pandas DataFrame is empty')
 
-            # Display the data within the Pandas DataFrame
-                # Remove once the data has been verified
-            print(df)
-        
+    # Convert the Pandas DataFrame to a CSV string in a new Pandas DataFrame
+        # This enables the ability to write the data within the Pandas DataFrame into a Azure Blob Storage file
+    df_string = df.to_csv(index = False)
 
-        ####################################################################################################
-        # Step 8: Convert the Pandas DataFrame to the proper format
-        ####################################################################################################
-    
 
-        # Convert the Pandas DataFrame to a CSV string in a new Pandas DataFrame
-            # This enables the ability to write the data within the Pandas DataFrame into a Azure Blob Storage file
-        df_string = df.to_csv(index = False)
+    ####################################################################################################
+    # ENTER THE DATA LOAD LOGIC HERE
+    ####################################################################################################
 
-        # Display the data within the new Pandas DataFrame
-            # Remove once the data has been verified
-        print(df_string)
 
+    # ENTER THE DATA LOAD LOGIC HERE FOR LOADING THE DATA INTO THE DESTINATION LOCATION
 
-        ####################################################################################################
-        # Step 9: ENTER THE DATA LOAD LOGIC HERE
-        ####################################################################################################
 
+    ####################################################################################################
+    # Delete the SFTP file path file
+    ####################################################################################################
 
-        # ENTER THE DATA LOAD LOGIC HERE FOR LOADING THE DATA INTO THE DESTINATION LOCATION
 
+    # Delete the SFTP file after it has been loaded into the destination, so that the file does not get loaded again
+        # Only if sftp_delete_after_load IS set to True
+    if sftp_delete_after_load:
 
-        ####################################################################################################
-        # Step 10: Delete the SFTP file path file
-        ####################################################################################################
+        sftp.remove(f"{sftp_file_path}/{file}")
+
+
+# Identify the new or changed SFTP file path file(s) that have finished being written
+    # listdir_attr returns the name, size and last modified date of every file with a single request, so no file is opened to find out whether it has changed
+        # A file with the same size and last modified date as when it was loaded is skipped
+        # A new or changed file is only returned once it has finished being written, see sftp_settle_seconds
+            # Without the SFTP state file, every file is new, so a file is only returned once it has not been modified for sftp_settle_seconds seconds
+            # The state of every file is recorded within sftp_state, and files that are no longer within the SFTP file path are removed from sftp_state
+def scan_sftp_files(sftp):
+
+    sftp_scan_time = time.time()
+
+    sftp_scanned_state = {}
+
+    sftp_ready_files = []
+
+    for sftp_attr in sftp.listdir_attr(sftp_file_path):
+
+        # Skip the folders within the SFTP file path
+        if sftp_attr.st_mode is not None and stat.S_ISDIR(sftp_attr.st_mode):
+
+            continue
+
+        file = sftp_attr.filename
+
+        sftp_file_state = sftp_state.get(file, {})
+
+        # The file has not changed since the previous data pipeline execution if its size and last modified date are the same
+        sftp_file_unchanged = sftp_file_state.get("size") == sftp_attr.st_size and sftp_file_state.get("mtime") == sftp_attr.st_mtime
+
+        # Skip the file if it has not changed since it was loaded
+        if sftp_file_unchanged and sftp_file_state.get("loaded"):
+
+            sftp_scanned_state[file] = sftp_file_state
+
+            continue
+
+        sftp_scanned_state[file] = {"size": sftp_attr.st_size, "mtime": sftp_attr.st_mtime, "loaded": False}
+
+        # Process the file if it has not changed since the previous data pipeline execution, or if it has not been modified for sftp_settle_seconds seconds
+            # A file can only be unchanged since the previous data pipeline execution if sftp_state_path is set, or if the data pipeline has already been executed within this session
+        if sftp_file_unchanged or sftp_scan_time - sftp_attr.st_mtime >= sftp_settle_seconds:
+
+            sftp_ready_files.append(file)
+
+        else:
+
+            print(f"The {file} file is still being written and will be processed by a later data pipeline execution")
+
+    sftp_state.clear()
+
+    sftp_state.update(sftp_scanned_state)
+
+    return sftp_ready_files
+
+
+# Save the state of every SFTP file path file into the SFTP state file, if sftp_state_path IS set
+def save_sftp_state():
+
+    if sftp_state_path:
+
+        with open(sftp_state_path, "w") as sftp_state_file:
+
+            json.dump(sftp_state, sftp_state_file, indent = 4)
+
+
+# Process the SFTP files within the queue, 1 file at a time, over a single SFTP connection
+    # sftp_max_connections of these run at the same time, 1 for each SFTP connection
+        # A file that fails to be processed is recorded within sftp_failed_files and the SFTP connection moves on to the next file
+            # None within the queue tells the SFTP connection that there are no more files
+def process_sftp_queue(sftp, sftp_queue):
+
+    while (file := sftp_queue.get()) is not None:
+
+        try:
+
+            process_sftp_file(sftp, file)
+
+            # Record that the file has been loaded, so that it is skipped until it changes
+            sftp_state[file]["loaded"] = True
+
+        except Exception as sftp_error:
+
+            sftp_failed_files[file] = sftp_error
+
+
+####################################################################################################
+# Step 5: Establish a pool of SFTP client objects and process the SFTP file path file(s) at the same time
+####################################################################################################
+
+
+def process_sftp_files():
+
+    # The SSH connections that have been opened, which are closed in the finally block below
+        # Each SSH connection is added as soon as it has been opened, so that if opening another SSH connection fails, the SSH connections that were already opened are still closed
+    ssh_clients = []
+
+    try:
+
+        # Open sftp_max_connections SSH connections at the same time, rather than waiting on each SSH handshake one at a time
+            # The pool of threads waits for every SSH connection to finish opening after the with block is exited, even if opening a SSH connection failed
+                # list raises the error of a SSH connection that failed to open
+        with ThreadPoolExecutor(max_workers = sftp_max_connections) as sftp_executor:
+
+            list(sftp_executor.map(lambda _: ssh_clients.append(connect_sftp()), range(sftp_max_connections)))
+
+        # Establish a SFTP client object on each SSH connection, which enables the ability to interact with the SFTP
+        sftp_clients = [open_sftp(ssh_client) for ssh_client in ssh_clients]
+
+        # The queue holds the names of the SFTP files that are waiting to be picked up by a free SFTP connection
+        sftp_queue = queue.Queue(maxsize = sftp_queue_size)
+
+        # Start 1 thread for each SFTP connection, each processing the files within the queue
+            # The pool of threads waits for every file to be processed after the with block is exited
+        with ThreadPoolExecutor(max_workers = sftp_max_connections) as sftp_executor:
+
+            for sftp in sftp_clients:
+
+                sftp_executor.submit(process_sftp_queue, sftp, sftp_queue)
+
+            try:
+
+                # Create a list of the new or changed files that are contained within the SFTP file path, specified above
+                    # Add each file to the queue, waiting for a SFTP connection to pick up a file whenever the queue is full
+                for file in scan_sftp_files(sftp_clients[0]):
+
+                    sftp_queue.put(file)
+
+            finally:
+
+                # Tell each SFTP connection that there are no more files, even if listing the files failed
+                for _ in sftp_clients:
+
+                    sftp_queue.put(None)
+
+    finally:
+
+        # Close every SSH connection, and the SFTP client object on it, even if the data pipeline fails
+        for ssh_client in ssh_clients:
+
+            ssh_client.close()
+
+        # Save the state of every file, including the files that were loaded before the data pipeline failed
+        save_sftp_state()
+
+
+####################################################################################################
+# Step 6: Run the data pipeline
+####################################################################################################
 
 
-        # Delete the SFTP file after it has been loaded into the destination, so that the file does not get loaded again
-        sftp.remove(f"{sftp_file_path}/{file}")
\ No newline at end of file
+# Run every step above until every SFTP file path file has been processed
+process_sftp_files()
+
+# Display the files that failed to be processed
+    # These files are still within the SFTP file path and will be processed by the next data pipeline execution
+if sftp_failed_files:
+
+    print()
+    print("The following files failed to be processed:")
+    print()
+
+    for file, sftp_error in sftp_failed_files.items():
+
+        print(f"{file}: {sftp_error}")
+
+
+"""
+# Compare the time of processing the SFTP files over 1 SFTP connection against 8 SFTP connections, using an in-process paramiko SFTP server
+    # Every connection to the SFTP server passes through a local relay that delays every piece of data by sftp_test_latency seconds in each direction,
+    # which is similar to a SFTP server that is 50 milliseconds away
+        # Run in place of Step 6, after executing Steps 1 through 5
+            # Comment out once the pool of SFTP connections has been verified
+import os
+import socket
+import tempfile
+import threading
+import time
+
+sftp_test_latency = 0.025
+
+sftp_test_folder = tempfile.mkdtemp()
+
+sftp_test_host_key = paramiko.RSAKey.generate(2048)
+
+
+# Allow any username and password, and allow the sftp subsystem to be opened
+class TestSSHServer(paramiko.ServerInterface):
+
+    def check_auth_password(self, username, password):
+
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+
+        return paramiko.OPEN_SUCCEEDED
+
+
+# An open file within sftp_test_folder, which the prefetch uses to find the size of the file
+class TestSFTPHandle(paramiko.SFTPHandle):
+
+    def stat(self):
+
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+
+
+# Serve the files within sftp_test_folder, which only needs to list, open, stat and remove files
+class TestSFTPServer(paramiko.SFTPServerInterface):
+
+    def list_folder(self, path):
+
+        return [paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(sftp_test_folder, name)), name) for name in os.listdir(sftp_test_folder)]
+
+    def stat(self, path):
+
+        return paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(sftp_test_folder, os.path.basename(path))))
+
+    lstat = stat
+
+    def open(self, path, flags, attr):
+
+        sftp_test_handle = TestSFTPHandle(flags)
+
+        sftp_test_handle.readfile = open(os.path.join(sftp_test_folder, os.path.basename(path)), "rb")
+
+        return sftp_test_handle
+
+    def remove(self, path):
+
+        os.remove(os.path.join(sftp_test_folder, os.path.basename(path)))
+
+        return paramiko.SFTP_OK
+
+
+# Accept SSH connections on a local port, and serve each connection on its own thread
+def serve_test_sftp(sftp_test_listener):
+
+    while True:
+
+        sftp_test_transport = paramiko.Transport(sftp_test_listener.accept()[0])
+
+        sftp_test_transport.add_server_key(sftp_test_host_key)
+
+        sftp_test_transport.set_subsystem_handler("sftp", paramiko.SFTPServer, TestSFTPServer)
+
+        sftp_test_transport.start_server(server = TestSSHServer())
+
+
+# Copy the bytes from one socket to another, delivering each piece sftp_test_latency seconds after it was received
+    # This adds a round trip of 2 * sftp_test_latency seconds to every SFTP request, without limiting how many bytes can be sent
+def delay_test_socket(sftp_test_source, sftp_test_target):
+
+    sftp_test_pieces = []
+
+    sftp_test_ready = threading.Condition()
+
+    def send_pieces():
+
+        while True:
+
+            with sftp_test_ready:
+
+                while not sftp_test_pieces:
+
+                    sftp_test_ready.wait()
+
+                sftp_test_received, sftp_test_piece = sftp_test_pieces.pop(0)
+
+            time.sleep(max(0, sftp_test_received + sftp_test_latency - time.monotonic()))
+
+            if not sftp_test_piece:
+
+                sftp_test_target.close()
+
+                return
+
+            sftp_test_target.sendall(sftp_test_piece)
+
+    threading.Thread(target = send_pieces, daemon = True).start()
+
+    while True:
+
+        try:
+
+            sftp_test_piece = sftp_test_source.recv(65536)
+
+        except OSError:
+
+            sftp_test_piece = b""
+
+        with sftp_test_ready:
+
+            sftp_test_pieces.append((time.monotonic(), sftp_test_piece))
+
+            sftp_test_ready.notify()
+
+        if not sftp_test_piece:
+
+            return
+
+
+# Accept connections on a second local port and connect each one to the SSH server through a pair of delayed sockets
+def serve_test_latency(sftp_test_proxy, sftp_test_server_port):
+
+    while True:
+
+        sftp_test_client_socket = sftp_test_proxy.accept()[0]
+
+        sftp_test_server_socket = socket.create_connection(("127.0.0.1", sftp_test_server_port))
+
+        for sftp_test_sockets in [(sftp_test_client_socket, sftp_test_server_socket), (sftp_test_server_socket, sftp_test_client_socket)]:
+
+            threading.Thread(target = delay_test_socket, args = sftp_test_sockets, daemon = True).start()
+
+
+sftp_test_listener = socket.create_server(("127.0.0.1", 0))
+
+sftp_test_proxy = socket.create_server(("127.0.0.1", 0))
+
+threading.Thread(target = serve_test_sftp, args = (sftp_test_listener,), daemon = True).start()
+
+threading.Thread(target = serve_test_latency, args = (sftp_test_proxy, sftp_test_listener.getsockname()[1]), daemon = True).start()
+
+sftp_host_name = "127.0.0.1"
+
+sftp_port = sftp_test_proxy.getsockname()[1]
+
+sftp_username = "test"
+
+sftp_password = "test"
+
+sftp_file_path = "."
+
+# Time the data pipeline with 1 SFTP connection and with 8 SFTP connections, against 40 files of 20000 rows (about 500 KB) each
+for sftp_max_connections in [1, 8]:
+
+    for i in range(40):
+
+        pd.DataFrame({"ORDER_ID": range(20000), "AMOUNT": [j / 7 for j in range(20000)]}).to_csv(os.path.join(sftp_test_folder, f"file_{i}.csv"), index = False)
+
+    sftp_queue_size = sftp_max_connections * 2
+
+    sftp_failed_files = {}
+
+    sftp_state_path = None
+
+    sftp_state = {}
+
+    sftp_settle_seconds = 0
+
+    sftp_test_start = time.perf_counter()
+
+    process_sftp_files()
+
+    print(f"{sftp_max_connections} SFTP connection(s): {time.perf_counter() - sftp_test_start:.2f} seconds, {len(os.listdir(sftp_test_folder))} files left, {len(sftp_failed_files)} failed")
+"""
+
+"""
+# Compare the download speed of a single large SFTP file with the paramiko default settings against the tuned settings within Step 3
+    # Uses the in-process paramiko SFTP server and the local relay from the comparison above, so run the comparison above first
+        # sftp_test_latency = 0.15 is similar to a SFTP server that is 300 milliseconds away, such as a SFTP server on another continent
+            # The SFTP server, the relay and the data pipeline share a single Python process, so the download speed is limited by the Python process rather than the network
+            # Comment out once the SFTP connection settings have been verified
+sftp_test_latency = 0.15
+
+with open(os.path.join(sftp_test_folder, "large_file.csv"), "wb") as sftp_test_file:
+
+    sftp_test_file.write(os.urandom(32 * 1024 * 1024))
+
+# Each row is (sftp_window_size, sftp_max_packet_size, sftp_max_concurrent_requests, sftp_read_buffer_size)
+    # The first row is the paramiko default settings
+sftp_test_settings = {
+    "paramiko defaults": (2 * 1024 * 1024, 32 * 1024, None, -1)
+    ,"tuned settings": (sftp_window_size, sftp_max_packet_size, sftp_max_concurrent_requests, sftp_read_buffer_size)
+}
+
+for sftp_test_name, (sftp_window_size, sftp_max_packet_size, sftp_max_concurrent_requests, sftp_read_buffer_size) in sftp_test_settings.items():
+
+    ssh_client = connect_sftp()
+
+    sftp = open_sftp(ssh_client)
+
+    sftp_test_start = time.perf_counter()
+
+    with sftp.open(f"{sftp_file_path}/large_file.csv", bufsize = sftp_read_buffer_size) as sftp_file:
+
+        sftp_file.prefetch(32 * 1024 * 1024, max_concurrent_requests = sftp_max_concurrent_requests)
+
+        sftp_test_bytes = 0
+
+        while sftp_test_piece := sftp_file.read(1024 * 1024):
+
+            sftp_test_bytes += len(sftp_test_piece)
+
+    sftp_test_seconds = time.perf_counter() - sftp_test_start
+
+    ssh_client.close()
+
+    print(f"{sftp_test_name}: {sftp_test_bytes / 1024 / 1024:.0f} MB in {sftp_test_seconds:.2f} seconds, {sftp_test_bytes / 1024 / 1024 / sftp_test_seconds:.1f} MB per second")
+"""
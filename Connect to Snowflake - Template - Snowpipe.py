@@ -0,0 +1,598 @@
+"""
+    The "<DATA_SOURCE_NAME> <DATASET_NAME> Data Load Notebook" loads <DATASET_NAME> data from Azure Blob Storage into Snowflake with Snowpipe, where it is then cleaned up to make it ready for reporting purposes.
+
+    Rather than downloading each Azure Blob Storage file into a Pandas DataFrame and writing it back out, Snowflake loads the files straight from the STG_AZURE_BLOB stages.
+    Each time a file is created within Azure Blob Storage, Event Grid sends a Blob Created event into an Azure Storage Queue, and the file is loaded into its TRANSIENT table within minutes.
+        AUTO_INGEST: Snowflake reads the Azure Storage Queue itself, through the NI_AZURE_BLOB_EVENT_GRID notification integration
+        REST API: this notebook reads the Azure Storage Queue and submits the files to each pipe through the Snowpipe REST API
+
+    Data Pipeline Process:
+
+        Step 1: Install Required Python Packages
+
+        Step 2: Install Required Python Libraries
+
+        Step 3: Setup the pipes and the credentials to connect to the Azure Storage Queue and the Snowflake data warehouse
+
+        Step 4: Generate the CREATE PIPE statement for each pipe
+
+        Step 5: Connect to the Snowflake data warehouse and create the pipes
+
+        Step 6: Collect the files from the Blob Created events within the Azure Storage Queue
+            1. Identify the pipe and the stage path of each file
+            2. Collect the files into micro-batches
+            3. Submit each micro-batch of files to its pipe through the Snowpipe REST API
+            4. Delete the Blob Created events of the micro-batch from the Azure Storage Queue
+
+        Step 7: Load the files through the Snowpipe REST API, if snowpipe_auto_ingest is set to False
+
+        Step 8: Display the files loaded into the TRANSIENT tables
+"""
+
+
+##############################################################################################################
+# Step 1: Install Required Python Packages
+    # Install all of the require Python packages in order to perform the necessary actions within the Python notebook
+        # This section is only used for tools that require you to install all of the necessary packages before each time the code is executed, such as Databricks
+##############################################################################################################
+
+
+# Install the azure-storage-queue Python package
+    # Used to read the Blob Created events from the Azure Storage Queue
+%pip install azure-storage-queue
+
+# Install the snowflake-ingest Python package
+    # Used to submit the files to each pipe through the Snowpipe REST API
+%pip install snowflake-ingest
+
+# Install the snowflake-connector-python[pandas] Python package
+    # Used to connect to Snowflake and utilize Pandas DataFrames
+%pip install snowflake-connector-python[pandas]
+
+# Restart the kernel to use updated packages
+    # Databricks specific command that is required to use any newly install Python packages listed above
+%restart_python
+
+
+##############################################################################################################
+# Step 2: Install Required Python Libraries
+    # Install all of the require Python libraries in order to perform the necessary actions within the Python notebook
+##############################################################################################################
+
+
+# Used to read the Blob Created events within the Azure Storage Queue, which are JSON documents
+import json
+
+# Used to measure how long the current micro-batch has been collecting files, and to wait between requests to an empty Azure Storage Queue
+import time
+
+# Used to decode the file names within the Blob Created events, which are URL encoded
+from urllib.parse import unquote
+
+# Enables the ability to read and delete the messages within the Azure Storage Queue
+    # TextBase64DecodePolicy decodes the messages, as Event Grid base64 encodes each event that it sends to an Azure Storage Queue
+from azure.storage.queue import QueueClient, TextBase64DecodePolicy
+
+# Enables the ability to submit files to a pipe through the Snowpipe REST API
+from snowflake.ingest import SimpleIngestManager, StagedFile
+
+# Enables the ability to connect to the Snowflake Data Warehouse
+    # This Python library is already pre-installed within every Snowflake notebook, therefore does not need to be manually imported within this Snowflake notebook
+        # The import statement is listed for dev purposes when building and testing in Visual Studio Code and commented out when executed in Snowflake notebook
+import snowflake.connector
+
+
+##############################################################################################################
+# Step 3: Setup the pipes and the credentials to connect to the Azure Storage Queue and the Snowflake data warehouse
+##############################################################################################################
+
+
+# The Snowflake account identifier, used by both the Snowflake connector and the Snowpipe REST API
+    # The account consists of 3 parts separated by a decimal (".")
+        # Part 1: Snowflake account identifier
+        # Part 2: Snowflake cloud region
+        # Part 3: Snowflake cloud provider
+snowflake_account = "<Snowflake_Account_Identifier>.<Snowflake_Cloud_Region>.<Snowflake_Cloud_Provider>"
+
+# The username should be tied to a service account, rather than and specific individual
+snowflake_user = "<Snowflake_User_Name>"
+
+# The password should be tied to a service account, rather than and specific individual
+snowflake_password = "<Snowflake_User_Password>"
+
+# The private key file (PEM) of the Snowflake user, which the Snowpipe REST API uses instead of the password
+    # The matching public key must be set on the Snowflake user, such as: ALTER USER <Snowflake_User_Name> SET RSA_PUBLIC_KEY = '<Public_Key>';
+        # Only used when snowpipe_auto_ingest is set to False
+snowflake_private_key_path = "<Path_To_Snowflake_Private_Key_File>.p8"
+
+# The Snowflake warehouse used to create the pipes and query the load history
+    # Snowpipe loads the files with its own compute, so this warehouse is not used to load the files
+snowflake_warehouse = "<Snowflake_Warehouse_Name>"
+
+# The Snowflake database and schema that the STG_AZURE_BLOB stages and the pipes are created within
+snowpipe_database = "DB_KKF_MAIN"
+
+snowpipe_schema = "PUBLIC"
+
+# The Snowflake schema that the pipes load the files into
+snowpipe_table_schema = "TRANSIENT"
+
+# Snowflake reads the Blob Created events from the Azure Storage Queue itself, through the NI_AZURE_BLOB_EVENT_GRID notification integration
+    # See the Snowpipe section within the "Snowflake SQL Queries Template" for setting up the notification integration
+        # Set to False to read the Azure Storage Queue within this notebook and submit the files through the Snowpipe REST API, as a pipe with AUTO_INGEST = TRUE cannot be sent files through the Snowpipe REST API
+snowpipe_auto_ingest = True
+
+# The notification integration that Snowflake uses to read the Azure Storage Queue, if snowpipe_auto_ingest is set to True
+snowpipe_integration = "NI_AZURE_BLOB_EVENT_GRID"
+
+# The pipes that load the files within each STG_AZURE_BLOB stage into a TRANSIENT table
+    # stage: the STG_AZURE_BLOB stage that the files are loaded from, which sets the file format of the files
+    # container_url: the URL of the Azure Blob Storage container that the stage points to, used to find the pipe of each file within the Blob Created events
+    # folder: the folder within the Azure Blob Storage container that the files are created within
+        # Pipes over the same Azure Blob Storage container must use different folders, as each file is submitted to the first pipe whose folder it is within
+            # This is verified in Step 4, before the pipes are created
+    # file_format: the file format that the pipe reads the files with, rather than the file format of the stage
+        # The files created within Azure Blob Storage include a header row, which the SKIP_HEADER file formats skip, see the "Snowflake SQL Queries Template"
+            # Set to None to use the file format of the stage
+    # table: the TRANSIENT table that the files are loaded into
+    # copy_options: the options added to the COPY INTO statement of the pipe
+snowpipe_pipes = {
+    "PIPE_<Table_Name>_CSV_COMMA": {
+        "stage": "STG_AZURE_BLOB_CSV_COMMA"
+        ,"container_url": "https://krispykrunchychicken.blob.core.windows.net/krispykrunchychicken/"
+        ,"folder": "<CSV_Comma_Folder_Name>/"
+        ,"file_format": "FF_CSV_COMMA_SKIP_HEADER"
+        ,"table": "<Table_Name>"
+        # Skips a file that contains an error, rather than loading part of the file
+        ,"copy_options": "ON_ERROR = 'SKIP_FILE'"
+    }
+    ,"PIPE_<Table_Name>_CSV_PIPE": {
+        "stage": "STG_AZURE_BLOB_CSV_PIPE"
+        ,"container_url": "https://krispykrunchychicken.blob.core.windows.net/krispykrunchychicken/"
+        ,"folder": "<CSV_Pipe_Folder_Name>/"
+        ,"file_format": "FF_CSV_PIPE_SKIP_HEADER"
+        ,"table": "<Table_Name>"
+        ,"copy_options": "ON_ERROR = 'SKIP_FILE'"
+    }
+    ,"PIPE_<Table_Name>_TOAST_JSON": {
+        "stage": "STG_AZURE_BLOB_TOAST_JSON"
+        ,"container_url": "https://krispykrunchychicken.blob.core.windows.net/toast-json-files/"
+        ,"folder": "<Folder_Name>/"
+        ,"file_format": None
+        ,"table": "<Table_Name>"
+        # Loads each top level JSON key into the column with the same name
+        ,"copy_options": "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE ON_ERROR = 'SKIP_FILE'"
+    }
+}
+
+# Load the files that were created within the last 7 days, before the pipes were created
+    # Only used when snowpipe_auto_ingest is set to True
+        # Files that have already been loaded by the pipe are skipped
+snowpipe_refresh = False
+
+# Connection String for the Azure Storage account of the Azure Storage Queue, which is created from the Account Name and Account Key
+queue_connection_string = "DefaultEndpointsProtocol=https;AccountName=<Account_Name>;AccountKey=<Account_Key>;EndpointSuffix=core.windows.net"
+
+# The Azure Storage Queue that the Event Grid subscription sends the Blob Created events into
+queue_name = "<Queue_Name>"
+
+# The number of seconds that a received event is hidden from other receive requests
+    # If the event has not been deleted by then, because submitting its file failed, the event becomes visible again and is retried
+queue_visibility_timeout = 300
+
+# The number of seconds to wait before requesting an empty Azure Storage Queue again
+    # Azure Storage Queue returns straight away when it is empty, rather than waiting for an event to arrive
+queue_poll_seconds = 10
+
+# The number of requests in a row that can return no events before the data pipeline stops
+    # Allows the data pipeline to be executed as a scheduled job that stops once the Azure Storage Queue is empty
+        # Set to None to keep waiting for events until the data pipeline is stopped manually
+queue_max_empty_receives = 3
+
+# The most files that are collected into a single micro-batch
+    # The Snowpipe REST API accepts at most 5000 files per request
+snowpipe_batch_max_files = 5000
+
+# The most seconds that a micro-batch collects files for, before the micro-batch is submitted
+    # This is the longest that a file waits within the Azure Storage Queue before it is submitted to its pipe, while files continue to arrive
+snowpipe_batch_max_wait_seconds = 60
+
+
+##############################################################################################################
+# Step 4: Generate the CREATE PIPE statement for each pipe
+    # CREATE PIPE IF NOT EXISTS is used rather than CREATE OR REPLACE PIPE
+        # Replacing a pipe clears its load history, which would load the files within the last 14 days a second time
+##############################################################################################################
+
+
+# Verify that no 2 pipes over the same Azure Blob Storage container use the same folder, or a folder within the folder of the other pipe
+    # Otherwise the files of the second pipe would be loaded by the first pipe, as each file is submitted to the first pipe whose folder it is within
+for snowpipe_name, snowpipe in snowpipe_pipes.items():
+
+    for snowpipe_other_name, snowpipe_other in snowpipe_pipes.items():
+
+        if (
+            snowpipe_name != snowpipe_other_name
+            and snowpipe["container_url"] == snowpipe_other["container_url"]
+            and snowpipe["folder"].startswith(snowpipe_other["folder"])
+        ):
+
+            raise ValueError(f"The {snowpipe_name} and {snowpipe_other_name} pipes load the same folder of the same Azure Blob Storage container: {snowpipe['folder']}")
+
+
+# Generate the CREATE PIPE statement for a single pipe within snowpipe_pipes
+def build_snowpipe_ddl(snowpipe_name, snowpipe):
+
+    # A pipe with AUTO_INGEST = TRUE uses the notification integration to read the Azure Storage Queue
+    if snowpipe_auto_ingest:
+
+        snowpipe_ingest_options = f"AUTO_INGEST = TRUE INTEGRATION = '{snowpipe_integration}'"
+
+    else:
+
+        snowpipe_ingest_options = "AUTO_INGEST = FALSE"
+
+    # The pipe reads the files with its own file format, if file_format IS set, rather than the file format of the stage
+    if snowpipe["file_format"]:
+
+        snowpipe_file_format = f"FILE_FORMAT = (FORMAT_NAME = '{snowpipe_database}.{snowpipe_schema}.{snowpipe['file_format']}')"
+
+    else:
+
+        snowpipe_file_format = ""
+
+    return f"""
+        CREATE PIPE IF NOT EXISTS {snowpipe_database}.{snowpipe_schema}.{snowpipe_name}
+            {snowpipe_ingest_options}
+        AS
+            COPY INTO {snowpipe_database}.{snowpipe_table_schema}.{snowpipe["table"]}
+                FROM @{snowpipe_database}.{snowpipe_schema}.{snowpipe["stage"]}/{snowpipe["folder"]}
+                {snowpipe_file_format}
+                {snowpipe["copy_options"]}
+    """
+
+
+# The CREATE PIPE statement for each pipe
+snowpipe_ddl = {snowpipe_name: build_snowpipe_ddl(snowpipe_name, snowpipe) for snowpipe_name, snowpipe in snowpipe_pipes.items()}
+
+# Display the CREATE PIPE statements
+    # Remove once the CREATE PIPE statements have been verified
+for snowpipe_name, snowpipe_statement in snowpipe_ddl.items():
+
+    print(snowpipe_statement)
+
+
+##############################################################################################################
+# Step 5: Connect to the Snowflake data warehouse and create the pipes
+##############################################################################################################
+
+
+# Connect to the Snowflake Data Warehouse using the credentials specified above
+    # The connection to the Snowflake data warehouse closes automatically after the with block is exited
+        # Therefore, no need for the dw_conn.close() command
+with snowflake.connector.connect(
+    user = snowflake_user
+    ,password = snowflake_password
+    ,account = snowflake_account
+    ,warehouse = snowflake_warehouse
+    ,database = snowpipe_database
+) as dw_conn:
+
+    # Setup a cursor in order to execute SQL queries within the Snowflake data warehouse
+        # The cursor closes automatically after the with block is exited
+    with dw_conn.cursor() as cur:
+
+        for snowpipe_name, snowpipe_statement in snowpipe_ddl.items():
+
+            cur.execute(snowpipe_statement)
+
+            # Load the files that were created before the pipe was created, if snowpipe_refresh IS set to True
+            if snowpipe_auto_ingest and snowpipe_refresh:
+
+                cur.execute(f"ALTER PIPE {snowpipe_database}.{snowpipe_schema}.{snowpipe_name} REFRESH")
+
+            # Display whether the pipe is running and how many files are waiting to be loaded
+            cur.execute(f"SELECT SYSTEM$PIPE_STATUS('{snowpipe_database}.{snowpipe_schema}.{snowpipe_name}')")
+
+            print(f"{snowpipe_name}: {cur.fetchone()[0]}")
+
+
+##############################################################################################################
+# Step 6: Collect the files from the Blob Created events within the Azure Storage Queue
+    # Only used when snowpipe_auto_ingest is set to False
+##############################################################################################################
+
+
+# Identify the pipe and the stage path of the file within a single Blob Created event
+    # The stage path is the path of the file relative to the FROM location of the pipe (the stage and folder), such as <File_Name>.csv, as the Snowpipe REST API expects
+        # Returns None for events that are not Blob Created events, or for files that are not within the folder of any pipe
+def find_snowpipe_file(blob_event):
+
+    if blob_event.get("eventType") != "Microsoft.Storage.BlobCreated":
+
+        return None
+
+    # The file names within the Blob Created events are URL encoded, such as a space being encoded as %20
+    blob_url = unquote(blob_event["data"]["url"])
+
+    for snowpipe_name, snowpipe in snowpipe_pipes.items():
+
+        if blob_url.startswith(snowpipe["container_url"] + snowpipe["folder"]):
+
+            return snowpipe_name, blob_url[len(snowpipe["container_url"] + snowpipe["folder"]):], blob_event["data"].get("contentLength", 0)
+
+    return None
+
+
+# Collect the files from the Blob Created events returned by a single receive request
+    # Returns each message, which is used to delete the event once its file has been submitted, along with the pipe, stage path and size of its file
+        # Azure Storage Queue returns at most 32 messages per receive request, or at most queue_max_messages messages if fewer are requested
+            # A message that is not an Event Grid event, such as a message that is not JSON, is displayed and returned without a file
+                # This way the message is deleted along with the rest of the micro-batch, rather than stopping the data pipeline every time it is received
+def receive_blob_events(queue_client, queue_max_messages):
+
+    blob_events = []
+
+    for queue_message in queue_client.receive_messages(messages_per_page = queue_max_messages, max_messages = queue_max_messages, visibility_timeout = queue_visibility_timeout):
+
+        try:
+
+            blob_file = find_snowpipe_file(json.loads(queue_message.content))
+
+        except (ValueError, KeyError, TypeError, AttributeError) as blob_event_error:
+
+            print(f"The {queue_message.id} message is not an Event Grid event and will be deleted: {blob_event_error}: {queue_message.content[:200]}")
+
+            blob_file = None
+
+        blob_events.append({"message": queue_message, "file": blob_file})
+
+    return blob_events
+
+
+# Collect the files from the Azure Storage Queue into micro-batches, and submit each micro-batch to its pipe through the Snowpipe REST API
+    # The micro-batch is submitted once it reaches snowpipe_batch_max_files files, once it has been collecting files for snowpipe_batch_max_wait_seconds seconds,
+    # or once the Azure Storage Queue is empty
+        # The events are only deleted from the Azure Storage Queue once their files have been submitted, so a failed submission is retried
+            # Snowpipe keeps the load history of each pipe for 14 days, so a file that is submitted more than once is only loaded once
+def load_blob_events(queue_client, snowpipe_ingest_managers):
+
+    # The number of receive requests in a row that have returned no events
+    queue_empty_receives = 0
+
+    # Keep collecting and submitting micro-batches until the Azure Storage Queue has been empty for queue_max_empty_receives receive requests in a row
+    while queue_max_empty_receives is None or queue_empty_receives < queue_max_empty_receives:
+
+        # The message of each event within the micro-batch
+        queue_messages = []
+
+        # The stage path and size of each file within the micro-batch, for each pipe
+            # A dictionary is used so that a file with more than 1 event, as Event Grid can deliver an event more than once, is only submitted once
+        snowpipe_batch_files = {snowpipe_name: {} for snowpipe_name in snowpipe_pipes}
+
+        snowpipe_batch_start = time.monotonic()
+
+        while len(queue_messages) < snowpipe_batch_max_files and time.monotonic() - snowpipe_batch_start < snowpipe_batch_max_wait_seconds:
+
+            # Only request the number of messages that are still needed to fill the micro-batch
+                # Each message holds at most 1 file, so no pipe is ever submitted more than snowpipe_batch_max_files files at once
+            blob_events = receive_blob_events(queue_client, min(32, snowpipe_batch_max_files - len(queue_messages)))
+
+            # Stop collecting the micro-batch once the Azure Storage Queue is empty
+            if not blob_events:
+
+                queue_empty_receives += 1
+
+                break
+
+            queue_empty_receives = 0
+
+            for blob_event in blob_events:
+
+                queue_messages.append(blob_event["message"])
+
+                if blob_event["file"] is not None:
+
+                    snowpipe_name, snowpipe_path, snowpipe_size = blob_event["file"]
+
+                    snowpipe_batch_files[snowpipe_name][snowpipe_path] = snowpipe_size
+
+        # Wait before requesting the Azure Storage Queue again, if no events were received
+        if not queue_messages:
+
+            if queue_max_empty_receives is None or queue_empty_receives < queue_max_empty_receives:
+
+                time.sleep(queue_poll_seconds)
+
+            continue
+
+        # Submit the files within the micro-batch to each pipe
+            # An error is raised if a submission fails, which leaves the events within the Azure Storage Queue to be retried
+        for snowpipe_name, snowpipe_files in snowpipe_batch_files.items():
+
+            if snowpipe_files:
+
+                snowpipe_response = snowpipe_ingest_managers[snowpipe_name].ingest_files([StagedFile(snowpipe_path, snowpipe_size) for snowpipe_path, snowpipe_size in snowpipe_files.items()])
+
+                if snowpipe_response["responseCode"] != "SUCCESS":
+
+                    raise RuntimeError(f"The files failed to be submitted to the {snowpipe_name} pipe: {snowpipe_response}")
+
+                print(f"Submitted {len(snowpipe_files)} file(s) to the {snowpipe_name} pipe")
+
+        # Delete the events of the micro-batch from the Azure Storage Queue, once their files have been submitted
+            # Events without any file that you would like to load, such as events for other folders or messages that are not Event Grid events, are deleted as well
+        for queue_message in queue_messages:
+
+            queue_client.delete_message(queue_message)
+
+
+##############################################################################################################
+# Step 7: Load the files through the Snowpipe REST API, if snowpipe_auto_ingest is set to False
+##############################################################################################################
+
+
+if not snowpipe_auto_ingest:
+
+    # Connect to the Azure Storage Queue
+        # The connection to the Azure Storage Queue closes automatically after the with block is exited
+    with QueueClient.from_connection_string(queue_connection_string, queue_name, message_decode_policy = TextBase64DecodePolicy()) as queue_client:
+
+        # The private key of the Snowflake user, used to sign each request to the Snowpipe REST API
+        with open(snowflake_private_key_path) as snowflake_private_key_file:
+
+            snowflake_private_key = snowflake_private_key_file.read()
+
+        # Establish a SimpleIngestManager for each pipe, in order to submit files to the pipe through the Snowpipe REST API
+        snowpipe_ingest_managers = {
+            snowpipe_name: SimpleIngestManager(
+                account = snowflake_account.split(".")[0]
+                ,host = f"{snowflake_account}.snowflakecomputing.com"
+                ,user = snowflake_user
+                ,pipe = f"{snowpipe_database}.{snowpipe_schema}.{snowpipe_name}"
+                ,private_key = snowflake_private_key
+            )
+            for snowpipe_name in snowpipe_pipes
+        }
+
+        load_blob_events(queue_client, snowpipe_ingest_managers)
+
+
+##############################################################################################################
+# Step 8: Display the files loaded into the TRANSIENT tables
+    # Snowpipe loads the files a short time after they are submitted, so files submitted within the last minute may not be listed yet
+##############################################################################################################
+
+
+with snowflake.connector.connect(
+    user = snowflake_user
+    ,password = snowflake_password
+    ,account = snowflake_account
+    ,warehouse = snowflake_warehouse
+    ,database = snowpipe_database
+) as dw_conn:
+
+    with dw_conn.cursor() as cur:
+
+        for snowpipe_name, snowpipe in snowpipe_pipes.items():
+
+            # The files loaded into the TRANSIENT table within the last hour, along with the first error of any file that failed to be loaded
+            cur.execute(f"""
+                SELECT
+                    FILE_NAME
+                    ,LAST_LOAD_TIME
+                    ,ROW_COUNT
+                    ,STATUS
+                    ,FIRST_ERROR_MESSAGE
+
+                FROM TABLE(
+                    INFORMATION_SCHEMA.COPY_HISTORY(
+                        TABLE_NAME => '{snowpipe_database}.{snowpipe_table_schema}.{snowpipe["table"]}'
+                        ,START_TIME => DATEADD(HOURS, -1, CURRENT_TIMESTAMP())
+                    )
+                )
+
+                WHERE PIPE_NAME = '{snowpipe_name}'
+
+                ORDER BY LAST_LOAD_TIME DESC
+            """)
+
+            print(snowpipe_name)
+
+            print(cur.fetch_pandas_all())
+
+
+"""
+# Simulate the Blob Created events locally, to verify Step 6 without Azure Storage Queue or Snowflake
+    # The Azure Storage Queue and the Snowpipe REST API are replaced with local stand-ins that record what was received, submitted and deleted
+        # Run in place of Steps 5, 7 and 8, after executing Steps 1 through 4 and the functions within Step 6
+            # Comment out once Step 6 has been verified
+import uuid
+
+queue_max_empty_receives = 1
+
+snowpipe_batch_max_wait_seconds = 5
+
+
+# A single message within the local Azure Storage Queue
+class LocalQueueMessage:
+
+    def __init__(self, content):
+
+        self.id = str(uuid.uuid4())
+
+        self.content = content
+
+
+# A local Azure Storage Queue, which returns at most max_messages messages per receive request and records the deleted messages
+class LocalQueueClient:
+
+    def __init__(self, blob_events):
+
+        self.queue_messages = [LocalQueueMessage(json.dumps(blob_event)) for blob_event in blob_events]
+
+        self.deleted_messages = []
+
+    def receive_messages(self, messages_per_page = None, max_messages = None, visibility_timeout = None):
+
+        queue_received, self.queue_messages = self.queue_messages[:max_messages], self.queue_messages[max_messages:]
+
+        return queue_received
+
+    def delete_message(self, queue_message):
+
+        self.deleted_messages.append(queue_message.id)
+
+
+# A local Snowpipe REST API for a single pipe, which records the submitted files
+    # Rejects a request with more than 5000 files, the same as the Snowpipe REST API
+class LocalIngestManager:
+
+    def __init__(self):
+
+        self.submitted_files = []
+
+    def ingest_files(self, staged_files):
+
+        if len(staged_files) > 5000:
+
+            return {"responseCode": "ERROR", "message": f"{len(staged_files)} files is more than 5000 files"}
+
+        self.submitted_files.extend(staged_file.path for staged_file in staged_files)
+
+        return {"responseCode": "SUCCESS"}
+
+
+# Build a Blob Created event, in the format that Event Grid sends into an Azure Storage Queue
+def build_blob_event(blob_url, blob_event_type = "Microsoft.Storage.BlobCreated"):
+
+    return {"eventType": blob_event_type, "data": {"url": blob_url, "contentLength": 100}}
+
+
+snowpipe_csv_comma_url = snowpipe_pipes["PIPE_<Table_Name>_CSV_COMMA"]["container_url"] + snowpipe_pipes["PIPE_<Table_Name>_CSV_COMMA"]["folder"]
+
+snowpipe_toast_json_url = snowpipe_pipes["PIPE_<Table_Name>_TOAST_JSON"]["container_url"] + snowpipe_pipes["PIPE_<Table_Name>_TOAST_JSON"]["folder"]
+
+# 100 CSV files, 1 of which is sent twice, 20 JSON files, 1 file in another folder, and 1 Blob Deleted event
+queue_client = LocalQueueClient(
+    [build_blob_event(f"{snowpipe_csv_comma_url}file%20{i}.csv") for i in range(100)]
+    + [build_blob_event(f"{snowpipe_csv_comma_url}file%200.csv")]
+    + [build_blob_event(f"{snowpipe_toast_json_url}order_{i}.json") for i in range(20)]
+    + [build_blob_event(snowpipe_pipes["PIPE_<Table_Name>_CSV_COMMA"]["container_url"] + "Other_Folder/file.csv")]
+    + [build_blob_event(f"{snowpipe_csv_comma_url}file%201.csv", "Microsoft.Storage.BlobDeleted")]
+)
+
+# 1 message that is not JSON, and 1 JSON message that is not an Event Grid event
+queue_client.queue_messages += [LocalQueueMessage("not a JSON message"), LocalQueueMessage("[]")]
+
+snowpipe_ingest_managers = {snowpipe_name: LocalIngestManager() for snowpipe_name in snowpipe_pipes}
+
+load_blob_events(queue_client, snowpipe_ingest_managers)
+
+# Should display 100 CSV files, 0 pipe delimited files, 20 JSON files, and 125 deleted events
+for snowpipe_name, snowpipe_ingest_manager in snowpipe_ingest_managers.items():
+
+    print(snowpipe_name, len(snowpipe_ingest_manager.submitted_files), snowpipe_ingest_manager.submitted_files[:2])
+
+print(len(queue_client.deleted_messages), len(queue_client.queue_messages))
+"""
\ No newline at end of file
@@ -1029,6 +1029,39 @@
 	;
 
 
+	-- Comma Delimited CSV/TXT files w/ a header row and Double Quote (") wrapped field values, loaded from AWS S3
+	-- Proper naming convention is to prepend "FF_" followed by the file format name
+	​
+	-- Assume the DB_KKF_MAIN database and create the FF_CSV_COMMA_SKIP_HEADER file format
+	-- that will be utilized to load COMMA Delimited CSV files from AWS S3 without downloading them into Python
+	-- COMPRESSION = AUTO automatically detects gzip, bz2 and zstd compressed files
+	USE DATABASE DB_KKF_MAIN;
+	​
+	CREATE OR REPLACE FILE FORMAT FF_CSV_COMMA_SKIP_HEADER
+		TYPE = 'CSV'
+		FIELD_DELIMITER = ','
+		SKIP_HEADER = 1
+		FIELD_OPTIONALLY_ENCLOSED_BY = '"'
+		COMPRESSION = AUTO
+	;
+
+
+	-- Pipe Delimited CSV/TXT files w/ a header row
+	-- Proper naming convention is to prepend "FF_" followed by the file format name
+	​
+	-- Assume the DB_KKF_MAIN database and create the FF_CSV_PIPE_SKIP_HEADER file format
+	-- that will be utilized by Snowpipe to load Vertical Bar "Pipe" files from Azure Blob Storage without loading the header row as data
+	-- COMPRESSION = AUTO automatically detects gzip, bz2 and zstd compressed files
+	USE DATABASE DB_KKF_MAIN;
+	​
+	CREATE OR REPLACE FILE FORMAT FF_CSV_PIPE_SKIP_HEADER
+		TYPE = 'CSV'
+		FIELD_DELIMITER = '|'
+		SKIP_HEADER = 1
+		COMPRESSION = AUTO
+	;
+
+
 /****************************************************************************************************/
 -- GRANT Privileges to a User
 /****************************************************************************************************/
@@ -1415,6 +1448,140 @@
 	;
 
 
+	-- Allows COMMA Delimited CSV files to be loaded from the AWS S3 Bucket straight into the DB_KKF_MAIN.TRANSIENT tables, without downloading them into Python
+	-- Assume the DB_KKF_MAIN database and create the STG_AWS_S3_CSV_COMMA stage
+	-- that will be utilized by the COPY_INTO load method within the "Connect to AWS S3" templates
+	-- The URL must point to the root of the AWS S3 Bucket, so that the file names within the stage match the file names within the AWS S3 Bucket
+	USE DATABASE DB_KKF_MAIN;
+	​
+	CREATE OR REPLACE STAGE STG_AWS_S3_CSV_COMMA
+		URL = 's3://<AWS_S3_Bucket>/'
+		CREDENTIALS = (AWS_KEY_ID = '<AWS_S3_Access_ID>' AWS_SECRET_KEY = '<AWS_S3_Access_Key>')
+		FILE_FORMAT = FF_CSV_COMMA_SKIP_HEADER
+	;
+
+
+/****************************************************************************************************/
+-- Snowpipe
+/****************************************************************************************************/
+
+
+	-- Snowpipe loads each file into the DB_KKF_MAIN.TRANSIENT tables within minutes of the file being created in Azure Blob Storage
+	-- The files are loaded straight from the STG_AZURE_BLOB stages, without downloading them into Python
+	-- The "Connect to Snowflake - Template - Snowpipe" notebook generates and creates these pipes, and loads the files when AUTO_INGEST is not used
+
+
+	-- Create the notification integration that Snowpipe uses to read the Event Grid "Blob Created" events from an Azure Storage Queue
+	-- Proper naming convention is to prepend "NI_" followed by the notification integration name
+	-- The Event Grid subscription on the Azure Blob Storage account must send the Microsoft.Storage.BlobCreated events into the Azure Storage Queue below
+	USE ROLE ACCOUNTADMIN;
+	​
+	CREATE OR REPLACE NOTIFICATION INTEGRATION NI_AZURE_BLOB_EVENT_GRID
+		ENABLED = TRUE
+		TYPE = QUEUE
+		NOTIFICATION_PROVIDER = AZURE_STORAGE_QUEUE
+		AZURE_STORAGE_QUEUE_PRIMARY_URI = 'https://krispykrunchychicken.queue.core.windows.net/<Queue_Name>'
+		AZURE_TENANT_ID = '<Azure_Tenant_ID>'
+	;
+
+
+	-- Open the AZURE_CONSENT_URL to allow Snowflake to read the Azure Storage Queue
+	-- Then give the AZURE_MULTI_TENANT_APP_NAME the "Storage Queue Data Contributor" role on the Azure Storage Queue
+	DESC NOTIFICATION INTEGRATION NI_AZURE_BLOB_EVENT_GRID;
+
+
+	-- Allow the SYSADMIN role to create pipes that use the notification integration
+	GRANT USAGE ON INTEGRATION NI_AZURE_BLOB_EVENT_GRID TO ROLE SYSADMIN;
+
+
+	-- Create a pipe that loads the COMMA Delimited CSV files within a folder of the STG_AZURE_BLOB_CSV_COMMA stage into a TRANSIENT table
+	-- Proper naming convention is to prepend "PIPE_" followed by the table name and the stage file format
+	-- AUTO_INGEST = TRUE loads each file as soon as its Event Grid event is received. Set to FALSE to load the files through the Snowpipe REST API instead
+	-- CREATE PIPE IF NOT EXISTS keeps the load history of an existing pipe. CREATE OR REPLACE PIPE clears it, which loads the files within the last 7 days a second time on the next REFRESH
+	-- FILE_FORMAT skips the header row of each file, rather than using the FF_CSV_COMMA file format of the stage
+	-- Pipes over the same Azure Blob Storage container must load different folders, otherwise each file is loaded by both pipes
+	USE ROLE SYSADMIN;
+	​
+	USE DATABASE DB_KKF_MAIN;
+	​
+	CREATE PIPE IF NOT EXISTS PIPE_<Table_Name>_CSV_COMMA
+		AUTO_INGEST = TRUE
+		INTEGRATION = 'NI_AZURE_BLOB_EVENT_GRID'
+	AS
+		COPY INTO DB_KKF_MAIN.TRANSIENT.<Table_Name>
+			FROM @STG_AZURE_BLOB_CSV_COMMA/<CSV_Comma_Folder_Name>/
+			FILE_FORMAT = (FORMAT_NAME = 'FF_CSV_COMMA_SKIP_HEADER')
+			ON_ERROR = 'SKIP_FILE' -- Skips a file that contains an error, rather than loading part of the file
+	;
+
+
+	-- Create a pipe that loads the Vertical Bar "Pipe" Delimited files within a folder of the STG_AZURE_BLOB_CSV_PIPE stage into a TRANSIENT table
+	-- The folder must be different from the folder of the PIPE_<Table_Name>_CSV_COMMA pipe, as both stages point to the same Azure Blob Storage container
+	USE ROLE SYSADMIN;
+	​
+	USE DATABASE DB_KKF_MAIN;
+	​
+	CREATE PIPE IF NOT EXISTS PIPE_<Table_Name>_CSV_PIPE
+		AUTO_INGEST = TRUE
+		INTEGRATION = 'NI_AZURE_BLOB_EVENT_GRID'
+	AS
+		COPY INTO DB_KKF_MAIN.TRANSIENT.<Table_Name>
+			FROM @STG_AZURE_BLOB_CSV_PIPE/<CSV_Pipe_Folder_Name>/
+			FILE_FORMAT = (FORMAT_NAME = 'FF_CSV_PIPE_SKIP_HEADER')
+			ON_ERROR = 'SKIP_FILE'
+	;
+
+
+	-- Create a pipe that loads the JSON files within the STG_AZURE_BLOB_TOAST_JSON stage into a TRANSIENT table
+	-- MATCH_BY_COLUMN_NAME loads each top level JSON key into the column with the same name
+	USE ROLE SYSADMIN;
+	​
+	USE DATABASE DB_KKF_MAIN;
+	​
+	CREATE PIPE IF NOT EXISTS PIPE_<Table_Name>_TOAST_JSON
+		AUTO_INGEST = TRUE
+		INTEGRATION = 'NI_AZURE_BLOB_EVENT_GRID'
+	AS
+		COPY INTO DB_KKF_MAIN.TRANSIENT.<Table_Name>
+			FROM @STG_AZURE_BLOB_TOAST_JSON/<Folder_Name>/
+			MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+			ON_ERROR = 'SKIP_FILE'
+	;
+
+
+	-- Shows a detailed list of ALL PIPES
+	SHOW PIPES;
+
+
+	-- Show whether the pipe is running and how many files are waiting to be loaded
+	SELECT SYSTEM$PIPE_STATUS('DB_KKF_MAIN.PUBLIC.PIPE_<Table_Name>_CSV_COMMA');
+
+
+	-- Load the files that were created within the last 7 days, before the pipe was created
+	-- Files that have already been loaded by the pipe are skipped, as long as the pipe has not been replaced since it loaded them
+	-- To change the COPY INTO statement of a pipe, pause the pipe, wait for the pending files to load, then DROP and CREATE the pipe without running REFRESH again
+	ALTER PIPE PIPE_<Table_Name>_CSV_COMMA REFRESH;
+
+
+	-- Show the files loaded into a TRANSIENT table within the last hour, and any errors
+	SELECT *
+	​
+	FROM TABLE(
+		INFORMATION_SCHEMA.COPY_HISTORY(
+			TABLE_NAME => 'DB_KKF_MAIN.TRANSIENT.<Table_Name>'
+			,START_TIME => DATEADD(HOURS, -1, CURRENT_TIMESTAMP())
+		)
+	)
+	​
+	ORDER BY LAST_LOAD_TIME DESC;
+
+
+	-- Pause and resume a pipe
+	ALTER PIPE PIPE_<Table_Name>_CSV_COMMA SET PIPE_EXECUTION_PAUSED = TRUE;
+	​
+	ALTER PIPE PIPE_<Table_Name>_CSV_COMMA SET PIPE_EXECUTION_PAUSED = FALSE;
+
+
 /****************************************************************************************************/
 -- Snowflake TASK
 /****************************************************************************************************/